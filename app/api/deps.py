@@ -1,12 +1,14 @@
 # app/api/deps.py
 from typing import AsyncGenerator, Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, WebSocket, WebSocketException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db  # get_db yields AsyncSession
-from app.core.security import decode_access_token
+from app.db.session import AsyncSessionLocal, get_db, get_read_db  # both yield AsyncSession
+from app.core.security import decode_access_token, get_subject_from_token
+from app.core.cache import principal_cache
 from app.repositories.user_repo import user_repo
+from app.schemas.user import Principal
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
@@ -20,13 +22,24 @@ async def get_db_dep() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def get_current_user(
+async def get_read_db_dep(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
-    db: AsyncSession = Depends(get_db_dep),
-):
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Read-only session dependency — routed to a replica when one is configured.
+    The caller's token subject is used for the read-your-writes window.
+    Use in GET routes: db = Depends(get_read_db_dep)
+    """
+    sub = get_subject_from_token(credentials.credentials) if credentials else None
+    async for session in get_read_db(sub):
+        yield session
+
+
+async def _resolve_user(credentials: Optional[HTTPAuthorizationCredentials], db: AsyncSession) -> Principal:
     """
-    Resolve the user from Authorization: Bearer <token>.
-    Raises 401 if token missing/invalid or user not found.
+    Resolve the caller from Authorization: Bearer <token> as a Principal (not the
+    ORM row). Raises 401 if token missing/invalid or user not found.
+    Users resolved by id are kept in `principal_cache` so repeat callers skip the DB.
     """
     if credentials is None or not credentials.credentials:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
@@ -42,18 +55,90 @@ async def get_current_user(
     if sub is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token (missing sub)")
 
+    cached = principal_cache.get(str(sub))
+    if cached is not None:
+        return cached
+
     # Prefer numeric user id in sub, fall back to email
     user = None
     try:
         user_id = int(sub)
-        user = await user_repo.get(db, user_id)
+        user = await user_repo.load(db, user_id)
     except (ValueError, TypeError):
         user = None
 
-    if user is None and "email" in payload:
+    if user is not None:
+        principal = Principal.model_validate(user, from_attributes=True)
+        principal_cache.set(str(sub), principal)
+        return principal
+
+    if "email" in payload:
         user = await user_repo.get_by_email(db, payload["email"])
 
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
+    return Principal.model_validate(user, from_attributes=True)
+
+
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db_dep),
+):
+    """
+    Current user for routes that write. Tags the request's primary session with
+    the user id so commits open the read-your-writes window.
+    """
+    user = await _resolve_user(credentials, db)
+    db.info["user_id"] = user.id
     return user
+
+
+async def get_current_user_detached(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+):
+    """
+    Current user for routes that open their own connection (POST /batch).
+    The lookup session is closed before the route runs, so the request never
+    holds two pooled connections.
+    """
+    async with AsyncSessionLocal() as db:
+        return await _resolve_user(credentials, db)
+
+
+async def get_current_user_read(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_read_db_dep),
+):
+    """Current user for read-only routes; resolves through the read session."""
+    return await _resolve_user(credentials, db)
+
+
+
+def _websocket_token(websocket: WebSocket, token: Optional[str]) -> Optional[str]:
+    """?token= (browsers cannot set headers on a WebSocket), else Authorization: Bearer."""
+    if token:
+        return token
+    scheme, _, value = websocket.headers.get("authorization", "").partition(" ")
+    return value if scheme.lower() == "bearer" and value else None
+
+
+async def get_websocket_read_db(websocket: WebSocket, token: Optional[str] = Query(None)) -> AsyncGenerator[AsyncSession, None]:
+    """Read session for WebSocket routes; close it before serving a long-lived socket."""
+    token = _websocket_token(websocket, token)
+    async for session in get_read_db(get_subject_from_token(token) if token else None):
+        yield session
+
+
+async def get_websocket_user(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_websocket_read_db),
+):
+    """Current user for WebSocket routes; closes the handshake with 1008 when unauthenticated."""
+    token = _websocket_token(websocket, token)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token) if token else None
+    try:
+        return await _resolve_user(credentials, db)
+    except HTTPException as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
@@ -0,0 +1,66 @@
+# app/api/etag.py
+"""
+Strong ETags for single-resource reads, built from a cheap version token
+(Task.version, Project.updated_at) so If-None-Match can be answered with a
+304 after a version-only lookup.
+
+Tags look like "task-42-v7" (or "task-42-v7-1a2b3c4d" for a fields= subset,
+since a sparse representation is a different set of bytes).
+"""
+import re
+import zlib
+from datetime import datetime
+from typing import Optional, Sequence, Union
+
+from fastapi import HTTPException, Response, status
+
+_TAG_RE = re.compile(r'^"(?P<kind>[a-z]+)-(?P<id>\d+)-v(?P<version>\d+)(?:-[0-9a-f]{8})?"$')
+
+
+def version_token(value: Union[int, datetime, None]) -> int:
+    """Integer version for an ETag: the version itself, or a timestamp in microseconds."""
+    if value is None:
+        return 0
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1_000_000)
+    return int(value)
+
+
+def make_etag(kind: str, id: int, version: Union[int, datetime, None], fields: Optional[Sequence[str]] = None) -> str:
+    tag = f"{kind}-{id}-v{version_token(version)}"
+    if fields is not None:
+        tag += "-%08x" % zlib.crc32(",".join(sorted(fields)).encode())
+    return f'"{tag}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, per RFC 9110): '*' or any listed tag."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def parse_if_match(header: Optional[str], kind: str, id: int) -> Optional[int]:
+    """
+    Version carried by an If-Match header, or None when there is none.
+    Raises 412 for tags that do not belong to this resource (strong comparison:
+    weak tags never match).
+    """
+    if not header or header.strip() == "*":
+        return None
+    m = _TAG_RE.match(header.strip())
+    if not m or m.group("kind") != kind or int(m.group("id")) != id:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="ETag does not match")
+    return int(m.group("version"))
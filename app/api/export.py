@@ -0,0 +1,43 @@
+# app/api/export.py
+"""
+Encoders that turn async batches of Core rows into NDJSON or CSV byte chunks
+for a StreamingResponse. One chunk is written per batch, so memory stays
+bounded by the batch size and the client starts receiving rows right away.
+"""
+import csv
+import io
+from datetime import date
+from typing import Any, AsyncIterator, Dict, Sequence, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.schemas.projection import construct_from_rows
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+async def ndjson_stream(batches: AsyncIterator[Sequence[Any]], schema: Type[BaseModel]) -> AsyncIterator[bytes]:
+    """One JSON object per line, serialized exactly like the `schema` read DTO."""
+    adapter = TypeAdapter(schema)
+    async for batch in batches:
+        yield b"".join(adapter.dump_json(item) + b"\n" for item in construct_from_rows(schema, batch))
+
+
+def _csv_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+async def csv_stream(batches: AsyncIterator[Sequence[Any]], columns: Sequence[str]) -> AsyncIterator[bytes]:
+    """Header row, then one CSV line per row (None as an empty cell, datetimes as ISO 8601)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    yield buf.getvalue().encode()
+    async for batch in batches:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows([_csv_value(row._mapping[c]) for c in columns] for row in batch)
+        yield buf.getvalue().encode()
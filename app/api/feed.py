@@ -0,0 +1,64 @@
+# app/api/feed.py
+"""
+Transports for the project change feed (app/services/change_feed.py): a
+Server-Sent Events body for a StreamingResponse, and a WebSocket send loop.
+Both unsubscribe when the client goes away. Idle connections get a heartbeat
+every FEED_HEARTBEAT_SECONDS: an SSE comment line, or nothing on WebSockets
+(the server's protocol-level pings keep those alive).
+"""
+import asyncio
+from typing import AsyncIterator, Optional
+
+from fastapi import WebSocket
+
+from app.core.config import settings
+from app.services.change_feed import FeedEvent, change_feed
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def _sse(event: FeedEvent) -> str:
+    # the id line lets EventSource resume via Last-Event-ID; notices have none
+    head = f"id: {event.id}\n" if event.id else ""
+    return f"{head}event: {event.type}\ndata: {event.data}\n\n"
+
+
+async def sse_stream(project_id: int, cursor: Optional[str] = None) -> AsyncIterator[bytes]:
+    # subscribed once the response starts, so an unsent response leaks nothing
+    sub = change_feed.subscribe(project_id, cursor)
+    try:
+        yield b": connected\n\n"
+        while True:
+            events = await sub.get(settings.FEED_HEARTBEAT_SECONDS)
+            if events is None:
+                return
+            if not events:
+                yield b": ping\n\n"
+                continue
+            yield "".join(_sse(e) for e in events).encode()
+    finally:
+        change_feed.unsubscribe(sub)
+
+
+async def websocket_feed(websocket: WebSocket, project_id: int, cursor: Optional[str] = None) -> None:
+    """Send each event as a JSON text message until the client disconnects."""
+    sub = change_feed.subscribe(project_id, cursor)
+
+    async def watch_disconnect() -> None:
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass  # clients have nothing to say
+        finally:
+            sub.close()
+
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        while True:
+            events = await sub.get(settings.FEED_HEARTBEAT_SECONDS)
+            if events is None:
+                return
+            for event in events:
+                await websocket.send_text(event.data)
+    finally:
+        watcher.cancel()
+        change_feed.unsubscribe(sub)
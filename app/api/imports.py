@@ -0,0 +1,85 @@
+# app/api/imports.py
+"""
+Incremental parsers for streamed NDJSON / CSV uploads. They read the request
+body chunk by chunk and yield `(row_number, record)` pairs, so an import never
+holds more than one chunk (plus one partial line) of raw input in memory.
+"""
+import csv
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
+
+CSV_PARSE_BATCH = 1000  # complete records handed to csv.reader at a time
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    tail = b""
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line
+    if tail:
+        yield tail
+
+
+async def ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    """Yield each non-blank line as raw JSON bytes (validated later with model_validate_json)."""
+    row = 0
+    async for line in _lines(chunks):
+        if line.strip():
+            row += 1
+            yield row, line
+
+
+def _csv_dicts(header: Sequence[str], lines: List[str], list_fields: Sequence[str]) -> List[Dict[str, Any]]:
+    out = []
+    for values in csv.reader(lines):
+        record: Dict[str, Any] = {k: v for k, v in zip(header, values) if v != ""}
+        for name in list_fields:
+            if name in record:
+                record[name] = [v for v in record[name].split(";") if v]
+        out.append(record)
+    return out
+
+
+async def csv_records(
+    chunks: AsyncIterator[bytes], list_fields: Sequence[str] = (),
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Yield one dict per CSV record, keyed by the header row. Empty cells are
+    omitted (so model defaults apply) and `list_fields` are split on ';'.
+    Quoted values may span lines.
+    """
+    header = None
+    row = 0
+    pending: List[str] = []  # physical lines of a record whose quotes are still open
+    quotes = 0
+    batch: List[str] = []
+
+    async for raw in _lines(chunks):
+        line = raw.decode("utf-8", errors="replace")
+        if header is None:
+            line = line.lstrip("\ufeff")
+        pending.append(line.rstrip("\r"))
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        record, pending, quotes = "\n".join(pending), [], 0
+        if header is None:
+            header = next(csv.reader([record]), [])
+            continue
+        if record.strip():
+            batch.append(record)
+        if len(batch) >= CSV_PARSE_BATCH:
+            for item in _csv_dicts(header, batch, list_fields):
+                row += 1
+                yield row, item
+            batch = []
+
+    if pending:
+        batch.append("\n".join(pending))
+    if header is not None and batch:
+        for item in _csv_dicts(header, batch, list_fields):
+            row += 1
+            yield row, item
@@ -0,0 +1,54 @@
+# app/api/serialization.py
+"""
+Prebuilt pydantic TypeAdapters that turn read DTOs (or ORM rows) straight into
+JSON bytes.
+
+Routes keep `response_model=` for the OpenAPI schema but return
+`<serializer>.response(data)`. FastAPI then skips its own response validation,
+its dict round trip and json.dumps; we validate at most once (DTO instances
+pass through untouched) and let pydantic-core write the bytes. The output is
+byte-for-byte what FastAPI's default JSONResponse produces for the same model.
+"""
+from typing import Any, Generic, List, Mapping, Optional, Sequence, Type, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.schemas.project import ProjectRead
+from app.schemas.task import TaskRead
+from app.schemas.user import UserRead
+from app.schemas.activity import TaskActivityRead
+
+T = TypeVar("T")
+
+
+class JSONSerializer(Generic[T]):
+    def __init__(self, tp: Type[T], many: bool = False):
+        self.adapter: TypeAdapter[T] = TypeAdapter(List[tp] if many else tp)
+        self.many = many
+
+    def dump(self, data: Any, fields: Optional[Sequence[str]] = None) -> bytes:
+        """JSON bytes for `data`; `fields` limits the output to a sparse fieldset."""
+        # DTO instances are not revalidated; ORM objects are read via from_attributes
+        value = self.adapter.validate_python(data, from_attributes=True)
+        include = None
+        if fields is not None:
+            include = {"__all__": set(fields)} if self.many else set(fields)
+        return self.adapter.dump_json(value, include=include)
+
+    def response(self, data: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None,
+                 fields: Optional[Sequence[str]] = None) -> Response:
+        return Response(
+            content=self.dump(data, fields=fields),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json",
+        )
+
+
+task_json = JSONSerializer(TaskRead)
+task_list_json = JSONSerializer(TaskRead, many=True)
+project_json = JSONSerializer(ProjectRead)
+project_list_json = JSONSerializer(ProjectRead, many=True)
+user_json = JSONSerializer(UserRead)
+activity_list_json = JSONSerializer(TaskActivityRead, many=True)
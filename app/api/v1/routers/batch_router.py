@@ -0,0 +1,17 @@
+# app/api/v1/routers/batch_router.py
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_user_detached
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.services.batch_service import batch_service
+
+router = APIRouter()
+
+
+@router.post("/", response_model=BatchResponse)
+async def run_batch(payload: BatchRequest, current_user=Depends(get_current_user_detached)):
+    """
+    Run several task/project operations under one authentication and one
+    transaction. Per-item results carry the status the single call would return.
+    """
+    return await batch_service.run(user=current_user, operations=payload.operations, mode=payload.mode)
@@ -1,10 +1,24 @@
 # app/api/v1/routers/projects_router.py
-from typing import List
-from fastapi import APIRouter, Depends, Path, Body, Query, status
+from datetime import datetime
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, Path, Body, Query, Header, HTTPException, Request, WebSocket, WebSocketException, status
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import get_db_dep, get_current_user
-from app.services.project_service import project_service
+from app.api.deps import (
+    get_db_dep, get_read_db_dep, get_current_user, get_current_user_read, get_websocket_read_db, get_websocket_user,
+)
+from app.services.project_service import project_service, parse_project_fields
+from app.services.task_service import task_service, TASK_LIST_COLUMNS
 from app.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate
+from app.schemas.task import TaskRead, TaskImportReport
+from app.schemas.activity import TaskActivityRead
+from app.services.activity_service import activity_service
+from app.core.pagination import NEXT_CURSOR_HEADER, MAX_PAGE_SIZE
+from app.api.serialization import project_json, project_list_json, activity_list_json
+from app.api.etag import make_etag, etag_matches, not_modified
+from app.api.export import EXPORT_MEDIA_TYPES, ndjson_stream, csv_stream
+from app.api.imports import ndjson_records, csv_records
+from app.api.feed import SSE_MEDIA_TYPE, sse_stream, websocket_feed
 
 router = APIRouter()
 
@@ -16,15 +30,141 @@ async def create_project(payload: ProjectCreate, db=Depends(get_db_dep), current
 
 
 @router.get("/", response_model=List[ProjectRead])
-async def list_projects(skip: int = Query(0), limit: int = Query(50), db=Depends(get_db_dep), current_user=Depends(get_current_user)):
-    projects = await project_service.list_projects_for_owner(db=db, owner_id=current_user.id, skip=skip, limit=limit)
-    return projects
+async def list_projects(
+    skip: int = Query(0, description="Offset paging (kept for compatibility); ignored when cursor is given"),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header"),
+    sort: str = Query("id", description="id or created_at, prefix with - for descending"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name"),
+    db=Depends(get_read_db_dep),
+    current_user=Depends(get_current_user_read),
+):
+    fieldset = parse_project_fields(fields)
+    if skip and cursor is None:
+        projects = await project_service.list_projects_for_owner(db=db, owner_id=current_user.id, skip=skip, limit=limit, fields=fieldset)
+        return project_list_json.response(projects, fields=fieldset)
+
+    projects, next_cursor = await project_service.list_projects_page(
+        db=db, owner_id=current_user.id, limit=limit, cursor=cursor, sort=sort, fields=fieldset,
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return project_list_json.response(projects, headers=headers, fields=fieldset)
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
-async def get_project(project_id: int = Path(...), db=Depends(get_db_dep), current_user=Depends(get_current_user)):
-    project = await project_service.get_project(db=db, project_id=project_id)
-    return project
+async def get_project(
+    project_id: int = Path(...),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name"),
+    if_none_match: Optional[str] = Header(None),
+    db=Depends(get_read_db_dep),
+    current_user=Depends(get_current_user_read),
+):
+    fieldset = parse_project_fields(fields)
+    if if_none_match:
+        updated_at = await project_service.get_project_updated_at(db=db, project_id=project_id)
+        etag = make_etag("project", project_id, updated_at, fieldset)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    project = await project_service.get_project(db=db, project_id=project_id, fields=fieldset)
+    headers = {"ETag": make_etag("project", project.id, project.updated_at, fieldset)}
+    return project_json.response(project, headers=headers, fields=fieldset)
+
+
+@router.get("/{project_id}/tasks/export")
+async def export_project_tasks(
+    project_id: int = Path(...),
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    db=Depends(get_read_db_dep),
+    current_user=Depends(get_current_user_read),
+):
+    """Stream every task of the project as NDJSON or CSV."""
+    batches = await task_service.export_project_tasks(db=db, project_id=project_id)
+    body = ndjson_stream(batches, TaskRead) if fmt == "ndjson" else csv_stream(batches, TASK_LIST_COLUMNS)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}-tasks.{fmt}"'},
+    )
+
+
+@router.post("/{project_id}/tasks/import", response_model=TaskImportReport)
+async def import_project_tasks(
+    request: Request,
+    project_id: int = Path(...),
+    fmt: Optional[Literal["ndjson", "csv"]] = Query(None, alias="format", description="Defaults from Content-Type"),
+    db=Depends(get_db_dep),
+    current_user=Depends(get_current_user),
+):
+    """
+    Bulk-create tasks from a streamed NDJSON or CSV body (one TaskCreate per row;
+    in CSV, assignee_ids and tag_ids are ';'-separated). Returns a per-row error report.
+    """
+    if fmt is None:
+        fmt = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    if fmt == "csv":
+        records = csv_records(request.stream(), list_fields=("assignee_ids", "tag_ids"))
+    else:
+        records = ndjson_records(request.stream())
+    return await task_service.import_project_tasks(db=db, project_id=project_id, creator_id=current_user.id, records=records)
+
+
+@router.get("/{project_id}/activity", response_model=List[TaskActivityRead])
+async def project_activity(
+    project_id: int = Path(...),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header"),
+    since: Optional[datetime] = Query(None, description="Oldest entry to return (default: ACTIVITY_READ_WINDOW_DAYS ago)"),
+    db=Depends(get_read_db_dep),
+    current_user=Depends(get_current_user_read),
+):
+    """Task history across the project, newest first."""
+    entries, next_cursor = await activity_service.list_for_project(
+        db=db, project_id=project_id, limit=limit, cursor=cursor, since=since,
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return activity_list_json.response(entries, headers=headers)
+
+
+@router.get("/{project_id}/events")
+async def project_events(
+    project_id: int = Path(...),
+    cursor: Optional[str] = Query(None, description="Resume after this event id (default: the Last-Event-ID header)"),
+    last_event_id: Optional[str] = Header(None),
+    db=Depends(get_read_db_dep),
+    current_user=Depends(get_current_user_read),
+):
+    """
+    Server-Sent Events stream of the project's task changes: task.created,
+    task.updated, task.assigned, task.deleted, task.imported, project.deleted,
+    plus feed.gap / feed.reset notices (see app/services/change_feed.py).
+    """
+    await project_service.get_project(db=db, project_id=project_id)
+    # the stream can stay open for hours; give the connection back to the pool now
+    await db.close()
+    return StreamingResponse(
+        sse_stream(project_id, cursor or last_event_id),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{project_id}/events/ws")
+async def project_events_ws(
+    websocket: WebSocket,
+    project_id: int,
+    cursor: Optional[str] = Query(None, description="Resume after this event id"),
+    db=Depends(get_websocket_read_db),
+    current_user=Depends(get_websocket_user),
+):
+    """WebSocket variant of GET /{project_id}/events: one JSON text message per event."""
+    try:
+        await project_service.get_project(db=db, project_id=project_id)
+    except HTTPException as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+    await db.close()
+    await websocket.accept()
+    await websocket_feed(websocket, project_id, cursor)
 
 
 @router.patch("/{project_id}", response_model=ProjectRead)
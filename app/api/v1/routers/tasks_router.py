@@ -1,10 +1,16 @@
 # app/api/v1/routers/tasks_router.py
-from typing import List
-from fastapi import APIRouter, Depends, Query, Path, Body, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Path, Body, Header, HTTPException, status
 
-from app.api.deps import get_db_dep, get_current_user
-from app.services.task_service import task_service
-from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
+from app.api.deps import get_db_dep, get_read_db_dep, get_current_user
+from app.services.task_service import task_service, parse_task_include, parse_task_fields
+from app.schemas.task import TaskCreate, TaskRead, TaskUpdate, TaskBulkAssign
+from app.schemas.activity import TaskActivityRead
+from app.services.activity_service import activity_service
+from app.core.pagination import NEXT_CURSOR_HEADER, MAX_PAGE_SIZE
+from app.api.serialization import task_json, task_list_json, activity_list_json
+from app.api.etag import make_etag, etag_matches, not_modified, parse_if_match
 
 router = APIRouter()
 
@@ -28,23 +34,103 @@ async def create_task(payload: TaskCreate, db=Depends(get_db_dep), current_user=
     return task
 
 
+@router.post("/assign", status_code=status.HTTP_204_NO_CONTENT)
+async def assign_bulk(payload: TaskBulkAssign, db=Depends(get_db_dep), current_user=Depends(get_current_user)):
+    """Assign the same users to many tasks at once."""
+    await task_service.assign_users_bulk(
+        db=db, task_ids=payload.task_ids, user_ids=payload.user_ids, assigned_by=current_user.id, replace=payload.replace,
+    )
+
+
 @router.get("/", response_model=List[TaskRead])
-async def list_tasks(skip: int = Query(0), limit: int = Query(50), db=Depends(get_db_dep)):
-    return await task_service.list_tasks(db=db, skip=skip, limit=limit)
+async def list_tasks(
+    skip: int = Query(0, description="Offset paging (kept for compatibility); ignored when cursor is given"),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header"),
+    sort: str = Query("id", description="id or created_at, prefix with - for descending"),
+    with_description: bool = Query(False, description="Include the (potentially large) description column"),
+    include: Optional[str] = Query(None, description="Nested relations to load: assignees,tags,comments"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,status"),
+    db=Depends(get_read_db_dep),
+):
+    relations = parse_task_include(include)
+    fieldset = parse_task_fields(fields, relations)
+    if skip and cursor is None:
+        tasks = await task_service.list_tasks(
+            db=db, skip=skip, limit=limit, with_description=with_description, include=relations, fields=fieldset,
+        )
+        return task_list_json.response(tasks, fields=fieldset)
+
+    tasks, next_cursor = await task_service.list_tasks_page(
+        db=db, limit=limit, cursor=cursor, sort=sort, with_description=with_description, include=relations, fields=fieldset,
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return task_list_json.response(tasks, headers=headers, fields=fieldset)
 
 
 @router.get("/{task_id}", response_model=TaskRead)
-async def get_task(task_id: int = Path(...), db=Depends(get_db_dep)):
-    task = await task_service.get_task(db=db, task_id=task_id)
-    return task
+async def get_task(
+    task_id: int = Path(...),
+    include: Optional[str] = Query(None, description="Nested relations to load: assignees,tags,comments"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,status"),
+    if_none_match: Optional[str] = Header(None),
+    db=Depends(get_read_db_dep),
+):
+    relations = parse_task_include(include)
+    fieldset = parse_task_fields(fields, relations)
+    # included relations are not covered by Task.version, so those reads carry no ETag
+    if if_none_match and not relations:
+        version = await task_service.get_task_version(db=db, task_id=task_id)
+        etag = make_etag("task", task_id, version, fieldset)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    task = await task_service.get_task(db=db, task_id=task_id, include=relations, fields=fieldset)
+    headers = None if relations else {"ETag": make_etag("task", task.id, task.version, fieldset)}
+    return task_json.response(task, headers=headers, fields=fieldset)
 
 
 @router.patch("/{task_id}", response_model=TaskRead)
-async def patch_task(task_id: int, payload: TaskUpdate = Body(...), db=Depends(get_db_dep), current_user=Depends(get_current_user)):
+async def patch_task(
+    task_id: int,
+    payload: TaskUpdate = Body(...),
+    if_match: Optional[str] = Header(None),
+    db=Depends(get_db_dep),
+    current_user=Depends(get_current_user),
+):
     patch = payload.dict(exclude_unset=True)
     expected_version = patch.pop("version", None)
-    updated = await task_service.update_task(db=db, task_id=task_id, patch=patch, expected_version=expected_version)
-    return updated
+    if_match_version = parse_if_match(if_match, "task", task_id)
+    if if_match_version is not None:
+        expected_version = if_match_version
+    try:
+        updated = await task_service.update_task(
+            db=db, task_id=task_id, patch=patch, expected_version=expected_version, actor_id=current_user.id,
+        )
+    except HTTPException as e:
+        if if_match_version is not None and e.status_code == status.HTTP_409_CONFLICT:
+            raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="ETag does not match")
+        raise
+    return task_json.response(updated, headers={"ETag": make_etag("task", updated.id, updated.version)})
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(task_id: int, db=Depends(get_db_dep), current_user=Depends(get_current_user)):
+    await task_service.delete_task(db=db, task_id=task_id, actor_id=current_user.id, requester_id=current_user.id)
+
+
+@router.get("/{task_id}/activity", response_model=List[TaskActivityRead])
+async def task_activity(
+    task_id: int = Path(...),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header"),
+    since: Optional[datetime] = Query(None, description="Oldest entry to return (default: ACTIVITY_READ_WINDOW_DAYS ago)"),
+    db=Depends(get_read_db_dep),
+):
+    """The task's history, newest first (kept after the task is deleted)."""
+    entries, next_cursor = await activity_service.list_for_task(db=db, task_id=task_id, limit=limit, cursor=cursor, since=since)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return activity_list_json.response(entries, headers=headers)
 
 
 @router.post("/{task_id}/assign", response_model=TaskRead)
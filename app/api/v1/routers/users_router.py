@@ -2,10 +2,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.api.deps import get_db_dep, get_current_user
+from app.api.deps import get_db_dep, get_read_db_dep, get_current_user_read
 from app.services.user_service import user_service
 from app.core.security import create_access_token
 from app.schemas.user import UserCreate, UserRead
+from app.api.serialization import user_json
 
 router = APIRouter()
 
@@ -31,5 +32,9 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db=Depends(get
 
 
 @router.get("/me", response_model=UserRead)
-async def me(current_user=Depends(get_current_user)):
-    return current_user
+async def me(current_user=Depends(get_current_user_read), db=Depends(get_read_db_dep)):
+    # the principal is a cached summary; the profile comes from the row
+    user = await user_service.get_by_id(db, current_user.id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return user_json.response(user)
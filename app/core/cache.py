@@ -0,0 +1,156 @@
+# app/core/cache.py
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Protocol, TypeVar
+
+from app.core.config import settings
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """
+    Small in-process LRU cache with a per-entry TTL and a size bound.
+    Not thread-safe: meant to be used from the event loop only.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Principals (immutable caller summaries, app/schemas/user.py) keyed by the token
+# subject, see app/api/deps.get_current_user. Never ORM rows: entries are shared.
+# UserService drops entries when it changes a user row.
+principal_cache: TTLCache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+
+class CacheBackend(Protocol):
+    """Async key/value store behind the read-through caches (app/services/read_cache.py)."""
+
+    # True: values must be bytes (the cache serializes); False: any Python object
+    serialized: bool
+
+    async def get(self, key: str) -> Optional[Any]: ...
+
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    def stats(self) -> Dict[str, Any]: ...
+
+
+class MemoryBackend:
+    """In-process backend: a TTLCache holding the objects themselves (per worker)."""
+
+    serialized = False
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", **self._cache.stats()}
+
+
+class SharedBackend:
+    """
+    Adapter for a shared store reached through a client with the redis.asyncio
+    surface: `get(key)`, `set(key, value, px=ms)` and `delete(key)`. Values are
+    bytes. Any stand-in with the same three coroutines (e.g. a local
+    process-backed fake in tests) can be passed as the client.
+    """
+
+    serialized = True
+
+    def __init__(self, client: Any, namespace: str = "taskmgr"):
+        self.client = client
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self.client.get(self._key(key))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl > 0:
+            await self.client.set(self._key(key), value, px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self._key(key))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "shared", "hits": self.hits, "misses": self.misses}
@@ -1,5 +1,5 @@
 # app/core/config.py
-from typing import Any
+from typing import Any, Literal
 from pydantic import AnyUrl, Field
 from pydantic_settings import BaseSettings
 
@@ -17,12 +17,95 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: AnyUrl = Field(..., env="DATABASE_URL")
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a connection before erroring
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 disables recycling
+    DB_POOL_PRE_PING: bool = False  # SELECT 1 on every checkout; enable behind flaky networks
+    # "request": a session keeps its connection from first statement until close.
+    # "statement": read-only work returns the connection right away (app/db/session.py).
+    DB_SESSION_MODE: Literal["request", "statement"] = "request"
+
+    DB_BULK_CHUNK_SIZE: int = 1000  # rows per statement in BaseRepository.bulk_*
+    DB_STREAM_YIELD_PER: int = 1000  # rows per fetch from server-side cursors (exports)
+
+    # Bulk task import (POST /projects/{id}/tasks/import)
+    TASK_IMPORT_BATCH_SIZE: int = 5000  # rows validated and COPY'd together
+    TASK_IMPORT_MAX_ERRORS: int = 1000  # row errors listed in the report (all are counted)
+
+    BATCH_MAX_OPERATIONS: int = 100  # sub-operations accepted by POST /batch
+
+    # Idempotency-Key on create endpoints, see app/core/idempotency.py
+    IDEMPOTENCY_TTL_SECONDS: float = 24 * 60 * 60  # how long a stored response is replayed
+    IDEMPOTENCY_LOCK_SECONDS: float = 60.0  # an unfinished claim lapses after this (crashed worker)
+    IDEMPOTENCY_POLL_SECONDS: float = 0.1  # duplicate waiting on a request running in another worker
+    IDEMPOTENCY_PURGE_SECONDS: float = 300.0  # per worker, delete expired rows at most this often
+
+    # Read replicas: comma-separated URLs; empty means all reads go to the primary
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_STRATEGY: Literal["round_robin", "least_connections"] = "round_robin"
+    DB_REPLICA_RETRY_SECONDS: float = 30.0  # how long a failing replica is skipped
+    DB_READ_YOUR_WRITES_SECONDS: float = 0.0  # pin a user's reads to the primary after they write
+
+    # SQL instrumentation, see app/db/instrumentation.py
+    SQL_SLOW_QUERY_MS: float = 0.0  # log statements slower than this; 0 disables
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5  # same statement this many times in one request is flagged
 
     # Security / JWT
     SECRET_KEY: str = Field(..., env="SECRET_KEY")
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # default 1 day
 
+    # Password hashing pool, see app/core/security.py
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64  # calls beyond this are rejected with 503
+
+    TOKEN_CACHE_SIZE: int = 10_000  # verified JWT payloads, see decode_access_token
+
+    # Principal cache (token subject -> user), see app/core/cache.py
+    PRINCIPAL_CACHE_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0  # 0 disables the cache
+
+    # Read-through cache for single task/project reads, see app/services/read_cache.py
+    READ_CACHE_BACKEND: Literal["memory", "shared", "off"] = "memory"
+    READ_CACHE_URL: str | None = None  # shared backend (redis://...), needs the `redis` package
+    READ_CACHE_SIZE: int = 10_000  # entries per worker (memory backend)
+    READ_CACHE_TTL_SECONDS: float = 30.0  # bounds staleness from writes in other workers
+    READ_CACHE_HOLD_SECONDS: float = 5.0  # after an invalidation, reads skip the cache and do not refill it
+
+    # Cross-worker cache invalidation over LISTEN/NOTIFY, see app/db/invalidation.py
+    INVALIDATION_BUS: bool = True  # only takes effect on PostgreSQL (asyncpg)
+    INVALIDATION_CHANNEL: str = "taskmgr_invalidate"
+    INVALIDATION_RECONNECT_SECONDS: float = 5.0
+
+    # Project change feed (SSE / WebSocket), see app/services/change_feed.py
+    FEED_CHANNEL: str = "taskmgr_feed"  # carried by the invalidation listener connection
+    FEED_SUBSCRIBER_BUFFER: int = 256  # events queued per subscriber before the oldest are dropped
+    FEED_HISTORY_SIZE: int = 200  # recent events kept per project for resuming from a cursor
+    FEED_HISTORY_PROJECTS: int = 500  # projects with history kept per worker (LRU)
+    FEED_HISTORY_MAX_EVENTS: int = 20_000  # events kept per worker across all projects (LRU projects go first)
+    FEED_HEARTBEAT_SECONDS: float = 15.0
+
+    # Transactional outbox, see app/services/outbox.py
+    OUTBOX_ENABLED: bool = False  # write outbox rows at all; needs the outbox_events migration
+    OUTBOX_DISPATCHER: bool = True  # with OUTBOX_ENABLED, run a dispatcher in this worker
+    OUTBOX_BATCH_SIZE: int = 100  # rows claimed per round
+    OUTBOX_CONCURRENCY: int = 10  # events delivered at once per worker
+    OUTBOX_POLL_SECONDS: float = 1.0  # idle wait between claims
+    OUTBOX_LEASE_SECONDS: float = 120.0  # claimed rows become due again after this; keep above the handler timeout
+    OUTBOX_HANDLER_TIMEOUT_SECONDS: float = 30.0
+    OUTBOX_MAX_ATTEMPTS: int = 10  # then the row is parked with dead_at set
+    OUTBOX_RETRY_SECONDS: float = 2.0  # first retry delay, doubled per attempt
+    OUTBOX_RETENTION_HOURS: float = 7 * 24  # parked and never-delivered rows older than this are deleted
+    OUTBOX_PURGE_SECONDS: float = 3600.0  # per worker, purge at most this often
+
+    # Task activity log (monthly partitions), see app/services/activity_service.py
+    ACTIVITY_READ_WINDOW_DAYS: int = 90  # default `since` for activity reads; bounds the partitions scanned
+    ACTIVITY_RETENTION_MONTHS: int = 24  # older monthly partitions are detached and dropped; 0 keeps everything
+    ACTIVITY_PARTITIONS_AHEAD: int = 3  # future monthly partitions kept ready
+    ACTIVITY_MAINTENANCE_SECONDS: float = 3600.0  # partition maintenance interval; 0 disables it in this process
+
     # Other
     S3_BUCKET: str | None = None
     S3_REGION: str | None = None
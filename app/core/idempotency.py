@@ -0,0 +1,229 @@
+# app/core/idempotency.py
+"""
+Idempotency-Key support for create endpoints.
+
+The first response to (caller, key) is stored for IDEMPOTENCY_TTL_SECONDS and
+replayed verbatim to retries, which never reach the route (no auth lookup, no
+write). A duplicate that arrives while the first request is still running
+waits for it instead of racing it. Reusing a key with a different request body
+is a 422.
+
+The caller is the token subject, so keys are scoped per user. Responses with a
+5xx status are not stored, so the client can retry them. Claims and responses
+live in the idempotency_keys table, so the guarantee holds across workers and
+restarts: the claim is a single INSERT ... ON CONFLICT on the (caller, key)
+primary key.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.datastructures import Headers
+
+from app.core.config import settings
+from app.core.security import get_subject_from_token
+from app.db.session import AsyncSessionLocal
+from app.repositories.idempotency_repo import idempotency_repo
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+
+
+@dataclass
+class StoredResponse:
+    fingerprint: str
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyStore:
+    """
+    Claims and stored responses in the idempotency_keys table. A duplicate of a
+    request running in this worker waits on its future; one running in another
+    worker is polled every IDEMPOTENCY_POLL_SECONDS until it completes, gives up
+    its claim, or the claim lapses after IDEMPOTENCY_LOCK_SECONDS.
+    """
+
+    def __init__(self, sessions: async_sessionmaker, ttl: float, lock: float, poll: float, purge_every: float):
+        self.sessions = sessions
+        self.ttl = timedelta(seconds=ttl)
+        self.lock = timedelta(seconds=lock)
+        self.poll = poll
+        self.purge_every = purge_every
+        self._next_purge = 0.0
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.claims = 0
+        self.replays = 0
+        self.waits = 0
+
+    async def begin(self, caller: str, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """
+        Claim (caller, key) for a request with `fingerprint`. Returns None once the
+        claim is ours (the caller must call finish), else the stored response.
+        """
+        waited = False
+        while True:
+            fut = self._inflight.get((caller, key))
+            if fut is None:
+                now = datetime.now(timezone.utc)
+                async with self.sessions() as db:
+                    row = await idempotency_repo.claim(db, caller, key, fingerprint, now, now + self.lock)
+                    await db.commit()
+                if row is None:
+                    self._inflight[(caller, key)] = asyncio.get_running_loop().create_future()
+                    self.claims += 1
+                    return None
+                if row.status is not None:
+                    headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in row.headers]
+                    return StoredResponse(row.fingerprint, row.status, headers, row.body)
+            if not waited:
+                waited = True
+                self.waits += 1
+            if fut is not None:
+                await asyncio.shield(fut)
+            else:
+                await asyncio.sleep(self.poll)  # running in another worker
+
+    async def finish(self, caller: str, key: str, fingerprint: str, response: Optional[StoredResponse]) -> None:
+        """Store the response (None: nothing worth replaying, free the key) and wake up local waiters."""
+        try:
+            now = datetime.now(timezone.utc)
+            async with self.sessions() as db:
+                if response is None:
+                    await idempotency_repo.release(db, caller, key, fingerprint)
+                else:
+                    headers = [(name.decode("latin-1"), value.decode("latin-1")) for name, value in response.headers]
+                    await idempotency_repo.complete(
+                        db, caller, key, fingerprint, response.status, headers, response.body, now + self.ttl,
+                    )
+                if time.monotonic() >= self._next_purge:
+                    self._next_purge = time.monotonic() + self.purge_every
+                    await idempotency_repo.delete_expired(db, now)
+                await db.commit()
+        except (SQLAlchemyError, OSError):
+            # the claim lapses on its own after IDEMPOTENCY_LOCK_SECONDS
+            logger.warning("Could not record idempotent response for key %r", key, exc_info=True)
+        finally:
+            fut = self._inflight.pop((caller, key), None)
+            if fut is not None and not fut.done():
+                fut.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"in_flight": len(self._inflight), "claims": self.claims, "replays": self.replays, "waits": self.waits}
+
+
+idempotency_store = IdempotencyStore(
+    AsyncSessionLocal,
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+    lock=settings.IDEMPOTENCY_LOCK_SECONDS,
+    poll=settings.IDEMPOTENCY_POLL_SECONDS,
+    purge_every=settings.IDEMPOTENCY_PURGE_SECONDS,
+)
+
+
+async def _json_error(send, status: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _replay(send, stored: StoredResponse) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": stored.status,
+        "headers": [*stored.headers, (REPLAYED_HEADER, b"true")],
+    })
+    await send({"type": "http.response.body", "body": stored.body})
+
+
+class IdempotencyMiddleware:
+    """Pure ASGI middleware applying Idempotency-Key to POSTs on `paths`."""
+
+    def __init__(self, app, paths: Iterable[str], store: IdempotencyStore = idempotency_store):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.store = store
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get(IDEMPOTENCY_HEADER)
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        caller = get_subject_from_token(token) if scheme.lower() == "bearer" and token else None
+        if not key or caller is None:
+            # no key, or unauthenticated (the route will answer 401)
+            await self.app(scope, receive, send)
+            return
+        if len(key) > MAX_KEY_LENGTH:
+            await _json_error(send, 400, f"Idempotency-Key longer than {MAX_KEY_LENGTH} characters")
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+        fingerprint = hashlib.sha256(scope["path"].encode() + b"\0" + body).hexdigest()
+        try:
+            stored = await self.store.begin(caller, key, fingerprint)
+        except (SQLAlchemyError, OSError):
+            logger.exception("Idempotency store unavailable")
+            await _json_error(send, 503, "Idempotency store unavailable, retry later")
+            return
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                await _json_error(send, 422, "Idempotency-Key was already used for a different request")
+                return
+            self.store.replays += 1
+            await _replay(send, stored)
+            return
+
+        body_sent = False
+
+        async def replay_receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status = 500
+        response_headers: List[Tuple[bytes, bytes]] = []
+        response_body: List[bytes] = []
+
+        async def send_wrapper(message):
+            nonlocal status, response_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                response_body.append(message.get("body", b""))
+            await send(message)
+
+        result = None
+        try:
+            await self.app(scope, replay_receive, send_wrapper)
+            if status < 500:
+                result = StoredResponse(fingerprint, status, response_headers, b"".join(response_body))
+        finally:
+            await self.store.finish(caller, key, fingerprint, result)
@@ -0,0 +1,36 @@
+# app/core/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Upper bound for the `limit` query parameter of paginated list endpoints
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(sort: str, value: Any, last_id: int) -> str:
+    """
+    Opaque keyset cursor: the sort spec plus the (sort value, id) of the last row.
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, last_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """
+    Returns (sort value, id) from a cursor made by encode_cursor.
+    Raises ValueError if the cursor is malformed or was issued for another sort.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, last_id = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if cursor_sort != sort or not isinstance(last_id, int):
+        raise ValueError("Cursor does not match the requested sort")
+    return value, last_id
@@ -1,12 +1,21 @@
 # app/core/security.py
 from __future__ import annotations
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 from passlib.context import CryptContext
-from jose import jwt, JWTError
+from jose import jwt, JWTError, ExpiredSignatureError
+from jose.exceptions import JWTClaimsError
 
 from app.core.config import settings
+from app.core.cache import TTLCache
 
 # Password hashing (bcrypt)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -14,6 +23,27 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # Expose algorithm constant (used elsewhere)
 ALGORITHM = settings.JWT_ALGORITHM
 
+T = TypeVar("T")
+
+# bcrypt is CPU bound (tens of ms per call); the async helpers below run it in
+# a bounded pool so it never blocks the event loop.
+_hash_executor: Optional[Executor] = None
+_hash_pending = 0
+
+
+class PasswordHashBusyError(RuntimeError):
+    """Raised when the hashing pool already has PASSWORD_HASH_MAX_PENDING calls queued."""
+
+
+# Verified token payloads keyed by sha256(token); each entry lives until the token's exp.
+token_cache: TTLCache = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE, ttl=0)
+
+# HS256 fast path: HMAC state keyed once, copied per verification.
+_hs256_mac = (
+    hmac.new(settings.SECRET_KEY.encode("utf-8"), digestmod=hashlib.sha256)
+    if ALGORITHM == "HS256" else None
+)
+
 
 def get_password_hash(password: str) -> str:
     """Hash a plaintext password for storage."""
@@ -27,6 +57,59 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _get_hash_executor() -> Executor:
+    global _hash_executor
+    if _hash_executor is None:
+        workers = settings.PASSWORD_HASH_WORKERS
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            _hash_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pwd-hash")
+    return _hash_executor
+
+
+async def _run_hash_job(fn: Callable[..., T], *args: Any) -> T:
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHashBusyError("Password hashing queue is full")
+
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_executor(), fn, *args)
+    finally:
+        _hash_pending -= 1
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Async variant of get_password_hash; runs in the hashing pool."""
+    return await _run_hash_job(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Async variant of verify_password; runs in the hashing pool."""
+    if not hashed_password:
+        return False
+    return await _run_hash_job(verify_password, plain_password, hashed_password)
+
+
+def shutdown_hash_executor() -> None:
+    """Stop the hashing pool (call on app shutdown)."""
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
+def hash_pool_stats() -> Dict[str, Any]:
+    return {
+        "executor": settings.PASSWORD_HASH_EXECUTOR,
+        "workers": settings.PASSWORD_HASH_WORKERS,
+        "pending": _hash_pending,
+        "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+    }
+
+
 def create_access_token(subject: str | int, expires_delta: Optional[timedelta] = None, **extra_claims: Any) -> str:
     """
     Create a signed JWT.
@@ -52,14 +135,95 @@ def create_access_token(subject: str | int, expires_delta: Optional[timedelta] =
     return token
 
 
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_hs256(token: str) -> Dict[str, Any]:
+    """
+    Verify an HS256 token without going through jose (header parsing, key and
+    algorithm lookup). Claims are checked by _check_claims, so this accepts the
+    same tokens as jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).
+    """
+    try:
+        signing_input, _, signature = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+        header = json.loads(_b64url_decode(header_segment))
+        expected = _b64url_decode(signature)
+        signing_bytes = signing_input.encode("ascii")
+    except (ValueError, TypeError):
+        raise JWTError("Invalid token encoding")
+
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise JWTError("The specified alg value is not allowed")
+
+    mac = _hs256_mac.copy()
+    mac.update(signing_bytes)
+    if not hmac.compare_digest(mac.digest(), expected):
+        raise JWTError("Signature verification failed.")
+
+    try:
+        payload = json.loads(_b64url_decode(payload_segment))
+    except (ValueError, TypeError):
+        raise JWTError("Invalid payload string")
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload string: must be a json object")
+
+    _check_claims(payload)
+    return payload
+
+
+def _int_claim(payload: Dict[str, Any], name: str, label: str) -> int:
+    try:
+        return int(payload[name])
+    except (ValueError, TypeError):
+        raise JWTClaimsError(f"{label} must be an integer.")
+
+
+def _check_claims(payload: Dict[str, Any]) -> None:
+    """
+    jose's claim validation as jwt.decode runs it in decode_access_token: default
+    options, no leeway, and no audience / issuer / subject / access_token given.
+    """
+    now = int(time.time())  # jose compares whole seconds
+    if "iat" in payload:
+        _int_claim(payload, "iat", "Issued At claim (iat)")
+    if "nbf" in payload and _int_claim(payload, "nbf", "Not Before claim (nbf)") > now:
+        raise JWTClaimsError("The token is not yet valid (nbf)")
+    if "exp" in payload and _int_claim(payload, "exp", "Expiration Time claim (exp)") < now:
+        raise ExpiredSignatureError("Signature has expired.")
+    if "aud" in payload:
+        # no audience is passed, so jose rejects every token that names one
+        raise JWTClaimsError("Invalid audience")
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        raise JWTClaimsError("Subject must be a string.")
+    if "jti" in payload and not isinstance(payload["jti"], str):
+        raise JWTClaimsError("JWT ID must be a string.")
+    if "at_hash" in payload:
+        raise JWTClaimsError("No access_token provided to compare against at_hash claim.")
+
+
 def decode_access_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate a JWT. Returns the payload dict.
     Raises jose.JWTError (or subclasses) on invalid/expired tokens.
+    Verified payloads are cached in `token_cache` until the token expires.
     """
-    # jose.jwt.decode will raise JWTError on invalid signature / expired
-    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-    return payload
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
+    if _hs256_mac is not None:
+        payload = _decode_hs256(token)
+    else:
+        # jose.jwt.decode will raise JWTError on invalid signature / expired
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(key, payload, ttl=exp - time.time())
+    return dict(payload)
 
 
 def get_subject_from_token(token: str) -> Optional[str]:
@@ -0,0 +1,135 @@
+# app/db/instrumentation.py
+"""
+Per-request SQL statistics.
+
+Engine events count statements and DB time for the request in progress
+(tracked through a contextvar), flag statement shapes repeated often enough
+to look like N+1 loops and optionally log slow statements. The ASGI
+middleware rolls each request up into per-route aggregates and, in DEBUG,
+adds a Server-Timing header.
+"""
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestSQLStats:
+    __slots__ = ("statements", "db_time", "shapes")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+        self.shapes: Counter = Counter()
+
+    def suspected_n_plus_one(self) -> List[str]:
+        threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+        return [shape for shape, count in self.shapes.items() if count >= threshold]
+
+
+_current: ContextVar[Optional[RequestSQLStats]] = ContextVar("request_sql_stats", default=None)
+
+# route path -> aggregate counters
+route_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def current_sql_stats() -> Optional[RequestSQLStats]:
+    return _current.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    stats = _current.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_time += elapsed
+        stats.shapes[statement] += 1
+
+    slow_ms = settings.SQL_SLOW_QUERY_MS
+    if slow_ms and elapsed * 1000 >= slow_ms:
+        logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+
+def _record_route(route: str, stats: RequestSQLStats) -> None:
+    agg = route_stats.get(route)
+    if agg is None:
+        agg = route_stats[route] = {
+            "requests": 0,
+            "statements": 0,
+            "db_ms": 0.0,
+            "max_statements": 0,
+            "n_plus_one_requests": 0,
+        }
+    agg["requests"] += 1
+    agg["statements"] += stats.statements
+    agg["db_ms"] += stats.db_time * 1000
+    agg["max_statements"] = max(agg["max_statements"], stats.statements)
+
+    repeated = stats.suspected_n_plus_one()
+    if repeated:
+        agg["n_plus_one_requests"] += 1
+        logger.warning(
+            "Possible N+1 on %s: %d statements, repeated: %s",
+            route, stats.statements, "; ".join(s[:200] for s in repeated),
+        )
+
+
+def sql_route_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-route aggregates with averages (exposed on /metrics)."""
+    out = {}
+    for route, agg in route_stats.items():
+        n = agg["requests"] or 1
+        out[route] = {
+            **agg,
+            "avg_statements": agg["statements"] / n,
+            "avg_db_ms": agg["db_ms"] / n,
+        }
+    return out
+
+
+class SQLInstrumentationMiddleware:
+    """Pure ASGI middleware: one RequestSQLStats per HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSQLStats()
+        token = _current.set(stats)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                headers = list(message.get("headers", []))
+                value = f'db;dur={stats.db_time * 1000:.2f};desc="{stats.statements} queries"'
+                headers.append((b"server-timing", value.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            _record_route(getattr(route, "path", "<unmatched>"), stats)
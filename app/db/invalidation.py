@@ -0,0 +1,232 @@
+# app/db/invalidation.py
+"""
+Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+Writers call `publish_invalidation(db, kind, *ids)` before committing. The ids
+are queued on the session, and a before_commit hook sends them with
+pg_notify() inside the same transaction. Postgres therefore delivers them only
+if the write commits; a rolled-back SAVEPOINT or transaction drops them too.
+Payloads are compact: "task:1,2,3".
+
+Each worker holds one dedicated asyncpg connection (not from the pool) that
+LISTENs on INVALIDATION_CHANNEL. It runs the handlers registered with
+`on_invalidation(kind, handler)`, e.g. evicting read-cache or principal-cache
+entries. If the listener connection drops, every handler is called with
+ids=None (evict everything), because messages may have been missed; then it
+reconnects.
+
+The same connection carries other channels registered with `listen()` (the
+project change feed in app/services/change_feed.py), so a worker holds a single
+LISTEN connection in total.
+
+Only active on PostgreSQL/asyncpg; on other databases publishing is a no-op
+and no listener is started.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import PrimarySession
+
+logger = logging.getLogger(__name__)
+
+# handler(ids) -> None; ids=None means "drop everything of this kind"
+Handler = Callable[[Optional[List[int]]], Awaitable[None]]
+
+MAX_PAYLOAD = 7900  # NOTIFY payloads must stay under 8000 bytes
+
+_handlers: Dict[str, List[Handler]] = defaultdict(list)
+
+# channel -> (callback(payload), on_gap()) for the shared listener connection
+_channels: Dict[str, Tuple[Callable[[str], None], Optional[Callable[[], Awaitable[None]]]]] = {}
+
+# handler runs in flight; the loop keeps only weak references to tasks
+_dispatches: Set["asyncio.Task[None]"] = set()
+
+
+def on_invalidation(kind: str, handler: Handler) -> None:
+    _handlers[kind].append(handler)
+
+
+def listen(channel: str, callback: Callable[[str], None], on_gap: Optional[Callable[[], Awaitable[None]]] = None) -> None:
+    """
+    Also LISTEN on `channel`: `callback(payload)` runs on the event loop for every
+    notification; `on_gap()` runs after a reconnect (messages may have been lost).
+    """
+    _channels[channel] = (callback, on_gap)
+
+
+def publish_invalidation(db: AsyncSession, kind: str, *ids: int) -> None:
+    """Queue ids of `kind` to be NOTIFY'd when `db` next commits."""
+    stale: Dict[str, Set[int]] = db.info.setdefault("stale", {})
+    stale.setdefault(kind, set()).update(ids)
+
+
+def encode_payloads(kind: str, ids: Iterable[int]) -> List[str]:
+    payloads, current = [], []
+    size = len(kind) + 1
+    for id in sorted(ids):
+        part = str(id)
+        if current and size + len(part) + 1 > MAX_PAYLOAD:
+            payloads.append(f"{kind}:{','.join(current)}")
+            current, size = [], len(kind) + 1
+        current.append(part)
+        size += len(part) + 1
+    if current:
+        payloads.append(f"{kind}:{','.join(current)}")
+    return payloads
+
+
+def decode_payload(payload: str):
+    kind, _, ids = payload.partition(":")
+    return kind, [int(i) for i in ids.split(",") if i]
+
+
+@event.listens_for(PrimarySession, "before_commit")
+def _notify_before_commit(session: Session) -> None:
+    if session.info.get("releasing"):
+        # statement mode handing back an idle connection; the write comes later
+        return
+    stale = session.info.pop("stale", None)
+    if not stale or not settings.INVALIDATION_BUS:
+        return
+    conn = session.connection()
+    if conn.dialect.name != "postgresql":
+        return
+    for kind, ids in stale.items():
+        for payload in encode_payloads(kind, ids):
+            conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": settings.INVALIDATION_CHANNEL, "payload": payload})
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _drop_on_rollback(session: Session) -> None:
+    session.info.pop("stale", None)
+
+
+class InvalidationListener:
+    def __init__(self, url: str):
+        self.url = url
+        self._task: Optional[asyncio.Task] = None
+        self.received = 0
+        self.reconnects = 0
+
+    def _dsn(self) -> str:
+        # asyncpg wants a plain postgresql:// DSN
+        return make_url(self.url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        self.received += 1
+        callback, _ = _channels[channel]
+        try:
+            callback(payload)
+        except Exception:
+            logger.exception("Notification handler for %s failed", channel)
+
+    async def _run(self) -> None:
+        import asyncpg
+
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(self._dsn())
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: lost.set())
+                for channel in _channels:
+                    await conn.add_listener(channel, self._on_notify)
+                logger.info("Listening on %s", ", ".join(_channels))
+                await lost.wait()
+                logger.warning("Invalidation listener connection lost")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Invalidation listener failed: %s", e)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            # messages may have been missed while disconnected
+            self.reconnects += 1
+            for _, on_gap in list(_channels.values()):
+                if on_gap is not None:
+                    await on_gap()
+            await asyncio.sleep(settings.INVALIDATION_RECONNECT_SECONDS)
+
+    def stats(self):
+        return {
+            "channels": list(_channels),
+            "running": self._task is not None and not self._task.done(),
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+
+async def _dispatch(kind: str, ids: Optional[List[int]]) -> None:
+    for handler in _handlers.get(kind, ()):
+        try:
+            await handler(ids)
+        except Exception:
+            logger.exception("Invalidation handler for %s failed", kind)
+
+
+def _on_invalidation_payload(payload: str) -> None:
+    try:
+        kind, ids = decode_payload(payload)
+    except ValueError:
+        logger.warning("Ignoring malformed invalidation payload %r", payload[:100])
+        return
+    task = asyncio.ensure_future(_dispatch(kind, ids))
+    _dispatches.add(task)
+    task.add_done_callback(_dispatches.discard)
+
+
+async def _invalidate_everything() -> None:
+    for kind in list(_handlers):
+        await _dispatch(kind, None)
+
+
+listen(settings.INVALIDATION_CHANNEL, _on_invalidation_payload, on_gap=_invalidate_everything)
+
+
+listener: Optional[InvalidationListener] = None
+
+
+def bus_enabled() -> bool:
+    """Whether notifications travel over LISTEN/NOTIFY (PostgreSQL via asyncpg)."""
+    url = make_url(str(settings.DATABASE_URL))
+    return settings.INVALIDATION_BUS and url.get_backend_name() == "postgresql" and url.get_driver_name() == "asyncpg"
+
+
+def start_listener() -> Optional[InvalidationListener]:
+    """Start this worker's listener (called from main.on_startup); None when not applicable."""
+    global listener
+    if not bus_enabled():
+        return None
+    listener = InvalidationListener(str(settings.DATABASE_URL))
+    listener.start()
+    return listener
+
+
+async def stop_listener() -> None:
+    global listener
+    if listener is not None:
+        await listener.stop()
+        listener = None
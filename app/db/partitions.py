@@ -0,0 +1,85 @@
+# app/db/partitions.py
+"""
+Monthly range partitions for append-only tables (PostgreSQL only).
+
+A partition is named "<table>_pYYYYMM" and covers [first of the month, first of
+the next month) in UTC. The same helpers build the DDL for the Alembic
+migration and for the periodic maintenance in app/services/activity_service.py.
+Maintenance creates partitions ahead of time and retires old ones with DETACH
+PARTITION ... CONCURRENTLY + DROP TABLE. That frees the space at once, without
+the row-by-row DELETE, the WAL and the vacuum debt a retention DELETE would
+cost.
+"""
+import re
+from datetime import date, datetime
+from typing import Dict, List, Union
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+def month_start(value: Union[date, datetime]) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    start, end = month_start(month), add_months(month_start(month), 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, start)} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+async def list_partitions(conn: AsyncConnection, table: str) -> Dict[date, str]:
+    """Month -> partition name, for the partitions that follow the naming scheme."""
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    )
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+    months = {}
+    for (name,) in result:
+        m = pattern.match(name)
+        if m:
+            months[date(int(m.group(1)), int(m.group(2)), 1)] = name
+    return months
+
+
+async def ensure_partitions(conn: AsyncConnection, table: str, first: date, count: int) -> List[str]:
+    """Create the monthly partitions for `count` months from `first` that are missing; returns their names."""
+    existing = await list_partitions(conn, table)
+    created = []
+    for n in range(count):
+        month = add_months(month_start(first), n)
+        if month not in existing:
+            await conn.execute(text(create_partition_sql(table, month)))
+            created.append(partition_name(table, month))
+    return created
+
+
+async def drop_partitions_before(conn: AsyncConnection, table: str, cutoff: date) -> List[str]:
+    """
+    Detach and drop every partition that ends on or before `cutoff`; returns their
+    names. `conn` must be in AUTOCOMMIT mode (DETACH ... CONCURRENTLY cannot run
+    inside a transaction block).
+    """
+    dropped = []
+    for month, name in sorted((await list_partitions(conn, table)).items()):
+        if add_months(month, 1) > cutoff:
+            break
+        await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name} CONCURRENTLY"))
+        await conn.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
@@ -1,29 +1,225 @@
 # app/db/session.py
-import os
-from typing import AsyncGenerator
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple
 
-from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import Select, event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, AsyncTransaction, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-# Load environment variables from .env file (if present)
-load_dotenv()
+from app.core.config import settings
+from app.core.cache import TTLCache
 
-# Get database URL
-DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    raise ValueError("DATABASE_URL environment variable is not set.")
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long callers wait in connect()
+    (queueing for a free slot, opening overflow connections, pre-ping).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.checkout_wait_total += waited
+            if waited > self.checkout_wait_max:
+                self.checkout_wait_max = waited
+
+    def recreate(self):
+        # keep counters across pool recreation (e.g. after engine.dispose())
+        new_pool = super().recreate()
+        new_pool.checkouts = self.checkouts
+        new_pool.checkout_timeouts = self.checkout_timeouts
+        new_pool.checkout_wait_total = self.checkout_wait_total
+        new_pool.checkout_wait_max = self.checkout_wait_max
+        return new_pool
+
+
+def _make_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+class PrimarySession(Session):
+    """Sync session class behind AsyncSessionLocal (lets us hook primary-only events)."""
+
+
+def is_primary(db: AsyncSession) -> bool:
+    """True for sessions on the primary (not a replica)."""
+    return isinstance(db.sync_session, PrimarySession)
+
+
+def _is_plain_select(statement: Any) -> bool:
+    return isinstance(statement, Select) and statement._for_update_arg is None
+
+
+class ShortLivedAsyncSession(AsyncSession):
+    """
+    AsyncSession that gives its connection back to the pool as soon as a
+    read-only statement has been buffered, instead of holding it until the
+    session closes. Once the session writes (flush, INSERT/UPDATE/DELETE,
+    SELECT ... FOR UPDATE) the connection is kept until commit/rollback.
+    Enabled with DB_SESSION_MODE=statement.
+    """
+
+    _wrote = False
+
+    def _note_writes(self, statement: Any = None) -> None:
+        if self.new or self.dirty or self.deleted:
+            self._wrote = True
+        if statement is not None and not _is_plain_select(statement):
+            self._wrote = True
+
+    async def _release_if_idle(self) -> None:
+        # commit (not rollback) so loaded objects are not expired
+        if not self._wrote and self.in_transaction():
+            self.info["releasing"] = True
+            try:
+                await self.commit()
+            finally:
+                self.info.pop("releasing", None)
+
+    async def execute(self, statement, *args, **kwargs):
+        self._note_writes(statement)
+        result = await super().execute(statement, *args, **kwargs)
+        await self._release_if_idle()
+        return result
+
+    async def scalar(self, statement, *args, **kwargs):
+        self._note_writes(statement)
+        result = await super().scalar(statement, *args, **kwargs)
+        await self._release_if_idle()
+        return result
+
+    async def get(self, *args, **kwargs):
+        self._note_writes()
+        result = await super().get(*args, **kwargs)
+        await self._release_if_idle()
+        return result
+
+    async def refresh(self, *args, **kwargs):
+        self._note_writes()
+        await super().refresh(*args, **kwargs)
+        await self._release_if_idle()
+
+    async def flush(self, *args, **kwargs):
+        self._note_writes()
+        await super().flush(*args, **kwargs)
+
+    async def commit(self):
+        await super().commit()
+        self._wrote = False
+
+    async def rollback(self):
+        await super().rollback()
+        self._wrote = False
+
+
+SessionClass = ShortLivedAsyncSession if settings.DB_SESSION_MODE == "statement" else AsyncSession
 
 # Create async engine
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+engine = _make_engine(str(settings.DATABASE_URL))
 
 # Session factory
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
-    class_=AsyncSession,
+    class_=SessionClass,
+    sync_session_class=PrimarySession,
     expire_on_commit=False,
 )
 
 
+class Replica:
+    def __init__(self, url: str):
+        self.engine = _make_engine(url)
+        self.sessionmaker = async_sessionmaker(bind=self.engine, class_=SessionClass, expire_on_commit=False)
+        self.down_until = 0.0  # monotonic time until which the replica is skipped
+
+
+replicas: List[Replica] = [
+    Replica(url.strip()) for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()
+]
+_replica_rr = itertools.count()
+
+# Users (str(user_id)) whose reads stay on the primary for DB_READ_YOUR_WRITES_SECONDS after they commit.
+recent_writers: TTLCache = TTLCache(maxsize=100_000, ttl=settings.DB_READ_YOUR_WRITES_SECONDS)
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _remember_writer(session: Session) -> None:
+    user_id = session.info.get("user_id")
+    if user_id is not None and not session.info.get("releasing"):
+        recent_writers.set(str(user_id), True)
+
+
+def _pick_replica() -> Optional[Replica]:
+    now = time.monotonic()
+    healthy = [r for r in replicas if r.down_until <= now]
+    if not healthy:
+        return None
+    if settings.DB_REPLICA_STRATEGY == "least_connections":
+        return min(healthy, key=lambda r: r.engine.sync_engine.pool.checkedout())
+    return healthy[next(_replica_rr) % len(healthy)]
+
+
+def _pool_stats(pool) -> Dict[str, Any]:
+    checkouts = getattr(pool, "checkouts", 0)
+    wait_total = getattr(pool, "checkout_wait_total", 0.0)
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checkouts": checkouts,
+        "checkout_timeouts": getattr(pool, "checkout_timeouts", 0),
+        "checkout_wait_avg_ms": (wait_total / checkouts * 1000) if checkouts else 0.0,
+        "checkout_wait_max_ms": getattr(pool, "checkout_wait_max", 0.0) * 1000,
+    }
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Live pool counters for this worker (exposed on /metrics)."""
+    stats = _pool_stats(engine.sync_engine.pool)
+    if replicas:
+        stats["replicas"] = [
+            {
+                "url": r.engine.url.render_as_string(hide_password=True),
+                "down": r.down_until > time.monotonic(),
+                **_pool_stats(r.engine.sync_engine.pool),
+            }
+            for r in replicas
+        ]
+    return stats
+
+
 # Dependency for FastAPI
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -34,3 +230,69 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_db(user_id: Optional[str] = None) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yields a session for read-only work. Picks a healthy replica (round robin or
+    least connections) and falls back to the primary when there are none, when the
+    replica cannot be reached, or when `user_id` wrote within the read-your-writes window.
+    """
+    replica = None
+    if user_id is None or recent_writers.get(str(user_id)) is None:
+        replica = _pick_replica()
+
+    if replica is not None:
+        async with replica.sessionmaker() as session:
+            try:
+                await session.connection()
+            except (exc.SQLAlchemyError, OSError) as e:
+                replica.down_until = time.monotonic() + settings.DB_REPLICA_RETRY_SECONDS
+                logger.warning("Replica %s unavailable, using primary: %s", replica.engine.url.host, e)
+            else:
+                yield session
+                return
+
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+class SavepointSession(AsyncSession):
+    """
+    Session of savepoint_session(). While `defer_commits` is set, commit() only
+    flushes, so a unit of work made of service calls that each commit stays
+    inside one SAVEPOINT until its owner commits (releases) or rolls it back.
+    """
+
+    defer_commits = False
+
+    async def commit(self):
+        if self.defer_commits:
+            await self.flush()
+            return
+        await super().commit()
+
+
+@asynccontextmanager
+async def savepoint_session() -> AsyncIterator[Tuple[SavepointSession, AsyncTransaction]]:
+    """
+    Primary session joined to an outer transaction that the caller owns.
+    Inside it, session.commit() only releases a SAVEPOINT and session.rollback()
+    rolls back to it, so service methods that commit can be composed into one
+    transaction (see app/services/batch_service.py). The caller commits or rolls
+    back the yielded outer transaction; it is rolled back if still open on exit.
+    """
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        session = SavepointSession(
+            bind=conn,
+            sync_session_class=PrimarySession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session, outer
+        finally:
+            await session.close()
+            if outer.is_active:
+                await outer.rollback()
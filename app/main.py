@@ -7,6 +7,15 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.logging_config import configure_logging
 from app.core.config import settings
+from app.core.cache import principal_cache
+from app.db.session import pool_stats
+from app.db.instrumentation import SQLInstrumentationMiddleware, sql_route_stats
+from app.core.security import hash_pool_stats, shutdown_hash_executor, token_cache
+from app.core.idempotency import IdempotencyMiddleware, idempotency_store
+from app.services.read_cache import task_cache, project_cache
+from app.db import invalidation
+from app.services.change_feed import change_feed
+from app.services import outbox, activity_service
 from app.api.v1 import api_router  # api_router from app/api/v1/__init__.py
 
 # configure logging early
@@ -24,6 +33,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# per-request SQL counters (Server-Timing header in DEBUG)
+app.add_middleware(SQLInstrumentationMiddleware)
+
+# Idempotency-Key replays for create endpoints (outermost, so replays skip everything else)
+app.add_middleware(IdempotencyMiddleware, paths=("/api/v1/tasks/", "/api/v1/projects/"))
+
 # include routers
 app.include_router(api_router, prefix="/api/v1")
 
@@ -32,13 +47,42 @@ app.include_router(api_router, prefix="/api/v1")
 async def healthz():
     return {"status": "ok"}
 
+# in-process counters (per worker)
+@app.get("/metrics")
+async def metrics():
+    return {
+        "db_pool": pool_stats(),
+        "principal_cache": principal_cache.stats(),
+        "password_hash_pool": hash_pool_stats(),
+        "token_cache": token_cache.stats(),
+        "idempotency": idempotency_store.stats(),
+        "read_cache": {"task": task_cache.stats(), "project": project_cache.stats()},
+        "invalidation": invalidation.listener.stats() if invalidation.listener else None,
+        "change_feed": change_feed.stats(),
+        "outbox": outbox.dispatcher.stats() if outbox.dispatcher else None,
+        "activity_partitions": activity_service.maintenance.stats() if activity_service.maintenance else None,
+        "sql_by_route": sql_route_stats(),
+    }
+
 # startup/shutdown hooks (optional)
 @app.on_event("startup")
 async def on_startup():
     logger.info("Starting app: %s", settings.APP_NAME)
+    # one LISTEN connection per worker for cross-worker cache invalidation
+    invalidation.start_listener()
+    # outbox dispatcher; workers share the table safely (SKIP LOCKED)
+    outbox.start_dispatcher()
+    # monthly activity partitions: refuse to start without next month's, then
+    # create ahead and drop expired in the background (one worker at a time)
+    await activity_service.check_partitions()
+    activity_service.start_maintenance()
     # e.g., warm caches, connect to external services, run migrations check etc.
 
 @app.on_event("shutdown")
 async def on_shutdown():
     logger.info("Shutting down app")
+    shutdown_hash_executor()
+    await invalidation.stop_listener()
+    await outbox.stop_dispatcher()
+    await activity_service.stop_maintenance()
     # e.g., close connections if needed
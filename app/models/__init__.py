@@ -0,0 +1,10 @@
+# app/models/__init__.py
+# Import every model so string relationship targets resolve when mappers configure
+from .user import User
+from .project import Project
+from .task import Task, task_assignments, task_tags
+from .tags import Tag
+from .comment import Comment
+from .outbox import OutboxEvent
+from .activity import TaskActivity
+from .idempotency import IdempotencyKey
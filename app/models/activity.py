@@ -0,0 +1,30 @@
+# app/models/activity.py
+from sqlalchemy import Column, BigInteger, Text, TIMESTAMP, JSON, Sequence, func, Index, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.db.base import Base
+
+class TaskActivity(Base):
+    """
+    Append-only task history, range-partitioned by month on created_at
+    (see app/db/partitions.py and the Alembic migration). The primary key has
+    to include the partition key. There are no foreign keys: history outlives
+    the tasks and projects it describes, and partitions can be dropped freely.
+    """
+    __tablename__ = "task_activity"
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "created_at"),
+        # keyset pages per task / per project, newest first
+        Index("ix_task_activity_task_id_created_at_id", "task_id", "created_at", "id"),
+        Index("ix_task_activity_project_id_created_at_id", "project_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    id = Column(BigInteger, Sequence("task_activity_id_seq"), nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+
+    task_id = Column(BigInteger, nullable=False)
+    project_id = Column(BigInteger, nullable=False)
+    actor_id = Column(BigInteger, nullable=True)
+    action = Column(Text, nullable=False)  # created, updated, status_changed, assigned, deleted
+    changes = Column(JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"), nullable=True)  # {field: [old, new]} or action details
@@ -0,0 +1,29 @@
+# app/models/idempotency.py
+from sqlalchemy import Column, SmallInteger, Text, TIMESTAMP, JSON, LargeBinary, Index, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.db.base import Base
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key claims and stored responses, shared by every worker
+    (see app/core/idempotency.py). A row with no status is a request still in
+    progress. expires_at ends the claim (so a crashed worker does not block the
+    key for long) or, once the response is stored, its replay window.
+    """
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        PrimaryKeyConstraint("caller", "key"),
+        # purge of expired rows
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+
+    caller = Column(Text, nullable=False)  # token subject
+    key = Column(Text, nullable=False)
+    fingerprint = Column(Text, nullable=False)  # sha256 of path + request body
+
+    status = Column(SmallInteger, nullable=True)  # NULL while in progress
+    headers = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # [[name, value], ...] (latin-1)
+    body = Column(LargeBinary, nullable=True)
+
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False)
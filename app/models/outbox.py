@@ -0,0 +1,27 @@
+# app/models/outbox.py
+from sqlalchemy import Column, BigInteger, SmallInteger, Text, TIMESTAMP, JSON, func, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.db.base import Base
+
+class OutboxEvent(Base):
+    """
+    Domain events written in the same transaction as the change they describe,
+    delivered later by the outbox dispatcher (app/services/outbox.py).
+    Rows are deleted once delivered.
+    """
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # claim scan: pending rows that are due
+        Index("ix_outbox_events_pending", "available_at", "id", postgresql_where=text("dead_at IS NULL")),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    topic = Column(Text, nullable=False)  # e.g. "task.created"
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    available_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())  # not claimable before
+    attempts = Column(SmallInteger, nullable=False, server_default="0")
+    last_error = Column(Text, nullable=True)
+    dead_at = Column(TIMESTAMP(timezone=True), nullable=True)  # gave up after OUTBOX_MAX_ATTEMPTS
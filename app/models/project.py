@@ -1,11 +1,14 @@
 # app/models/project.py
-from sqlalchemy import Column, BigInteger, Text, TIMESTAMP, func, ForeignKey
+from sqlalchemy import Column, BigInteger, Text, TIMESTAMP, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_owner_id_id", "owner_id", "id"),  # keyset pagination per owner
+    )
     
     id = Column(BigInteger, primary_key=True, index=True)
     name = Column(Text, nullable=False)
@@ -31,6 +31,7 @@ class Task(Base):
     __tablename__ = "tasks"
     __table_args__ =(
         Index("ix_tasks_project_id_status", "project_id", "status", "due_at"),
+        Index("ix_tasks_created_at_id", "created_at", "id"),  # keyset pagination
     )
     
     id = Column(BigInteger, primary_key=True, index=True)
@@ -60,11 +61,17 @@ class Task(Base):
 
 
       # many-to-many / associations
-    assignees = relationship("User", secondary=task_assignments, lazy="select")
-    tags = relationship("Tag", secondary=task_tags, lazy="select")
+    # noload by default; readers opt in per query with selectinload (see TaskService include=)
+    assignees = relationship(
+        "User",
+        secondary=task_assignments,
+        primaryjoin=lambda: Task.id == task_assignments.c.task_id,
+        secondaryjoin="User.id == task_assignments.c.user_id",  # not assigned_by
+        lazy="noload",
+    )
+    tags = relationship("Tag", secondary=task_tags, lazy="noload")
 
-    comments = relationship("Comment", back_populates="task", cascade="all, delete-orphan")
-    attachments = relationship("Attachment", back_populates="task", cascade="all, delete-orphan")
+    comments = relationship("Comment", back_populates="task", cascade="all, delete-orphan", lazy="noload")
 
     # self-referential parent/children
     parent = relationship("Task", remote_side=[id], backref="subtasks")
\ No newline at end of file
@@ -19,4 +19,6 @@ class User(Base):
     
      # relationships (backrefs defined on other models)
     projects = relationship("Project", back_populates="owner", lazy="noload")
-    created_tasks = relationship("Task", back_populates="creator", lazy="noload")
\ No newline at end of file
+    created_tasks = relationship("Task", back_populates="creator", lazy="noload")
+    comments = relationship("Comment", back_populates="user", lazy="noload")
+    tags = relationship("Tag", back_populates="owner", lazy="noload")
\ No newline at end of file
@@ -0,0 +1,47 @@
+# app/repositories/activity_repo.py
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.pagination import decode_cursor
+from app.models.activity import TaskActivity
+from app.repositories.base import BaseRepository, _chunks
+
+ACTIVITY_SORT = "-created_at"  # newest first
+
+
+class ActivityRepository(BaseRepository[TaskActivity]):
+    sortable_fields = ("created_at",)
+
+    def __init__(self):
+        super().__init__(TaskActivity)
+
+    async def add_many(self, db: AsyncSession, rows: Sequence[dict]) -> None:
+        """
+        Append rows (same keys each) as multi-row INSERT ... VALUES statements of
+        DB_BULK_CHUNK_SIZE rows, without committing. created_at comes from the
+        database, so one transaction's rows share a timestamp and are ordered by id.
+        """
+        for chunk in _chunks(list(rows), settings.DB_BULK_CHUNK_SIZE):
+            await db.execute(insert(TaskActivity).values(list(chunk)))
+
+    async def list_page(
+        self, db: AsyncSession, filters: Sequence[Any], since: datetime, limit: int = 50, cursor: Optional[str] = None,
+    ) -> Tuple[List[TaskActivity], Optional[str]]:
+        """
+        Keyset page, newest first, of rows matching `filters` created at or after
+        `since`. Plain bounds on created_at (since, and the cursor's position) let
+        the planner prune partitions; the row comparison used for the keyset cannot.
+        """
+        bounds = [TaskActivity.created_at >= since]
+        if cursor:
+            value, _ = decode_cursor(cursor, ACTIVITY_SORT)
+            if not isinstance(value, str):
+                raise ValueError("Invalid cursor")
+            bounds.append(TaskActivity.created_at <= datetime.fromisoformat(value))
+        return await self.list_keyset(db, limit=limit, cursor=cursor, sort=ACTIVITY_SORT, filters=[*filters, *bounds])
+
+
+activity_repo = ActivityRepository()
@@ -1,41 +1,211 @@
 # app/repositories/base.py
-from typing import Generic, Type, TypeVar, Optional, List
+from datetime import datetime
+from typing import Any, Dict, Generic, Iterable, Iterator, Sequence, Set, Type, TypeVar, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete, tuple_, values, column, cast
 from sqlalchemy.orm import DeclarativeMeta
 
+from app.core.config import settings
+from app.core.pagination import encode_cursor, decode_cursor
+from app.repositories.loader import loader_for
+
 ModelType = TypeVar("ModelType", bound=DeclarativeMeta)
 
 
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 class BaseRepository(Generic[ModelType]):
+    # columns accepted as keyset sort keys (prefix with "-" for descending)
+    sortable_fields: Tuple[str, ...] = ("id",)
+
     def  __init__(self, model: Type[ModelType]):
         self.model = model
-        
-        
-    async def get(self, db:AsyncSession, id:int)-> Optional[ModelType]:
-        result = await db.execute(select(self.model).where(self.model.id == id))
-        return result.scalar_one_or_none()
-
-    
-    async def list(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        result = await db.execute(select(self.model).offset(skip).limit(limit))
+
+
+    async def get(self, db:AsyncSession, id:int, options: Sequence[Any] = (), columns: Optional[Sequence[str]] = None)-> Optional[Any]:
+        result = await db.execute(self._select(columns).where(self.model.id == id).options(*options))
+        return result.one_or_none() if columns is not None else result.scalar_one_or_none()
+
+    async def reload(self, db: AsyncSession, id: int, options: Sequence[Any] = ()) -> Optional[ModelType]:
+        """get() that also overwrites the copy already in the session (columns and the relations in `options`)."""
+        stmt = select(self.model).where(self.model.id == id).options(*options).execution_options(populate_existing=True)
+        return (await db.execute(stmt)).scalar_one_or_none()
+
+    async def get_many(self, db: AsyncSession, ids: Sequence[int]) -> List[ModelType]:
+        if not ids:
+            return []
+        result = await db.execute(select(self.model).where(self.model.id.in_(list(ids))))
         return result.scalars().all()
-    
+
+    async def existing_ids(self, db: AsyncSession, ids: Iterable[int]) -> Set[int]:
+        """The subset of `ids` that exist, from an index-only lookup."""
+        ids = set(ids)
+        if not ids:
+            return set()
+        result = await db.execute(select(self.model.id).where(self.model.id.in_(ids)))
+        return set(result.scalars().all())
+
+    async def load(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        """
+        Like get(), but batched with other load() calls in the same tick and
+        memoized for the rest of the request (see app/repositories/loader.py).
+        """
+        return await loader_for(db, self).load(id)
+
+
+    def _select(self, columns: Optional[Sequence[str]] = None):
+        """select() of full ORM rows, or of just `columns` (returned as Core rows)."""
+        if columns is None:
+            return select(self.model)
+        return select(*(getattr(self.model, c) for c in columns))
+
+    async def list(self, db: AsyncSession, skip: int = 0, limit: int = 100, columns: Optional[Sequence[str]] = None,
+                   options: Sequence[Any] = ()) -> List[Any]:
+        result = await db.execute(self._select(columns).options(*options).order_by(self.model.id).offset(skip).limit(limit))
+        return result.all() if columns is not None else result.scalars().all()
+
+    async def list_keyset(
+        self,
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        sort: str = "id",
+        filters: Iterable[Any] = (),
+        columns: Optional[Sequence[str]] = None,
+        options: Sequence[Any] = (),
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Cursor pagination on (sort key, id). Returns the page and the cursor for
+        the next one (None on the last page). Raises ValueError on a bad sort/cursor.
+        With `columns`, only those columns are selected and Core rows are returned
+        (id and the sort key are always included).
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        field = sort[1:] if sort.startswith("-") else sort
+        descending = sort.startswith("-")
+        if field not in self.sortable_fields:
+            raise ValueError(f"Cannot sort by {field!r}")
+
+        id_col = self.model.id
+        col = getattr(self.model, field)
+        keys = (col,) if field == "id" else (col, id_col)
+
+        if columns is not None:
+            columns = list(dict.fromkeys(["id", field, *columns]))
+        stmt = self._select(columns).where(*filters).options(*options)
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort)
+            if field == "id":
+                stmt = stmt.where(id_col < last_id if descending else id_col > last_id)
+            else:
+                if isinstance(value, str) and col.type.python_type is datetime:
+                    value = datetime.fromisoformat(value)
+                after = tuple_(col, id_col) < tuple_(value, last_id) if descending else tuple_(col, id_col) > tuple_(value, last_id)
+                stmt = stmt.where(after)
+
+        stmt = stmt.order_by(*(k.desc() if descending else k for k in keys)).limit(limit + 1)
+        result = await db.execute(stmt)
+        rows = result.all() if columns is not None else result.scalars().all()
+
+        next_cursor = None
+        if rows and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(sort, getattr(last, field), last.id)
+        return rows, next_cursor
+
     async def create(self, db: AsyncSession, obj_in: dict) -> ModelType:
         db_obj = self.model(**obj_in)
         db.add(db_obj)
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
-    
+
     async def update(self, db: AsyncSession, db_obj: ModelType, obj_in: dict) -> ModelType:
-        for field, value in obj_in.item():
+        for field, value in obj_in.items():
             setattr(db_obj, field, value)
         db.add(db_obj)
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
-    
+
     async def delete(self, db: AsyncSession, id: int) -> None:
         await db.execute(delete(self.model).where(self.model.id == id))
-        await db.commit()
\ No newline at end of file
+        await db.commit()
+
+    async def bulk_create(self, db: AsyncSession, objs_in: Sequence[dict], chunk_size: Optional[int] = None) -> List[ModelType]:
+        """
+        Multi-row INSERT ... RETURNING, one round trip per chunk, single commit.
+        Returns the created rows in input order.
+        """
+        if not objs_in:
+            return []
+        size = chunk_size or settings.DB_BULK_CHUNK_SIZE
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        created: List[ModelType] = []
+        for chunk in _chunks(list(objs_in), size):
+            result = await db.scalars(stmt, list(chunk))
+            created.extend(result.all())
+        await db.commit()
+        return created
+
+    async def bulk_update(self, db: AsyncSession, objs_in: Sequence[dict], chunk_size: Optional[int] = None) -> int:
+        """
+        Update rows by id with UPDATE ... FROM (VALUES ...), one statement per chunk.
+        Each dict needs "id" plus the columns to set; rows with the same set of
+        columns are sent together. Returns the number of rows updated.
+
+        Models with a `version` column get version = version + 1 (unless the rows
+        set it), like a single-row update, so ETags and optimistic locks see the
+        change. Callers still publish_invalidation() the ids for the read caches.
+        """
+        if not objs_in:
+            return 0
+        size = chunk_size or settings.DB_BULK_CHUNK_SIZE
+        table = self.model.__table__
+        versioned = "version" in table.c
+
+        groups: Dict[Tuple[str, ...], List[dict]] = {}
+        for obj in objs_in:
+            fields = tuple(sorted(k for k in obj if k != "id"))
+            if fields:
+                groups.setdefault(fields, []).append(obj)
+
+        updated = 0
+        for fields, rows in groups.items():
+            for chunk in _chunks(rows, size):
+                data = values(
+                    column("id", table.c.id.type),
+                    *(column(f, table.c[f].type) for f in fields),
+                    name="data",
+                ).data([(row["id"], *(row[f] for f in fields)) for row in chunk])
+                stmt = (
+                    update(table)
+                    .where(table.c.id == data.c.id)
+                    # cast: an all-NULL VALUES column would otherwise be typed as text
+                    .values({f: cast(data.c[f], table.c[f].type) for f in fields})
+                )
+                if versioned and "version" not in fields:
+                    stmt = stmt.values(version=table.c.version + 1)
+                result = await db.execute(stmt)
+                updated += result.rowcount
+        await db.commit()
+        return updated
+
+    async def bulk_delete(self, db: AsyncSession, ids: Sequence[int], chunk_size: Optional[int] = None) -> int:
+        """
+        DELETE ... WHERE id IN (...), one statement per chunk. Returns rows deleted.
+        """
+        if not ids:
+            return 0
+        size = chunk_size or settings.DB_BULK_CHUNK_SIZE
+        deleted = 0
+        for chunk in _chunks(list(ids), size):
+            result = await db.execute(delete(self.model).where(self.model.id.in_(chunk)))
+            deleted += result.rowcount
+        await db.commit()
+        return deleted
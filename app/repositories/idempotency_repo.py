@@ -0,0 +1,62 @@
+# app/repositories/idempotency_repo.py
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.idempotency import IdempotencyKey
+from app.repositories.base import BaseRepository
+
+
+class IdempotencyRepository(BaseRepository[IdempotencyKey]):
+    def __init__(self):
+        super().__init__(IdempotencyKey)
+
+    async def claim(self, db: AsyncSession, caller: str, key: str, fingerprint: str,
+                    now: datetime, until: datetime) -> Optional[Any]:
+        """
+        Claim (caller, key) until `until` (no commit). Returns None when the claim
+        is ours: the key was free, or its previous row has expired. Otherwise
+        returns the current row (fingerprint, status, headers, body); status is
+        None while its request is still in progress.
+        """
+        t = IdempotencyKey
+        stmt = pg_insert(t).values(caller=caller, key=key, fingerprint=fingerprint, expires_at=until)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[t.caller, t.key],
+            set_={"fingerprint": stmt.excluded.fingerprint, "status": None, "headers": None, "body": None,
+                  "expires_at": stmt.excluded.expires_at},
+            where=t.expires_at <= now,
+        ).returning(t.caller)
+        if (await db.execute(stmt)).first() is not None:
+            return None
+        row = (await db.execute(
+            select(t.fingerprint, t.status, t.headers, t.body).where(t.caller == caller, t.key == key)
+        )).first()
+        return row
+
+    async def complete(self, db: AsyncSession, caller: str, key: str, fingerprint: str, status: int,
+                       headers: List[Tuple[str, str]], body: bytes, expires_at: datetime) -> None:
+        """Store the response of our in-progress claim (no commit)."""
+        t = IdempotencyKey
+        await db.execute(
+            update(t)
+            .where(t.caller == caller, t.key == key, t.fingerprint == fingerprint, t.status.is_(None))
+            .values(status=status, headers=[list(h) for h in headers], body=body, expires_at=expires_at)
+        )
+
+    async def release(self, db: AsyncSession, caller: str, key: str, fingerprint: str) -> None:
+        """Drop our in-progress claim without a response, so the key can be retried (no commit)."""
+        t = IdempotencyKey
+        await db.execute(
+            delete(t).where(t.caller == caller, t.key == key, t.fingerprint == fingerprint, t.status.is_(None))
+        )
+
+    async def delete_expired(self, db: AsyncSession, now: datetime) -> int:
+        """Delete expired rows (no commit); returns how many."""
+        result = await db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now))
+        return result.rowcount
+
+
+idempotency_repo = IdempotencyRepository()
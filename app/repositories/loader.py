@@ -0,0 +1,154 @@
+# app/repositories/loader.py
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from app.repositories.base import BaseRepository
+
+ModelType = TypeVar("ModelType")
+
+
+class RepositoryLoader(Generic[ModelType]):
+    """
+    Request-scoped batching loader (DataLoader pattern) for one repository.
+
+    load_many(ids) fetches every id it has not seen with one `WHERE id IN (...)`
+    query; load(id) calls made in the same event-loop tick join a single batch.
+    The query runs in the task of the caller that drains the batch, one at a
+    time (the session is not safe for concurrent use), and the other callers
+    await its futures. A caller cancelled before its batch is fetched takes its
+    ids back out; anyone waiting on them queues them again. Results, misses
+    included, are memoized until the session writes (see `_clear_on_write`).
+    Loaders live in `db.info`, so their lifetime is the request's session. Get one with `loader_for(db, repo)` or
+    simply call `repo.load(db, id)`.
+    """
+
+    def __init__(self, repo: "BaseRepository", db: AsyncSession):
+        self.repo = repo
+        self.db = db
+        self._futures: Dict[Any, asyncio.Future] = {}
+        self._queue: List[Any] = []
+        self._lock = asyncio.Lock()
+
+    async def load(self, id: Any) -> Optional[ModelType]:
+        return (await self.load_many([id]))[0]
+
+    async def load_many(self, ids: Sequence[Any]) -> List[Optional[ModelType]]:
+        while True:
+            futures, queued = self._enqueue(ids)
+            if queued:
+                try:
+                    await asyncio.sleep(0)  # let loads started in the same tick join this batch
+                    await self._drain()
+                except asyncio.CancelledError:
+                    self._abandon(queued)
+                    raise
+            try:
+                return [await fut for fut in futures]
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling() or not any(f.cancelled() for f in futures):
+                    raise
+                # we joined a batch whose owner was cancelled before fetching it: queue again
+
+    def _enqueue(self, ids: Sequence[Any]) -> Tuple[List[asyncio.Future], List[Any]]:
+        """Futures for `ids`, plus the ids this call queued (not memoized or pending yet)."""
+        loop = asyncio.get_running_loop()
+        futures, queued = [], []
+        for i in ids:
+            fut = self._futures.get(i)
+            if fut is None:
+                fut = self._futures[i] = loop.create_future()
+                self._queue.append(i)
+                queued.append(i)
+            futures.append(fut)
+        return futures, queued
+
+    def _abandon(self, ids: List[Any]) -> None:
+        """
+        The caller that queued `ids` was cancelled before a batch fetched them: drop
+        them and cancel their futures, so other waiters queue them again instead of
+        waiting for a fetch that will never run.
+        """
+        for i in ids:
+            if i in self._queue:
+                self._queue.remove(i)
+                fut = self._futures.pop(i, None)
+                if fut is not None and not fut.done():
+                    fut.cancel()
+
+    def prime(self, obj: ModelType) -> None:
+        """Seed the memo with an already-loaded row."""
+        fut = self._futures.get(obj.id)
+        if fut is None or fut.done():
+            fut = asyncio.get_running_loop().create_future()
+            fut.set_result(obj)
+            self._futures[obj.id] = fut
+
+    def clear(self, id: Any = None) -> None:
+        """Forget one memoized id (or all of them), e.g. after a write."""
+        if id is None:
+            self._futures = {k: f for k, f in self._futures.items() if not f.done()}
+        elif id in self._futures and self._futures[id].done():
+            del self._futures[id]
+
+    async def _drain(self) -> None:
+        async with self._lock:
+            if not self._queue:
+                return  # another caller's batch already covered ours
+            ids, self._queue = self._queue, []
+            await self._fetch(ids)
+
+    async def _fetch(self, ids: List[Any]) -> None:
+        try:
+            rows = await self.repo.get_many(self.db, ids)
+        except BaseException as e:
+            for i in ids:
+                fut = self._futures.pop(i, None)
+                if fut is not None and not fut.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        fut.cancel()
+                    else:
+                        fut.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        by_id = {row.id: row for row in rows}
+        for i in ids:
+            fut = self._futures.get(i)
+            if fut is not None and not fut.done():
+                fut.set_result(by_id.get(i))
+
+
+def loader_for(db: AsyncSession, repo: "BaseRepository") -> RepositoryLoader:
+    loaders = db.info.setdefault("loaders", {})
+    loader = loaders.get(id(repo))
+    if loader is None:
+        loader = loaders[id(repo)] = RepositoryLoader(repo, db)
+    return loader
+
+
+def _clear_loaders(session: Session) -> None:
+    for loader in session.info.get("loaders", {}).values():
+        loader.clear()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _clear_on_write(state) -> None:
+    # INSERT/UPDATE/DELETE statements; unit-of-work writes are covered by after_flush
+    if state.is_insert or state.is_update or state.is_delete:
+        _clear_loaders(state.session)
+
+
+@event.listens_for(Session, "after_flush")
+def _clear_after_flush(session: Session, flush_context) -> None:
+    _clear_loaders(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_after_rollback(session: Session) -> None:
+    _clear_loaders(session)
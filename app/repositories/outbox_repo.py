@@ -0,0 +1,60 @@
+# app/repositories/outbox_repo.py
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+
+from app.models.outbox import OutboxEvent
+from app.repositories.base import BaseRepository
+
+
+class OutboxRepository(BaseRepository[OutboxEvent]):
+    def __init__(self):
+        super().__init__(OutboxEvent)
+
+    async def claim(self, db: AsyncSession, limit: int, now: datetime, lease: timedelta) -> List[Any]:
+        """
+        Lease up to `limit` due rows (oldest first) to the caller and return them
+        (id, topic, payload, created_at, attempts). Concurrent claimers skip rows
+        that another claim has locked (FOR UPDATE SKIP LOCKED). Rows whose lease
+        runs out without being completed become due again.
+        """
+        due = (
+            select(OutboxEvent.id)
+            .where(OutboxEvent.dead_at.is_(None), OutboxEvent.available_at <= now)
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(due.scalar_subquery()))
+            .values(available_at=now + lease, attempts=OutboxEvent.attempts + 1)
+            .returning(OutboxEvent.id, OutboxEvent.topic, OutboxEvent.payload, OutboxEvent.created_at, OutboxEvent.attempts)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        rows = sorted(result.all(), key=lambda r: r.id)
+        await db.commit()
+        return rows
+
+    async def complete(self, db: AsyncSession, ids: Sequence[int]) -> None:
+        """Delete delivered rows (no commit)."""
+        if ids:
+            await db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(list(ids))))
+
+    async def reschedule(self, db: AsyncSession, rows: Sequence[Dict[str, Any]]) -> None:
+        """
+        Record failed deliveries (no commit): dicts of id, available_at, dead_at and
+        last_error, applied as one executemany UPDATE by primary key.
+        """
+        if rows:
+            await db.execute(update(OutboxEvent), list(rows))
+
+    async def delete_older_than(self, db: AsyncSession, cutoff: datetime) -> int:
+        """Delete rows created before `cutoff` (parked or never delivered; no commit); returns how many."""
+        result = await db.execute(delete(OutboxEvent).where(OutboxEvent.created_at < cutoff))
+        return result.rowcount
+
+
+outbox_repo = OutboxRepository()
@@ -1,5 +1,5 @@
 # app/repositories/project_repo.py
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
 
@@ -8,12 +8,19 @@ from app.models.project import Project
 from app.repositories.base import BaseRepository
 
 class ProjectRepository(BaseRepository[Project]):
+    sortable_fields = ("id", "created_at")
+
     def __init__(self):
         super().__init__(Project)
 
-    async def list_for_owner(self, db: AsyncSession, owner_id: int, skip: int = 0, limit: int = 100) -> List[Project]:
-        q = await db.execute(select(Project).where(Project.owner_id == owner_id).offset(skip).limit(limit))
-        return q.scalars().all()
+    async def list_for_owner(self, db: AsyncSession, owner_id: int, skip: int = 0, limit: int = 100,
+                             columns: Optional[Sequence[str]] = None) -> List[Any]:
+        q = await db.execute(self._select(columns).where(Project.owner_id == owner_id).order_by(Project.id).offset(skip).limit(limit))
+        return q.all() if columns is not None else q.scalars().all()
+
+    async def list_for_owner_keyset(self, db: AsyncSession, owner_id: int, limit: int = 100, cursor: Optional[str] = None, sort: str = "id",
+                                    columns: Optional[Sequence[str]] = None) -> Tuple[List[Any], Optional[str]]:
+        return await self.list_keyset(db, limit=limit, cursor=cursor, sort=sort, filters=[Project.owner_id == owner_id], columns=columns)
 
     async def update_by_id(self, db: AsyncSession, project_id: int, patch: dict) -> Optional[Project]:
         # simple update using ORM object
@@ -0,0 +1,11 @@
+# app/repositories/tag_repo.py
+from app.models.tags import Tag
+from app.repositories.base import BaseRepository
+
+
+class TagRepository(BaseRepository[Tag]):
+    def __init__(self):
+        super().__init__(Tag)
+
+
+tag_repo = TagRepository()
@@ -1,16 +1,163 @@
 # app/repositories/task_repo.py
+from typing import Any, AsyncIterator, Dict, Iterable, List, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, delete, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.models.task import Task
-from app.repositories.base import BaseRepository
+from app.core.config import settings
+from app.models.task import Task, task_assignments, task_tags
+from app.models.comment import Comment
+from app.repositories.base import BaseRepository, _chunks
 
 class TaskRepository(BaseRepository[Task]):
+    sortable_fields = ("id", "created_at")
+
     def __init__(self):
         super().__init__(Task)
         
     async def get_by_owner(self, db: AsyncSession, owner_id: int):
         result = await db.execute(select(Task).where(Task.owner_id == owner_id))
         return result.scalars().all()
-    
+
+    async def project_ids(self, db: AsyncSession, task_ids: Iterable[int]) -> Dict[int, int]:
+        """task id -> project id for the tasks in `task_ids` that exist."""
+        task_ids = set(task_ids)
+        if not task_ids:
+            return {}
+        result = await db.execute(select(Task.id, Task.project_id).where(Task.id.in_(task_ids)))
+        return dict(result.all())
+
+    async def link_ids(self, db: AsyncSession, task_ids: Sequence[int], relation: str) -> Dict[int, List[int]]:
+        """
+        task id -> ids of its linked users (relation "assignees") or tags ("tags"),
+        read from the association table in one query for all `task_ids`.
+        """
+        table, other_col = (task_assignments, task_assignments.c.user_id) if relation == "assignees" else (task_tags, task_tags.c.tag_id)
+        if not task_ids:
+            return {}
+        result = await db.execute(
+            select(table.c.task_id, other_col).where(table.c.task_id.in_(list(task_ids))).order_by(table.c.task_id, other_col)
+        )
+        links: Dict[int, List[int]] = {}
+        for task_id, other_id in result:
+            links.setdefault(task_id, []).append(other_id)
+        return links
+
+    async def comments_for(self, db: AsyncSession, task_ids: Sequence[int]) -> Dict[int, List[Comment]]:
+        """task id -> its comments (oldest first), one query for all `task_ids`."""
+        if not task_ids:
+            return {}
+        result = await db.execute(select(Comment).where(Comment.task_id.in_(list(task_ids))).order_by(Comment.task_id, Comment.id))
+        comments: Dict[int, List[Comment]] = {}
+        for comment in result.scalars():
+            comments.setdefault(comment.task_id, []).append(comment)
+        return comments
+
+    async def stream_for_project(self, db: AsyncSession, project_id: int, columns: Sequence[str]) -> AsyncIterator[Sequence[Any]]:
+        """
+        Yield a project's tasks (as Core rows of `columns`, ordered by id) in
+        batches of DB_STREAM_YIELD_PER, read from a server-side cursor so memory
+        does not grow with the project.
+        """
+        stmt = (
+            self._select(columns)
+            .where(Task.project_id == project_id)
+            .order_by(Task.id)
+            .execution_options(yield_per=settings.DB_STREAM_YIELD_PER)
+        )
+        result = await db.stream(stmt)
+        try:
+            async for batch in result.partitions():
+                yield batch
+        finally:
+            await result.close()
+
+    async def import_batch(
+        self,
+        db: AsyncSession,
+        rows: Sequence[dict],
+        assignee_ids: Sequence[Sequence[int]],
+        tag_ids: Sequence[Sequence[int]],
+        assigned_by: Any = None,
+    ) -> List[int]:
+        """
+        Insert tasks plus their assignment and tag rows, without committing.
+        `assignee_ids[i]` / `tag_ids[i]` belong to `rows[i]`; all rows must share keys.
+        On asyncpg, ids are reserved from the tasks sequence and all three tables
+        are loaded with COPY; other drivers fall back to INSERT ... RETURNING.
+        Returns the new task ids in row order.
+        """
+        if not rows:
+            return []
+        columns = list(rows[0])
+        conn = await db.connection()
+
+        if conn.dialect.driver == "asyncpg":
+            result = await db.execute(
+                text("SELECT nextval(pg_get_serial_sequence('tasks', 'id')) FROM generate_series(1, :n)"),
+                {"n": len(rows)},
+            )
+            ids = list(result.scalars().all())
+            raw = (await conn.get_raw_connection()).driver_connection
+            await raw.copy_records_to_table(
+                Task.__tablename__,
+                columns=["id", *columns],
+                records=[(tid, *(row[c] for c in columns)) for tid, row in zip(ids, rows)],
+            )
+            assignments = [(tid, uid, assigned_by) for tid, uids in zip(ids, assignee_ids) for uid in uids]
+            if assignments:
+                await raw.copy_records_to_table(
+                    task_assignments.name, columns=["task_id", "user_id", "assigned_by"], records=assignments,
+                )
+            tagged = [(tid, tag_id) for tid, tags in zip(ids, tag_ids) for tag_id in tags]
+            if tagged:
+                await raw.copy_records_to_table(task_tags.name, columns=["task_id", "tag_id"], records=tagged)
+            return ids
+
+        result = await db.execute(insert(Task).returning(Task.id, sort_by_parameter_order=True), list(rows))
+        ids = list(result.scalars().all())
+        assignments = [
+            {"task_id": tid, "user_id": uid, "assigned_by": assigned_by} for tid, uids in zip(ids, assignee_ids) for uid in uids
+        ]
+        if assignments:
+            await db.execute(insert(task_assignments), assignments)
+        tagged = [{"task_id": tid, "tag_id": tag_id} for tid, tags in zip(ids, tag_ids) for tag_id in tags]
+        if tagged:
+            await db.execute(insert(task_tags), tagged)
+        return ids
+
+    async def set_assignees(
+        self, db: AsyncSession, task_ids: Sequence[int], user_ids: Sequence[int],
+        assigned_by: Any = None, replace: bool = True,
+    ) -> None:
+        """
+        Make `user_ids` the assignees of every task in `task_ids` (or just add
+        them, with replace=False). The difference is applied in SQL: one DELETE
+        for users no longer wanted and one multi-row INSERT ... ON CONFLICT DO
+        NOTHING, so rows of users who stay keep their assigned_at/assigned_by.
+        Does not commit.
+        """
+        await self._set_links(
+            db, task_assignments, task_assignments.c.user_id, task_ids, user_ids,
+            extra={"assigned_by": assigned_by}, replace=replace,
+        )
+
+    async def set_tags(self, db: AsyncSession, task_ids: Sequence[int], tag_ids: Sequence[int], replace: bool = True) -> None:
+        """Same as set_assignees, for task_tags."""
+        await self._set_links(db, task_tags, task_tags.c.tag_id, task_ids, tag_ids, replace=replace)
+
+    async def _set_links(self, db: AsyncSession, table, other_col, task_ids, other_ids, extra=None, replace=True) -> None:
+        if not task_ids:
+            return
+        task_ids = list(dict.fromkeys(task_ids))
+        other_ids = list(dict.fromkeys(other_ids))
+        if replace:
+            await db.execute(
+                delete(table).where(table.c.task_id.in_(task_ids), other_col.notin_(other_ids))
+            )
+        rows = [{"task_id": t, other_col.name: o, **(extra or {})} for t in task_ids for o in other_ids]
+        for chunk in _chunks(rows, settings.DB_BULK_CHUNK_SIZE):
+            await db.execute(pg_insert(table).values(list(chunk)).on_conflict_do_nothing())
+
+
 task_repo = TaskRepository()
\ No newline at end of file
@@ -1,6 +1,6 @@
 # app/repositories/user_repo.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete
 
 from app.models.user import User
 from app.repositories.base import BaseRepository
@@ -13,6 +13,21 @@ class UserRepository(BaseRepository[User]):
     async def get_by_email(self, db:AsyncSession, email:str) -> User | None:
         result = await db.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
+
+    async def update_by_id(self, db: AsyncSession, user_id: int, patch: dict) -> User | None:
+        user = await self.get(db, user_id)
+        if user is None:
+            return None
+        for k, v in patch.items():
+            setattr(user, k, v)
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
+        return user
+
+    async def delete_by_id(self, db: AsyncSession, user_id: int) -> None:
+        await db.execute(delete(User).where(User.id == user_id))
+        await db.commit()
     
     
 user_repo = UserRepository()
\ No newline at end of file
@@ -0,0 +1,17 @@
+# app/schemas/activity.py
+from typing import Any, Dict, Optional
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class TaskActivityRead(BaseModel):
+    id: int
+    task_id: int
+    project_id: int
+    actor_id: Optional[int]
+    action: str  # created, updated, status_changed, assigned, deleted
+    changes: Optional[Dict[str, Any]]  # {field: [old, new]} for edits; details for other actions
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
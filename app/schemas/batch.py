@@ -0,0 +1,60 @@
+# app/schemas/batch.py
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from .task import TaskUpdate
+from .project import ProjectUpdate
+
+
+BatchOp = Literal[
+    "task.create",
+    "task.update",
+    "task.assign",
+    "project.create",
+    "project.update",
+    "project.delete",
+]
+
+
+class BatchOperation(BaseModel):
+    op: BatchOp
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    # atomic: stop at the first failure and roll everything back
+    # independent: each operation commits or rolls back on its own
+    mode: Literal["atomic", "independent"] = "atomic"
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=settings.BATCH_MAX_OPERATIONS)
+
+
+class BatchItemResult(BaseModel):
+    index: int
+    op: BatchOp
+    status: int  # HTTP status the equivalent single call would have returned
+    result: Optional[Any] = None
+    error: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    committed: bool
+    results: List[BatchItemResult]
+
+
+# --- params of operations that address an existing row ---
+class TaskUpdateParams(TaskUpdate):
+    task_id: int
+
+
+class TaskAssignParams(BaseModel):
+    task_id: int
+    user_ids: List[int]
+
+
+class ProjectUpdateParams(ProjectUpdate):
+    project_id: int
+
+
+class ProjectDeleteParams(BaseModel):
+    project_id: int
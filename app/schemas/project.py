@@ -9,8 +9,8 @@ class ProjectCreate(BaseModel):
     visibility: Optional[str] = "private"
     
 class ProjectUpdate(BaseModel):
-    name: Optional[str]
-    visibility: Optional[str]
+    name: Optional[str] = None
+    visibility: Optional[str] = None
 
 class ProjectRead(BaseModel):
     id: int
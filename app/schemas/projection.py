@@ -0,0 +1,44 @@
+# app/schemas/projection.py
+"""
+Helpers for serving read DTOs from column-projected rows (see TaskService /
+ProjectService list and get paths) and for the `fields=` sparse fieldset param.
+"""
+from typing import Any, Iterable, List, Optional, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    """
+    Parse 'id,title,status' into a list of field names (always including id).
+    Returns None when no fieldset was requested. Raises ValueError on unknown names.
+    """
+    if not fields:
+        return None
+    names = list(dict.fromkeys(n.strip() for n in fields.split(",") if n.strip()))
+    unknown = [n for n in names if n not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(allowed)})")
+    if "id" not in names:
+        names.insert(0, "id")
+    return names
+
+
+def construct_from_rows(schema: Type[M], rows: Iterable[Any]) -> List[M]:
+    """
+    Build DTOs from Core rows without validation. Columns that were not selected
+    are set to None (nested lists keep their defaults), so the instances stay
+    complete even when only a fieldset is serialized.
+    """
+    out = []
+    for row in rows:
+        values = dict(row._mapping)
+        missing = {
+            name: None
+            for name, field in schema.model_fields.items()
+            if name not in values and field.is_required()
+        }
+        out.append(schema.model_construct(**missing, **values))
+    return out
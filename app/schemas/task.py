@@ -25,17 +25,17 @@ class TaskCreate(BaseModel):
 
 
 class TaskUpdate(BaseModel):
-    title: Optional[str]
-    description: Optional[str]
-    status: Optional[str]
-    priority: Optional[int]
-    due_at: Optional[datetime]
-    start_at: Optional[datetime]
-    estimated_minutes: Optional[int]
-    parent_task_id: Optional[int]
-    version: Optional[int]  # for optimistic locking
-    assignee_ids: Optional[List[int]]
-    tag_ids: Optional[List[int]]
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    priority: Optional[int] = None
+    due_at: Optional[datetime] = None
+    start_at: Optional[datetime] = None
+    estimated_minutes: Optional[int] = None
+    parent_task_id: Optional[int] = None
+    version: Optional[int] = None  # for optimistic locking
+    assignee_ids: Optional[List[int]] = None
+    tag_ids: Optional[List[int]] = None
 
 # --- Read DTO (nested), think: how much to return? ---
 
@@ -65,3 +65,21 @@ class TaskRead(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+# --- Bulk import report ---
+class TaskImportError(BaseModel):
+    row: int  # 1-based data row (NDJSON line / CSV record after the header)
+    errors: List[dict]
+
+
+class TaskImportReport(BaseModel):
+    imported: int
+    failed: int
+    errors: List[TaskImportError] = []  # capped at TASK_IMPORT_MAX_ERRORS
+
+
+class TaskBulkAssign(BaseModel):
+    task_ids: List[int] = Field(..., min_length=1)
+    user_ids: List[int]
+    replace: bool = True  # False only adds users, keeping current assignees
@@ -24,3 +24,19 @@ class UserRead(UserBase):
 
     class Config:
         orm_mode = True
+
+
+
+class Principal(BaseModel):
+    """
+    The authenticated caller (app/api/deps.py). Immutable and detached from any
+    session, so one instance can be cached and shared by concurrent requests;
+    routes that need the full row load it themselves.
+    """
+    id: int
+    email: str
+    name: Optional[str] = None
+
+    class Config:
+        orm_mode = True
+        frozen = True
@@ -0,0 +1,196 @@
+# app/services/activity_service.py
+"""
+Task activity log: what happened to a task, when and by whom.
+
+TaskService appends entries (`activity_entry(...)`) with
+`activity_service.record(db, entries)` right before it commits. The rows are
+one multi-row INSERT in the write's own transaction, so history and data
+cannot disagree. Reads are keyset pages, newest first, per task or per
+project. They are bounded below by `since` (default ACTIVITY_READ_WINDOW_DAYS
+ago) so only recent monthly partitions are scanned.
+
+On PostgreSQL each worker runs `ActivityMaintenance` every
+ACTIVITY_MAINTENANCE_SECONDS. Whichever worker wins an advisory lock creates
+the next ACTIVITY_PARTITIONS_AHEAD monthly partitions and detaches and drops
+those older than ACTIVITY_RETENTION_MONTHS (see app/db/partitions.py).
+There is no DEFAULT partition, so startup fails (check_partitions) rather than
+serve writes that would have nowhere to go.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from pydantic_core import to_jsonable_python
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.partitions import (
+    add_months, drop_partitions_before, ensure_partitions, list_partitions, month_start, partition_name,
+)
+from app.db.session import engine
+from app.models.activity import TaskActivity
+from app.repositories.activity_repo import activity_repo
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_TABLE = TaskActivity.__tablename__
+MAINTENANCE_LOCK_KEY = 0x7461736B  # pg advisory lock id for partition maintenance
+
+
+def activity_entry(task_id: int, project_id: int, actor_id: Optional[int], action: str,
+                   changes: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """One activity row; `changes` is stored as JSON (datetimes become ISO strings)."""
+    return {
+        "task_id": task_id,
+        "project_id": project_id,
+        "actor_id": actor_id,
+        "action": action,
+        "changes": to_jsonable_python(changes) if changes is not None else None,
+    }
+
+
+def diff_changes(obj: Any, patch: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """{field: [old, new]} for the patched attributes of `obj` whose value changes."""
+    return {k: [getattr(obj, k), v] for k, v in patch.items() if getattr(obj, k) != v}
+
+
+class ActivityService:
+    async def record(self, db: AsyncSession, entries: Sequence[Dict[str, Any]]) -> None:
+        """Append `entries` in the caller's transaction (no commit)."""
+        if entries:
+            await activity_repo.add_many(db, entries)
+
+    async def list_for_task(self, db: AsyncSession, task_id: int, limit: int = 50, cursor: Optional[str] = None,
+                            since: Optional[datetime] = None) -> Tuple[List[TaskActivity], Optional[str]]:
+        return await self._page(db, [TaskActivity.task_id == task_id], limit, cursor, since)
+
+    async def list_for_project(self, db: AsyncSession, project_id: int, limit: int = 50, cursor: Optional[str] = None,
+                               since: Optional[datetime] = None) -> Tuple[List[TaskActivity], Optional[str]]:
+        return await self._page(db, [TaskActivity.project_id == project_id], limit, cursor, since)
+
+    @staticmethod
+    async def _page(db: AsyncSession, filters, limit: int, cursor: Optional[str], since: Optional[datetime]):
+        if since is None:
+            since = datetime.now(timezone.utc) - timedelta(days=settings.ACTIVITY_READ_WINDOW_DAYS)
+        try:
+            return await activity_repo.list_page(db, filters, since=since, limit=limit, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+activity_service = ActivityService()
+
+
+class ActivityMaintenance:
+    def __init__(self, interval: float, months_ahead: int, retention_months: int):
+        self.interval = interval
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self._task: Optional[asyncio.Task] = None
+        self.created: List[str] = []
+        self.dropped: List[str] = []
+        self.last_run: Optional[datetime] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Activity partition maintenance failed")
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> bool:
+        """Create upcoming partitions and drop expired ones; False if another worker holds the lock."""
+        now = datetime.now(timezone.utc)
+        this_month = month_start(now)
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            if not await conn.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}):
+                return False
+            try:
+                created = await ensure_partitions(conn, ACTIVITY_TABLE, this_month, self.months_ahead + 1)
+                dropped = []
+                if self.retention_months > 0:
+                    cutoff = add_months(this_month, -self.retention_months)
+                    dropped = await drop_partitions_before(conn, ACTIVITY_TABLE, cutoff)
+            finally:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+        if created or dropped:
+            logger.info("Activity partitions created: %s, dropped: %s", created, dropped)
+        self.created.extend(created)
+        self.dropped.extend(dropped)
+        self.last_run = now
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "created": self.created[-12:],
+            "dropped": self.dropped[-12:],
+        }
+
+
+maintenance: Optional[ActivityMaintenance] = None
+
+
+def start_maintenance() -> Optional[ActivityMaintenance]:
+    """Start this worker's partition maintenance (called from main.on_startup); None when not applicable."""
+    global maintenance
+    if settings.ACTIVITY_MAINTENANCE_SECONDS <= 0 or engine.dialect.name != "postgresql":
+        return None
+    maintenance = ActivityMaintenance(
+        interval=settings.ACTIVITY_MAINTENANCE_SECONDS,
+        months_ahead=settings.ACTIVITY_PARTITIONS_AHEAD,
+        retention_months=settings.ACTIVITY_RETENTION_MONTHS,
+    )
+    maintenance.start()
+    return maintenance
+
+
+async def check_partitions() -> None:
+    """
+    Fail startup when this month's or next month's activity partition is missing:
+    task_activity has no DEFAULT partition, so those inserts would fail. Missing
+    partitions are created first unless maintenance is disabled in this process.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    this_month = month_start(datetime.now(timezone.utc))
+    needed = [this_month, add_months(this_month, 1)]
+    async with engine.begin() as conn:
+        if settings.ACTIVITY_MAINTENANCE_SECONDS > 0:
+            # waits for a maintenance run in another worker instead of racing it
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+            await ensure_partitions(conn, ACTIVITY_TABLE, this_month, len(needed))
+        existing = await list_partitions(conn, ACTIVITY_TABLE)
+    missing = [partition_name(ACTIVITY_TABLE, m) for m in needed if m not in existing]
+    if missing:
+        raise RuntimeError(
+            f"Missing {ACTIVITY_TABLE} partitions {missing}: run the migrations or enable ACTIVITY_MAINTENANCE_SECONDS"
+        )
+
+
+async def stop_maintenance() -> None:
+    global maintenance
+    if maintenance is not None:
+        await maintenance.stop()
+        maintenance = None
@@ -0,0 +1,146 @@
+# app/services/batch_service.py
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import DBAPIError, IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import SavepointSession, savepoint_session
+from app.schemas.batch import (
+    BatchItemResult, BatchOperation, BatchResponse,
+    TaskUpdateParams, TaskAssignParams, ProjectUpdateParams, ProjectDeleteParams,
+)
+from app.schemas.project import ProjectCreate, ProjectRead
+from app.schemas.task import TaskCreate, TaskRead
+from app.services.project_service import project_service
+from app.services.read_cache import defer_invalidations, run_deferred_invalidations
+from app.services.task_service import task_service
+
+logger = logging.getLogger(__name__)
+
+# serialization_failure, deadlock_detected: the operation may succeed if retried
+RETRYABLE_SQLSTATES = ("40001", "40P01")
+
+# (db, user, params) -> (status code, JSON-ready result)
+Handler = Callable[[AsyncSession, Any, Dict[str, Any]], Awaitable[Tuple[int, Any]]]
+
+
+def _dump(schema: type[BaseModel], obj: Any) -> Dict[str, Any]:
+    return schema.model_validate(obj, from_attributes=True).model_dump(mode="json")
+
+
+async def _task_create(db: AsyncSession, user: Any, params: Dict[str, Any]) -> Tuple[int, Any]:
+    payload = TaskCreate.model_validate(params)
+    task = await task_service.create_task(db=db, creator_id=user.id, **payload.model_dump())
+    return status.HTTP_201_CREATED, _dump(TaskRead, task)
+
+
+async def _task_update(db: AsyncSession, user: Any, params: Dict[str, Any]) -> Tuple[int, Any]:
+    payload = TaskUpdateParams.model_validate(params)
+    patch = payload.model_dump(exclude_unset=True, exclude={"task_id"})
+    expected_version = patch.pop("version", None)
+    task = await task_service.update_task(
+        db=db, task_id=payload.task_id, patch=patch, expected_version=expected_version, actor_id=user.id,
+    )
+    return status.HTTP_200_OK, _dump(TaskRead, task)
+
+
+async def _task_assign(db: AsyncSession, user: Any, params: Dict[str, Any]) -> Tuple[int, Any]:
+    payload = TaskAssignParams.model_validate(params)
+    task = await task_service.assign_users(db=db, task_id=payload.task_id, user_ids=payload.user_ids, assigned_by=user.id)
+    return status.HTTP_200_OK, _dump(TaskRead, task)
+
+
+async def _project_create(db: AsyncSession, user: Any, params: Dict[str, Any]) -> Tuple[int, Any]:
+    payload = ProjectCreate.model_validate(params)
+    project = await project_service.create_project(db=db, owner_id=user.id, name=payload.name, visibility=payload.visibility)
+    return status.HTTP_201_CREATED, _dump(ProjectRead, project)
+
+
+async def _project_update(db: AsyncSession, user: Any, params: Dict[str, Any]) -> Tuple[int, Any]:
+    payload = ProjectUpdateParams.model_validate(params)
+    patch = payload.model_dump(exclude_unset=True, exclude={"project_id"})
+    project = await project_service.update_project(db=db, project_id=payload.project_id, patch=patch, requester_id=user.id)
+    return status.HTTP_200_OK, _dump(ProjectRead, project)
+
+
+async def _project_delete(db: AsyncSession, user: Any, params: Dict[str, Any]) -> Tuple[int, Any]:
+    payload = ProjectDeleteParams.model_validate(params)
+    await project_service.delete_project(db=db, project_id=payload.project_id, requester_id=user.id)
+    return status.HTTP_204_NO_CONTENT, None
+
+
+HANDLERS: Dict[str, Handler] = {
+    "task.create": _task_create,
+    "task.update": _task_update,
+    "task.assign": _task_assign,
+    "project.create": _project_create,
+    "project.update": _project_update,
+    "project.delete": _project_delete,
+}
+
+
+class BatchService:
+    async def run(self, user: Any, operations: List[BatchOperation], mode: str = "atomic") -> BatchResponse:
+        """
+        Run operations in order on one connection and one outer transaction.
+        Each operation runs in its own SAVEPOINT. The services' commits inside
+        it only flush; the savepoint is released when the operation returns, and
+        a failed operation rolls back just its own writes.
+
+        atomic: the first failure rolls back everything; the remaining
+        operations are reported as 424 (not run).
+        independent: failures are reported per item and the rest is committed.
+        """
+        results: List[BatchItemResult] = []
+        failed = False
+        async with savepoint_session() as (db, outer):
+            db.info["user_id"] = user.id
+            defer_invalidations(db)  # cache evictions wait for the outer commit
+            for index, operation in enumerate(operations):
+                if failed and mode == "atomic":
+                    results.append(BatchItemResult(
+                        index=index, op=operation.op, status=status.HTTP_424_FAILED_DEPENDENCY, error="Not run",
+                    ))
+                    continue
+                item = await self._run_one(db, user, index, operation)
+                results.append(item)
+                failed = failed or item.error is not None
+
+            committed = not (failed and mode == "atomic")
+            if committed:
+                await outer.commit()
+                await run_deferred_invalidations(db)
+            else:
+                await outer.rollback()
+        return BatchResponse(committed=committed, results=results)
+
+    async def _run_one(self, db: SavepointSession, user: Any, index: int, operation: BatchOperation) -> BatchItemResult:
+        # the services' own commits only flush, so the whole operation stays in one savepoint
+        db.defer_commits = True
+        try:
+            code, result = await HANDLERS[operation.op](db, user, operation.params)
+            db.defer_commits = False
+            await db.commit()  # release this operation's savepoint
+            return BatchItemResult(index=index, op=operation.op, status=code, result=result)
+        except (HTTPException, ValidationError, SQLAlchemyError) as e:
+            db.defer_commits = False
+            await db.rollback()  # back to this operation's savepoint
+            if isinstance(e, HTTPException):
+                code, error = e.status_code, e.detail
+            elif isinstance(e, ValidationError):
+                code = status.HTTP_422_UNPROCESSABLE_ENTITY
+                error = e.errors(include_url=False, include_context=False, include_input=False)
+            elif isinstance(e, IntegrityError):
+                code, error = status.HTTP_409_CONFLICT, "Integrity error"
+            elif isinstance(e, DBAPIError) and getattr(e.orig, "sqlstate", None) in RETRYABLE_SQLSTATES:
+                code, error = status.HTTP_409_CONFLICT, "Conflict with a concurrent transaction, retry"
+            else:
+                logger.exception("Batch operation %s (%s) failed", index, operation.op)
+                code, error = status.HTTP_500_INTERNAL_SERVER_ERROR, "Database error"
+            return BatchItemResult(index=index, op=operation.op, status=code, error=error)
+
+
+batch_service = BatchService()
@@ -0,0 +1,252 @@
+# app/services/change_feed.py
+"""
+Per-project change feed behind GET /projects/{id}/events (SSE) and its
+WebSocket twin.
+
+Writers call `publish_change(db, project_id, type, **data)` before committing.
+Like invalidations (app/db/invalidation.py), the events are queued on the
+session and sent with pg_notify() on FEED_CHANNEL from a before_commit hook, so
+only committed changes are announced. Every worker receives them on its
+listener connection, in commit order, and hands them to its `change_feed` hub.
+Without the bus (SQLite, INVALIDATION_BUS off), events are delivered in-process
+when the transaction commits.
+
+The hub fans each event out to the project's subscribers. Every subscriber has a
+bounded buffer (FEED_SUBSCRIBER_BUFFER): publishing never waits for a slow
+client. Instead the oldest queued event is dropped, and the client gets a
+"feed.gap" notice with the number of events it missed.
+
+Each worker also keeps the last FEED_HISTORY_SIZE events per project, for at
+most FEED_HISTORY_PROJECTS projects and FEED_HISTORY_MAX_EVENTS events in
+total (least recently active projects are forgotten first). All
+workers see the same stream, so a client can reconnect to any worker and
+resume from the id of the last event it got. A cursor that is no longer in the
+history (too old, or the worker restarted or lost its listener connection) gets
+a "feed.reset" notice: the client should reload the project's tasks.
+"""
+import asyncio
+import json
+import logging
+import secrets
+import time
+from collections import OrderedDict, defaultdict, deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.invalidation import MAX_PAYLOAD, bus_enabled, listen
+from app.db.session import PrimarySession, engine
+
+logger = logging.getLogger(__name__)
+
+
+class FeedEvent(NamedTuple):
+    id: Optional[str]  # None for notices, which cannot be resumed from
+    type: str
+    project_id: int
+    data: str  # the event as a JSON object
+
+
+def _event(item: Dict[str, Any]) -> FeedEvent:
+    return FeedEvent(item.get("id"), item["type"], item["project_id"], json.dumps(item, separators=(",", ":")))
+
+
+def _notice(type: str, project_id: int, **data: Any) -> FeedEvent:
+    return _event({"type": type, "project_id": project_id, **data})
+
+
+class Subscription:
+    def __init__(self, project_id: int, maxsize: int):
+        self.project_id = project_id
+        self._events: Deque[FeedEvent] = deque(maxlen=maxsize)
+        self._wake = asyncio.Event()
+        self.dropped = 0
+        self.closed = False
+
+    def push(self, event: FeedEvent) -> None:
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1  # deque drops the oldest
+        self._events.append(event)
+        self._wake.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._wake.set()
+
+    async def get(self, timeout: float) -> Optional[List[FeedEvent]]:
+        """
+        Queued events, oldest first. [] after `timeout` seconds without any (time
+        for a heartbeat); None once closed.
+        """
+        if not self._events and not self.closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._wake.clear()
+        if self.closed:
+            return None
+        events = list(self._events)
+        self._events.clear()
+        if self.dropped:
+            events.insert(0, _notice("feed.gap", self.project_id, dropped=self.dropped))
+            self.dropped = 0
+        return events
+
+
+class ChangeFeedHub:
+    def __init__(self, buffer_size: int, history_size: int, history_projects: int, history_max_events: int):
+        self.buffer_size = buffer_size
+        self.history_size = history_size
+        self.history_projects = history_projects
+        self.history_max_events = history_max_events
+        self._subscribers: Dict[int, Set[Subscription]] = defaultdict(set)
+        self._history: "OrderedDict[int, Deque[FeedEvent]]" = OrderedDict()
+        self._history_events = 0
+        self.published = 0
+        self.resets = 0
+
+    def subscribe(self, project_id: int, cursor: Optional[str] = None) -> Subscription:
+        """New subscription; with `cursor`, events after that id are queued first."""
+        sub = Subscription(project_id, self.buffer_size)
+        if cursor:
+            history = list(self._history.get(project_id, ()))
+            ids = [e.id for e in history]
+            if cursor in ids:
+                for e in history[ids.index(cursor) + 1:]:
+                    sub.push(e)
+            else:
+                sub.push(_notice("feed.reset", project_id, reason="unknown cursor"))
+        self._subscribers[project_id].add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscribers.get(sub.project_id)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subscribers[sub.project_id]
+
+    def publish(self, event: FeedEvent) -> None:
+        self.published += 1
+        history = self._history.get(event.project_id)
+        if history is None:
+            history = self._history[event.project_id] = deque(maxlen=self.history_size)
+        else:
+            self._history.move_to_end(event.project_id)
+        if len(history) < self.history_size:
+            self._history_events += 1
+        history.append(event)
+        while len(self._history) > 1 and (
+            len(self._history) > self.history_projects or self._history_events > self.history_max_events
+        ):
+            _, dropped = self._history.popitem(last=False)
+            self._history_events -= len(dropped)
+        for sub in self._subscribers.get(event.project_id, ()):
+            sub.push(event)
+
+    async def reset(self) -> None:
+        """Events may have been missed: forget the history and tell every subscriber to reload."""
+        self.resets += 1
+        self._history.clear()
+        self._history_events = 0
+        for project_id, subs in self._subscribers.items():
+            notice = _notice("feed.reset", project_id, reason="events may have been missed")
+            for sub in subs:
+                sub.push(notice)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "projects": len(self._subscribers),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "history_events": self._history_events,
+            "published": self.published,
+            "resets": self.resets,
+        }
+
+
+change_feed = ChangeFeedHub(
+    buffer_size=settings.FEED_SUBSCRIBER_BUFFER,
+    history_size=settings.FEED_HISTORY_SIZE,
+    history_projects=settings.FEED_HISTORY_PROJECTS,
+    history_max_events=settings.FEED_HISTORY_MAX_EVENTS,
+)
+
+
+def publish_change(db: AsyncSession, project_id: int, type: str, **data: Any) -> None:
+    """Queue a `type` event (e.g. "task.updated") for project_id, sent when `db` next commits."""
+    item = {
+        "id": f"{time.time_ns() // 1_000_000:x}-{secrets.token_hex(4)}",
+        "type": type,
+        "project_id": project_id,
+        **data,
+        "at": datetime.now(timezone.utc).isoformat(),
+    }
+    db.info.setdefault("feed", []).append(item)
+
+
+def _pack(items: List[Dict[str, Any]]) -> List[str]:
+    """JSON arrays of events, each small enough for one NOTIFY."""
+    payloads, current, size = [], [], 2
+    for item in items:
+        part = json.dumps(item, separators=(",", ":"))
+        if current and size + len(part) + 1 > MAX_PAYLOAD:
+            payloads.append(f"[{','.join(current)}]")
+            current, size = [], 2
+        current.append(part)
+        size += len(part) + 1
+    if current:
+        payloads.append(f"[{','.join(current)}]")
+    return payloads
+
+
+@event.listens_for(PrimarySession, "before_commit")
+def _send_before_commit(session: Session) -> None:
+    if session.info.get("releasing"):
+        # statement mode handing back an idle connection; the write comes later
+        return
+    items = session.info.pop("feed", None)
+    if not items:
+        return
+    conn = session.connection()
+    if not bus_enabled():
+        # delivered when the connection's transaction commits; under a savepoint
+        # session (POST /batch) that is the outer transaction, not the SAVEPOINT
+        conn.info.setdefault("feed_local", []).extend(items)
+        return
+    for payload in _pack(items):
+        conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": settings.FEED_CHANNEL, "payload": payload})
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _drop_on_rollback(session: Session) -> None:
+    session.info.pop("feed", None)
+
+
+@event.listens_for(engine.sync_engine, "commit")
+def _deliver_locally(conn: Connection) -> None:
+    for item in conn.info.pop("feed_local", ()):
+        change_feed.publish(_event(item))
+
+
+@event.listens_for(engine.sync_engine, "rollback")
+def _drop_local(conn: Connection) -> None:
+    conn.info.pop("feed_local", None)
+
+
+def _on_feed_payload(payload: str) -> None:
+    try:
+        items = json.loads(payload)
+    except ValueError:
+        logger.warning("Ignoring malformed feed payload %r", payload[:100])
+        return
+    for item in items:
+        change_feed.publish(_event(item))
+
+
+listen(settings.FEED_CHANNEL, _on_feed_payload, on_gap=change_feed.reset)
@@ -0,0 +1,238 @@
+# app/services/outbox.py
+"""
+Transactional outbox for domain events (webhooks, notifications, search
+indexing, ...).
+
+Services call `enqueue_event(db, topic, payload)` next to the change it
+describes. The row is written by the same commit, so an event exists if and
+only if the change does, and the write path pays one extra INSERT and nothing
+else. Nothing is written unless OUTBOX_ENABLED is set (only once the
+outbox_events migration has been applied) and a handler matches the topic.
+
+With the outbox enabled, every worker with OUTBOX_DISPATCHER runs an
+`OutboxDispatcher`. It leases due rows in
+batches of OUTBOX_BATCH_SIZE (FOR UPDATE SKIP LOCKED, so workers never claim
+the same row) and runs the handlers registered with
+`on_outbox_event(topic, handler)`, at most OUTBOX_CONCURRENCY at a time. A row is deleted once all of its handlers have
+succeeded. Otherwise it is retried with exponential backoff, and it is parked
+(dead_at) after OUTBOX_MAX_ATTEMPTS. A worker that dies mid-batch loses its
+lease, and the rows become due again after OUTBOX_LEASE_SECONDS.
+
+Parked rows, and rows nobody delivered, are deleted after
+OUTBOX_RETENTION_HOURS.
+
+Delivery is therefore at least once and unordered: handlers must be idempotent,
+e.g. keyed on `message.id`. Events with no matching handler are dropped.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.outbox import OutboxEvent
+from app.repositories.outbox_repo import outbox_repo
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxMessage(NamedTuple):
+    id: int
+    topic: str
+    payload: Dict[str, Any]
+    created_at: datetime
+    attempts: int  # including this one
+
+
+OutboxHandler = Callable[[OutboxMessage], Awaitable[None]]
+
+# (topic pattern, handler); "task.created", "task.*" or "*"
+_handlers: List[Tuple[str, OutboxHandler]] = []
+
+
+def on_outbox_event(topic: str, handler: OutboxHandler) -> None:
+    _handlers.append((topic, handler))
+
+
+def _matches(pattern: str, topic: str) -> bool:
+    if pattern == "*" or pattern == topic:
+        return True
+    return pattern.endswith(".*") and topic.startswith(pattern[:-1])
+
+
+def enqueue_event(db: AsyncSession, topic: str, payload: Dict[str, Any]) -> None:
+    """
+    Add an outbox row to `db`; it is written by the caller's next commit. A no-op
+    when the outbox is disabled or no handler would ever deliver the event.
+    """
+    if not settings.OUTBOX_ENABLED or not any(_matches(pattern, topic) for pattern, _ in _handlers):
+        return
+    now = datetime.now(timezone.utc)
+    db.add(OutboxEvent(topic=topic, payload=payload, created_at=now, available_at=now))
+
+
+def _age(ts: datetime, now: datetime) -> float:
+    if ts.tzinfo is None:  # SQLite drops the offset; everything is written in UTC
+        ts = ts.replace(tzinfo=timezone.utc)
+    return max(0.0, (now - ts).total_seconds())
+
+
+class OutboxDispatcher:
+    def __init__(self, batch_size: int, concurrency: int, poll_seconds: float, lease_seconds: float,
+                 handler_timeout: float, max_attempts: int, retry_seconds: float, retention_hours: float,
+                 purge_every: float):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self.lease = timedelta(seconds=lease_seconds)
+        self.handler_timeout = handler_timeout
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self.retention = timedelta(hours=retention_hours)
+        self.purge_every = purge_every
+        self._next_purge = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self.purged = 0
+        self.delivered = 0
+        self.retried = 0
+        self.dead = 0
+        self.lag_seconds = 0.0  # age of the oldest event in the last claimed batch (0 when idle)
+        self.delivery_lag_seconds = 0.0  # enqueue -> delivered, slowest event of the last batch
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if time.monotonic() >= self._next_purge:
+                    self._next_purge = time.monotonic() + self.purge_every
+                    await self.purge()
+                claimed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+                claimed = 0
+            if claimed < self.batch_size:  # a full batch means more may be waiting
+                await asyncio.sleep(self.poll_seconds)
+
+    async def run_once(self) -> int:
+        """Claim and deliver one batch; returns the number of events claimed."""
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            rows = await outbox_repo.claim(db, self.batch_size, now, self.lease)
+        if not rows:
+            self.lag_seconds = 0.0
+            return 0
+        self.lag_seconds = _age(rows[0].created_at, now)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def deliver(message: OutboxMessage) -> Optional[str]:
+            async with semaphore:
+                return await self._deliver(message)
+
+        messages = [OutboxMessage(r.id, r.topic, r.payload, r.created_at, r.attempts) for r in rows]
+        errors = await asyncio.gather(*(deliver(m) for m in messages))
+
+        now = datetime.now(timezone.utc)
+        done, failed, lags = [], [], []
+        for message, error in zip(messages, errors):
+            if error is None:
+                done.append(message.id)
+                lags.append(_age(message.created_at, now))
+            elif message.attempts >= self.max_attempts:
+                self.dead += 1
+                logger.error("Outbox event %s (%s) gave up after %s attempts: %s", message.id, message.topic, message.attempts, error)
+                failed.append({"id": message.id, "available_at": now, "dead_at": now, "last_error": error})
+            else:
+                self.retried += 1
+                delay = self.retry_seconds * 2 ** (message.attempts - 1)
+                failed.append({"id": message.id, "available_at": now + timedelta(seconds=delay), "dead_at": None, "last_error": error})
+        self.delivered += len(done)
+        if lags:
+            self.delivery_lag_seconds = max(lags)
+
+        async with AsyncSessionLocal() as db:
+            await outbox_repo.complete(db, done)
+            await outbox_repo.reschedule(db, failed)
+            await db.commit()
+        return len(rows)
+
+    async def purge(self) -> int:
+        """Delete rows older than the retention that are parked or were never delivered."""
+        async with AsyncSessionLocal() as db:
+            purged = await outbox_repo.delete_older_than(db, datetime.now(timezone.utc) - self.retention)
+            await db.commit()
+        if purged:
+            logger.warning("Purged %s outbox events older than %s (parked or never delivered)", purged, self.retention)
+        self.purged += purged
+        return purged
+
+    async def _deliver(self, message: OutboxMessage) -> Optional[str]:
+        """Run every matching handler; the first error (as text) or None."""
+        for pattern, handler in _handlers:
+            if not _matches(pattern, message.topic):
+                continue
+            try:
+                await asyncio.wait_for(handler(message), self.handler_timeout)
+            except Exception as e:
+                logger.warning("Outbox handler %s failed for event %s: %r", getattr(handler, "__name__", handler), message.id, e)
+                return repr(e)[:1000]
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "delivered": self.delivered,
+            "retried": self.retried,
+            "dead": self.dead,
+            "purged": self.purged,
+            "lag_seconds": round(self.lag_seconds, 3),
+            "delivery_lag_seconds": round(self.delivery_lag_seconds, 3),
+        }
+
+
+dispatcher: Optional[OutboxDispatcher] = None
+
+
+def start_dispatcher() -> Optional[OutboxDispatcher]:
+    """Start this worker's dispatcher (called from main.on_startup); None when disabled."""
+    global dispatcher
+    if not (settings.OUTBOX_ENABLED and settings.OUTBOX_DISPATCHER):
+        return None
+    dispatcher = OutboxDispatcher(
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        concurrency=settings.OUTBOX_CONCURRENCY,
+        poll_seconds=settings.OUTBOX_POLL_SECONDS,
+        lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+        handler_timeout=settings.OUTBOX_HANDLER_TIMEOUT_SECONDS,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+        retry_seconds=settings.OUTBOX_RETRY_SECONDS,
+        retention_hours=settings.OUTBOX_RETENTION_HOURS,
+        purge_every=settings.OUTBOX_PURGE_SECONDS,
+    )
+    dispatcher.start()
+    return dispatcher
+
+
+async def stop_dispatcher() -> None:
+    global dispatcher
+    if dispatcher is not None:
+        await dispatcher.stop()
+        dispatcher = None
@@ -1,42 +1,92 @@
 # app/services/project_service.py
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from app.repositories.project_repo import project_repo
 from app.repositories.user_repo import user_repo
 from app.models.project import Project
+from app.services.read_cache import project_cache
+from app.db.invalidation import publish_invalidation
+from app.services.change_feed import publish_change
+from app.services.outbox import enqueue_event
+from app.schemas.project import ProjectRead
+from app.schemas.projection import parse_fields, construct_from_rows
 
+PROJECT_FIELDS = tuple(ProjectRead.model_fields)
 
 
+def parse_project_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a sparse fieldset ('id,name'); 400 on unknown names."""
+    try:
+        return parse_fields(fields, PROJECT_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 
 class ProjectService:
     async def create_project(self, db: AsyncSession, owner_id: int, name: str, visibility: Optional[str] = "private") -> Project:
         """
-        Create a project and optionally log activity.
+        Create a project; the "project.created" outbox event is written with it.
         Validates owner exists.
         """
-        owner = await user_repo.get(db, owner_id)
+        owner = await user_repo.load(db, owner_id)
         if not owner:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Owner user not found")
         
-        project_obj = {"name": name, "owner_id": owner_id, "visibility": visibility}
-        created = await project_repo.create(db, project_obj)
-        
-       
+        created = Project(name=name, owner_id=owner_id, visibility=visibility)
+        db.add(created)
+        await db.flush()  # assign created.id
+        enqueue_event(db, "project.created", {"project_id": created.id, "owner_id": owner_id})
         await db.commit()
         await db.refresh(created)
         return created
     
     
-    async def get_project(self, db: AsyncSession, project_id: int) -> Optional[Project]:
-        project = await project_repo.get(db, project_id)
+    async def get_project(self, db: AsyncSession, project_id: int, fields: Optional[Sequence[str]] = None) -> Optional[Project]:
+        """Fetch one project through `project_cache`; on a miss with a fieldset only those columns are selected."""
+        project = await project_cache.get(project_id)
+        if project is None and fields is not None:
+            # updated_at is always selected for the ETag; the serializer drops it if not asked for
+            row = await project_repo.get(db, project_id, columns=list(dict.fromkeys([*fields, "updated_at"])))
+            project = construct_from_rows(ProjectRead, [row])[0] if row else None
+        elif project is None:
+            row = await project_repo.get(db, project_id)
+            project = await project_cache.set(row, db) if row else None
         if not project:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
         return project
+
+    async def get_project_updated_at(self, db: AsyncSession, project_id: int) -> Optional[datetime]:
+        """updated_at-only lookup for conditional GETs (cache first); 404 if the project does not exist."""
+        cached = await project_cache.get(project_id)
+        if cached is not None:
+            return cached.updated_at
+        row = await project_repo.get(db, project_id, columns=["updated_at"])
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+        return row.updated_at
     
-    async def list_projects_for_owner(self, db: AsyncSession, owner_id: int, skip: int = 0, limit: int = 50) -> List[Project]:
+    async def list_projects_for_owner(self, db: AsyncSession, owner_id: int, skip: int = 0, limit: int = 50,
+                                      fields: Optional[Sequence[str]] = None) -> List[Project]:
+        if fields is not None:
+            rows = await project_repo.list_for_owner(db, owner_id, skip=skip, limit=limit, columns=fields)
+            return construct_from_rows(ProjectRead, rows)
         return await project_repo.list_for_owner(db, owner_id, skip=skip, limit=limit)
+
+    async def list_projects_page(self, db: AsyncSession, owner_id: int, limit: int = 50, cursor: Optional[str] = None, sort: str = "id",
+                                 fields: Optional[Sequence[str]] = None) -> Tuple[List[Project], Optional[str]]:
+        """
+        Keyset page of the owner's projects plus the cursor for the next page.
+        """
+        try:
+            rows, next_cursor = await project_repo.list_for_owner_keyset(db, owner_id, limit=limit, cursor=cursor, sort=sort, columns=fields)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if fields is not None:
+            return construct_from_rows(ProjectRead, rows), next_cursor
+        return rows, next_cursor
     
     async def update_project(self, db: AsyncSession, project_id: int, patch: dict, requester_id: Optional[int] = None) -> Project:
         """
@@ -50,11 +100,14 @@ class ProjectService:
         if requester_id is not None and project.owner_id != requester_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to update project")
 
+        # queued first: update_by_id commits, which writes/sends them with the update
+        publish_invalidation(db, "project", project_id)
+        enqueue_event(db, "project.updated", {"project_id": project_id, "fields": sorted(patch)})
         updated = await project_repo.update_by_id(db, project_id, patch)
         if updated is None:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update project")
 
-        await db.commit()
+        await project_cache.invalidate_after_commit(db, project_id)
         await db.refresh(updated)
         return updated
     
@@ -72,9 +125,12 @@ class ProjectService:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to delete project")
         
          # For safety you might want to archive rather than hard delete.
+        # queued first: delete_by_id commits, which writes/sends them with the delete
+        publish_invalidation(db, "project", project_id)
+        publish_change(db, project_id, "project.deleted")
+        enqueue_event(db, "project.deleted", {"project_id": project_id})
         await project_repo.delete_by_id(db, project_id)
-        
-        await db.commit()
+        await project_cache.invalidate_after_commit(db, project_id)
         
         
 project_service = ProjectService()
@@ -0,0 +1,196 @@
+# app/services/read_cache.py
+"""
+Read-through caches for single task / project reads.
+
+Entries live under "<kind>:<id>" and hold the full read DTO, whose `version`
+(tasks) or `updated_at` (projects) doubles as the entry's version. Conditional
+GETs can therefore be answered from the cache without touching the database.
+Service writes invalidate the entry after commit and publish the id on the
+invalidation bus (app/db/invalidation.py) so other workers evict it too.
+READ_CACHE_TTL_SECONDS bounds staleness if a message is missed.
+
+Stale refills are guarded three ways. Only rows read from the primary are
+stored; a replica may lag behind the write that invalidated the entry. An
+invalidation leaves a tombstone for READ_CACHE_HOLD_SECONDS instead of
+deleting the key, and fills never overwrite it, so a read that started before
+the write cannot put the old row back. A fill never replaces an entry with an
+older version. Inside a batch (savepoint_session), invalidations wait for the
+outer commit; see invalidate_after_commit.
+
+The backend is chosen with READ_CACHE_BACKEND. "memory" is a per-worker LRU,
+"shared" goes through SharedBackend (redis.asyncio at READ_CACHE_URL, or any
+client passed to configure_read_cache) and "off" disables caching.
+"""
+import logging
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import CacheBackend, MemoryBackend, SharedBackend
+from app.core.config import settings
+from app.db.invalidation import on_invalidation
+from app.db.session import is_primary
+from app.schemas.project import ProjectRead
+from app.schemas.task import TaskRead
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# left under an invalidated key for READ_CACHE_HOLD_SECONDS; never valid JSON
+TOMBSTONE = b"\0"
+
+# session.info key: (cache, ids) evictions held until the outer transaction commits
+DEFERRED_KEY = "cache_evictions"
+
+
+class EntityCache(Generic[M]):
+    def __init__(self, kind: str, schema: Type[M], version_attr: str):
+        self.kind = kind
+        self.schema = schema
+        self.version_attr = version_attr
+        self.adapter = TypeAdapter(schema)
+        self.backend: Optional[CacheBackend] = None
+
+    def _key(self, id: int) -> str:
+        return f"{self.kind}:{id}"
+
+    async def _get_raw(self, id: int) -> Optional[Any]:
+        try:
+            return await self.backend.get(self._key(id))
+        except Exception:  # a cache outage must not fail reads
+            logger.warning("read cache get failed for %s:%s", self.kind, id, exc_info=True)
+            return None
+
+    async def get(self, id: int) -> Optional[M]:
+        if self.backend is None:
+            return None
+        value = await self._get_raw(id)
+        if value is None or value == TOMBSTONE:
+            return None
+        if self.backend.serialized:
+            value = self.adapter.validate_json(value)
+        return value
+
+    async def set(self, obj: Any, db: Optional[AsyncSession] = None) -> Optional[M]:
+        """
+        Cache the DTO for `obj` (ORM row or DTO) and return it. Pass the session
+        it was read with: rows from a replica are returned but not stored. Nothing
+        is stored over a tombstone or over an entry with a newer version.
+        """
+        dto = self.adapter.validate_python(obj, from_attributes=True)
+        if self.backend is None or (db is not None and not is_primary(db)):
+            return dto
+        current = await self._get_raw(dto.id)
+        if current == TOMBSTONE:
+            return dto
+        if current is not None:
+            if self.backend.serialized:
+                current = self.adapter.validate_json(current)
+            cached_version, version = getattr(current, self.version_attr), getattr(dto, self.version_attr)
+            if cached_version is not None and (version is None or version <= cached_version):
+                return dto
+        value = self.adapter.dump_json(dto) if self.backend.serialized else dto
+        try:
+            await self.backend.set(self._key(dto.id), value, settings.READ_CACHE_TTL_SECONDS)
+        except Exception:
+            logger.warning("read cache set failed for %s:%s", self.kind, dto.id, exc_info=True)
+        return dto
+
+    async def get_or_load(self, id: int, load: Callable[[], Awaitable[Any]], db: Optional[AsyncSession] = None) -> Optional[M]:
+        """Cached DTO, or `load()` it (ORM row or None) from `db` and cache the result."""
+        cached = await self.get(id)
+        if cached is not None:
+            return cached
+        obj = await load()
+        if obj is None:
+            return None
+        return await self.set(obj, db)
+
+    async def version(self, id: int) -> Optional[Any]:
+        """Version of the cached entry, or None on a miss."""
+        cached = await self.get(id)
+        return getattr(cached, self.version_attr) if cached is not None else None
+
+    async def evict_local(self, ids: Optional[List[int]]) -> None:
+        """
+        Invalidation-bus handler: drop entries written by another worker. Only the
+        memory backend needs it; a shared store was already invalidated by the writer.
+        """
+        if not isinstance(self.backend, MemoryBackend):
+            return
+        if ids is None:
+            self.backend.clear()
+        else:
+            await self.invalidate(*ids)
+
+    async def invalidate(self, *ids: int) -> None:
+        """Replace the entries with tombstones, so fills racing the write cannot restore them."""
+        if self.backend is None:
+            return
+        for id in ids:
+            try:
+                if settings.READ_CACHE_HOLD_SECONDS > 0:
+                    await self.backend.set(self._key(id), TOMBSTONE, settings.READ_CACHE_HOLD_SECONDS)
+                else:
+                    await self.backend.delete(self._key(id))
+            except Exception:
+                logger.warning("read cache invalidation failed for %s:%s", self.kind, id, exc_info=True)
+
+    async def invalidate_after_commit(self, db: AsyncSession, *ids: int) -> None:
+        """
+        invalidate() once `db`'s writes are visible to other sessions. Services call
+        it right after their commit; in a batch that commit only releases a
+        savepoint, so the eviction is held until run_deferred_invalidations.
+        """
+        deferred = db.info.get(DEFERRED_KEY)
+        if deferred is not None:
+            deferred.append((self, ids))
+        else:
+            await self.invalidate(*ids)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.backend.stats() if self.backend is not None else {"backend": "off"}
+
+
+task_cache: EntityCache[TaskRead] = EntityCache("task", TaskRead, "version")
+project_cache: EntityCache[ProjectRead] = EntityCache("project", ProjectRead, "updated_at")
+
+on_invalidation("task", task_cache.evict_local)
+on_invalidation("project", project_cache.evict_local)
+
+
+def defer_invalidations(db: AsyncSession) -> None:
+    """Hold invalidate_after_commit() calls on `db` until run_deferred_invalidations."""
+    db.info[DEFERRED_KEY] = []
+
+
+async def run_deferred_invalidations(db: AsyncSession) -> None:
+    """Apply the held invalidations (after the outer transaction has committed)."""
+    for cache, ids in db.info.pop(DEFERRED_KEY, None) or ():
+        await cache.invalidate(*ids)
+
+
+def _default_backend() -> Optional[CacheBackend]:
+    if settings.READ_CACHE_BACKEND == "off":
+        return None
+    if settings.READ_CACHE_BACKEND == "shared":
+        if not settings.READ_CACHE_URL:
+            raise RuntimeError("READ_CACHE_BACKEND=shared needs READ_CACHE_URL")
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:  # optional dependency
+            raise RuntimeError("READ_CACHE_BACKEND=shared needs the `redis` package") from e
+        return SharedBackend(redis_asyncio.from_url(settings.READ_CACHE_URL))
+    return MemoryBackend(maxsize=settings.READ_CACHE_SIZE, ttl=settings.READ_CACHE_TTL_SECONDS)
+
+
+def configure_read_cache(backend: Optional[CacheBackend] = None) -> None:
+    """(Re)configure both caches; without `backend` the settings decide."""
+    backend = backend if backend is not None else _default_backend()
+    task_cache.backend = backend
+    project_cache.backend = backend
+
+
+configure_read_cache()
@@ -1,15 +1,105 @@
 # app/services/task_service.py
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import update
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
-from app.models.task import Task, task_assignments, task_tags
-from app.models.user import User
-from app.models.tags import Tag
+from app.models.task import Task
 
 from app.repositories.task_repo import task_repo
+from app.repositories.project_repo import project_repo
 from app.repositories.user_repo import user_repo
+from app.repositories.tag_repo import tag_repo
+from app.repositories.loader import loader_for
+from app.services.read_cache import task_cache
+from app.db.invalidation import publish_invalidation
+from app.services.change_feed import publish_change
+from app.services.outbox import enqueue_event
+from app.services.activity_service import activity_service, activity_entry, diff_changes
+from app.core.config import settings
+from app.schemas.task import TaskCreate, TaskRead, TaskImportError, TaskImportReport
+from app.schemas.user import UserRead
+from app.schemas.tag import TagRead
+from app.schemas.comment import CommentRead
+from app.schemas.projection import parse_fields, construct_from_rows
+
+# List endpoints select only TaskRead's scalar columns and build TaskRead straight
+# from the rows (no ORM hydration). Large text columns are deferred unless asked for.
+TASK_FIELDS = tuple(TaskRead.model_fields)
+TASK_NESTED_FIELDS = ("assignees", "tags", "comments")
+TASK_DEFERRED_COLUMNS = ("description",)
+TASK_LIST_COLUMNS = tuple(f for f in TASK_FIELDS if f not in TASK_NESTED_FIELDS)
+
+
+def _task_list_columns(with_description: bool, fields: Optional[Sequence[str]] = None) -> List[str]:
+    if fields is not None:
+        return [c for c in TASK_LIST_COLUMNS if c in fields]
+    if with_description:
+        return list(TASK_LIST_COLUMNS)
+    return [c for c in TASK_LIST_COLUMNS if c not in TASK_DEFERRED_COLUMNS]
+
+
+def parse_task_fields(fields: Optional[str], include: Sequence[str] = ()) -> Optional[List[str]]:
+    """
+    Parse a sparse fieldset ('id,title,status'); 400 on unknown names.
+    Relations requested with include= are always part of the output.
+    """
+    try:
+        names = parse_fields(fields, TASK_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if names is not None:
+        names.extend(n for n in include if n not in names)
+    return names
+
+
+# Relations a reader may ask for with include=; each costs one or two queries per page
+# (selectin on single reads, see _resolve_includes for lists).
+TASK_INCLUDES = {
+    "assignees": Task.assignees,
+    "tags": Task.tags,
+    "comments": Task.comments,
+}
+
+
+def parse_task_include(include: Optional[str]) -> List[str]:
+    """Parse 'assignees,tags' into a list of relation names; 400 on unknown names."""
+    if not include:
+        return []
+    names = list(dict.fromkeys(n.strip() for n in include.split(",") if n.strip()))
+    unknown = [n for n in names if n not in TASK_INCLUDES]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(unknown)} (allowed: {', '.join(TASK_INCLUDES)})",
+        )
+    return names
+
+
+def _include_options(include: Sequence[str]):
+    return [selectinload(TASK_INCLUDES[name]) for name in include]
+
+
+# relations a write can set, returned with the written task
+WRITE_RESULT_INCLUDES = ("assignees", "tags")
+
+
+# Fields of a TaskCreate row that become task columns on import (the rest are association rows).
+TASK_IMPORT_FIELDS = tuple(f for f in TaskCreate.model_fields if f not in ("assignee_ids", "tag_ids"))
+# An explicit null for these falls back to the TaskCreate default (status is NOT NULL).
+_IMPORT_DEFAULTS = {
+    name: field.default
+    for name, field in TaskCreate.model_fields.items()
+    if name in TASK_IMPORT_FIELDS and field.default is not None
+}
+
+
+def _emit(db: AsyncSession, project_id: int, topic: str, **data: Any) -> None:
+    """Announce a task change on the live feed and in the outbox; both go out with the next commit."""
+    publish_change(db, project_id, topic, **data)
+    enqueue_event(db, topic, {"project_id": project_id, **data})
 
 
 class TaskService:
@@ -33,57 +123,211 @@ class TaskService:
         
         db.add(task_obj)
         await db.flush()  # assign task_obj.id
-        
-        # Attach assignees by inserting into association table
+
         if assignee_ids:
-            #validate users exist
-            q = await db.execute(select(User).where(User.id.in_(assignee_ids)))
-            users = q.scalars().all()
-            found_ids = {u.id for u in users}
-            missing = set(assignee_ids) - found_ids
-            if missing:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Assignees not found: {missing}")
-            
-              # Insert association rows
-            for uid in assignee_ids:
-                await db.execute(
-                    task_assignments.insert().values(task_id=task_obj.id, user_id=uid)
-                )
-                
-                    # Attach tags (if provided). Create tags if they don't exist? Here we expect tag ids.
-                    
+            await self._check_exist(db, user_repo, assignee_ids, "Assignees")
+            await task_repo.set_assignees(db, [task_obj.id], assignee_ids, assigned_by=creator_id, replace=False)
         if tag_ids:
-            q= await db.execute(select(Tag).where(Tag.id.in_(tag_ids)))
-            tags = q.scalars().all()
-            found_ids = {t.id for t in tags}
-            missing = set(tag_ids) - found_ids
-            
-            if missing:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Tags not found: {missing}")
-            
-            for tid in tag_ids:
-                await db.execute(
-                    task_tags.insert().values(task_id=task_obj.id, tag_id=tid)
-                )
-                
+            await self._check_exist(db, tag_repo, tag_ids, "Tags")
+            await task_repo.set_tags(db, [task_obj.id], tag_ids, replace=False)
+
+        _emit(db, task_obj.project_id, "task.created", task_id=task_obj.id)
+        await activity_service.record(db, [activity_entry(task_obj.id, task_obj.project_id, creator_id, "created")])
         await db.commit()
-        await db.refresh(task_obj)
-        return task_obj
+        return await self._reload(db, task_obj.id)
     
-    async def get_task(self, db:AsyncSession, task_id: int)-> Optional[Task]:
-        return await task_repo.get(db, task_id)
+    async def get_task(self, db:AsyncSession, task_id: int, include: Sequence[str] = (),
+                       fields: Optional[Sequence[str]] = None)-> Optional[Task]:
+        """
+        Fetch one task. Plain reads go through `task_cache` (a fieldset is applied
+        when serializing); on a miss with a fieldset only those columns are selected.
+        """
+        if include:
+            task = await task_repo.get(db, task_id, options=_include_options(include))
+        else:
+            task = await task_cache.get(task_id)
+            if task is None and fields is not None:
+                # version is always selected for the ETag; the serializer drops it if not asked for
+                row = await task_repo.get(db, task_id, columns=_task_list_columns(False, [*fields, "version"]))
+                task = construct_from_rows(TaskRead, [row])[0] if row else None
+            elif task is None:
+                row = await task_repo.get(db, task_id)
+                task = await task_cache.set(row, db) if row else None
+        if not task:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+        return task
+
+    async def get_task_version(self, db: AsyncSession, task_id: int) -> Optional[int]:
+        """Version-only lookup for conditional GETs (cache first); 404 if the task does not exist."""
+        cached = await task_cache.get(task_id)
+        if cached is not None:
+            return cached.version
+        row = await task_repo.get(db, task_id, columns=["version"])
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+        return row.version
     
-    async def list_tasks(self, db:AsyncSession, skip:int=0, limit:int=100)-> List[Task]:
-        return await task_repo.list(db, skip=skip, limit=limit)
+    async def list_tasks(self, db:AsyncSession, skip:int=0, limit:int=100, with_description: bool = True,
+                         include: Sequence[str] = (), fields: Optional[Sequence[str]] = None)-> List[TaskRead]:
+        """
+        Offset page of tasks from projected columns; relations in `include` are
+        resolved for the whole page (see _resolve_includes).
+        """
+        # pages with relations have always carried the description
+        columns = _task_list_columns(with_description or bool(include), fields)
+        tasks = construct_from_rows(TaskRead, await task_repo.list(db, skip=skip, limit=limit, columns=columns))
+        await self._resolve_includes(db, tasks, include)
+        return tasks
+
+    async def list_tasks_page(self, db: AsyncSession, limit: int = 100, cursor: Optional[str] = None, sort: str = "id",
+                              with_description: bool = True, include: Sequence[str] = (),
+                              fields: Optional[Sequence[str]] = None) -> Tuple[List[TaskRead], Optional[str]]:
+        """
+        Keyset page of tasks plus the cursor for the next page.
+        """
+        columns = _task_list_columns(with_description or bool(include), fields)
+        try:
+            rows, next_cursor = await task_repo.list_keyset(db, limit=limit, cursor=cursor, sort=sort, columns=columns)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        tasks = construct_from_rows(TaskRead, rows)
+        await self._resolve_includes(db, tasks, include)
+        return tasks, next_cursor
+
+    @staticmethod
+    async def _resolve_includes(db: AsyncSession, tasks: List[TaskRead], include: Sequence[str]) -> None:
+        """
+        Fill the included relations of a page: one query per relation for the
+        links of all its tasks, then the linked users/tags through the session's
+        loaders, so a user or tag shared by many tasks is fetched once.
+        """
+        task_ids = [t.id for t in tasks]
+        for name in include:
+            if name == "comments":
+                comments = await task_repo.comments_for(db, task_ids)
+                for t in tasks:
+                    t.comments = [CommentRead.model_validate(c, from_attributes=True) for c in comments.get(t.id, ())]
+                continue
+            repo, schema = (user_repo, UserRead) if name == "assignees" else (tag_repo, TagRead)
+            links = await task_repo.link_ids(db, task_ids, name)
+            linked_ids = sorted({i for ids in links.values() for i in ids})
+            loaded = await loader_for(db, repo).load_many(linked_ids)
+            by_id = {obj.id: schema.model_validate(obj, from_attributes=True) for obj in loaded if obj is not None}
+            for t in tasks:
+                setattr(t, name, [by_id[i] for i in links.get(t.id, ()) if i in by_id])
     
-    async def update_task(self, db: AsyncSession, task_id: int, patch: dict, expected_version: Optional[int] = None) -> Task:
+    async def export_project_tasks(self, db: AsyncSession, project_id: int) -> AsyncIterator[Sequence[Any]]:
+        """
+        404 unless the project exists, then an async iterator of row batches
+        (TASK_LIST_COLUMNS) streamed from a server-side cursor.
+        """
+        if await project_repo.get(db, project_id, columns=["id"]) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+        return task_repo.stream_for_project(db, project_id, TASK_LIST_COLUMNS)
+
+    async def import_project_tasks(
+        self, db: AsyncSession, project_id: int, creator_id: int, records: AsyncIterator[Tuple[int, Any]],
+    ) -> TaskImportReport:
+        """
+        Validate streamed `(row_number, record)` pairs against TaskCreate and load
+        the valid ones in batches of TASK_IMPORT_BATCH_SIZE (see TaskRepository.import_batch).
+        Records are raw JSON bytes (NDJSON) or dicts (CSV). Rows that fail validation
+        or reference unknown assignees/tags/parents are skipped and reported; the rest
+        are committed together at the end.
+        """
+        if await project_repo.get(db, project_id, columns=["id"]) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+
+        report = TaskImportReport(imported=0, failed=0)
+        batch: List[Tuple[int, TaskCreate]] = []
+        async for row, record in records:
+            try:
+                if isinstance(record, (bytes, str)):
+                    item = TaskCreate.model_validate_json(record)
+                else:
+                    item = TaskCreate.model_validate(record)
+            except ValidationError as e:
+                self._import_error(report, row, e.errors(include_url=False, include_context=False, include_input=False))
+                continue
+            batch.append((row, item))
+            if len(batch) >= settings.TASK_IMPORT_BATCH_SIZE:
+                await self._import_batch(db, project_id, creator_id, batch, report)
+                batch = []
+        if batch:
+            await self._import_batch(db, project_id, creator_id, batch, report)
+
+        if report.imported:
+            # one summary event rather than one per row
+            _emit(db, project_id, "task.imported", count=report.imported)
+        await db.commit()
+        return report
+
+    @staticmethod
+    def _import_error(report: TaskImportReport, row: int, errors: List[Dict[str, Any]]) -> None:
+        report.failed += 1
+        if len(report.errors) < settings.TASK_IMPORT_MAX_ERRORS:
+            report.errors.append(TaskImportError(row=row, errors=errors))
+
+    async def _import_batch(
+        self, db: AsyncSession, project_id: int, creator_id: int,
+        batch: List[Tuple[int, TaskCreate]], report: TaskImportReport,
+    ) -> None:
+        # one existence query per referenced table for the whole batch
+        users = await user_repo.existing_ids(db, {u for _, item in batch for u in item.assignee_ids or ()})
+        tags = await tag_repo.existing_ids(db, {t for _, item in batch for t in item.tag_ids or ()})
+        parents = await task_repo.existing_ids(db, {item.parent_task_id for _, item in batch if item.parent_task_id is not None})
+
+        rows, assignees, tag_ids = [], [], []
+        for row, item in batch:
+            item_assignees = list(dict.fromkeys(item.assignee_ids or ()))
+            item_tags = list(dict.fromkeys(item.tag_ids or ()))
+            problems = []
+            missing = [u for u in item_assignees if u not in users]
+            if missing:
+                problems.append({"loc": ["assignee_ids"], "msg": f"Assignees not found: {missing}", "type": "not_found"})
+            missing = [t for t in item_tags if t not in tags]
+            if missing:
+                problems.append({"loc": ["tag_ids"], "msg": f"Tags not found: {missing}", "type": "not_found"})
+            if item.parent_task_id is not None and item.parent_task_id not in parents:
+                problems.append({"loc": ["parent_task_id"], "msg": "Parent task not found", "type": "not_found"})
+            if problems:
+                self._import_error(report, row, problems)
+                continue
+
+            values = item.model_dump(include=set(TASK_IMPORT_FIELDS))
+            values.update({k: v for k, v in _IMPORT_DEFAULTS.items() if values[k] is None})
+            values["project_id"] = project_id
+            values["creator_id"] = creator_id
+            rows.append(values)
+            assignees.append(item_assignees)
+            tag_ids.append(item_tags)
+
+        ids = await task_repo.import_batch(db, rows, assignees, tag_ids, assigned_by=creator_id)
+        await activity_service.record(
+            db, [activity_entry(tid, project_id, creator_id, "created", {"source": "import"}) for tid in ids],
+        )
+        report.imported += len(rows)
+
+    async def update_task(self, db: AsyncSession, task_id: int, patch: dict, expected_version: Optional[int] = None,
+                          actor_id: Optional[int] = None) -> Task:
         """
         Update with optimistic locking. `expected_version` is required for concurrency safety.
+        Changed fields are logged as {field: [old, new]} (replaced assignee/tag sets as [null, ids]).
         """
         
         task = await task_repo.get(db, task_id)
         if not task:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
+        # assignee_ids / tag_ids replace the task's sets; everything else is a column
+        patch = dict(patch)
+        assignee_ids = patch.pop("assignee_ids", None)
+        tag_ids = patch.pop("tag_ids", None)
+        if assignee_ids is not None:
+            await self._check_exist(db, user_repo, assignee_ids, "Assignees")
+        if tag_ids is not None:
+            await self._check_exist(db, tag_repo, tag_ids, "Tags")
+        activity = self._update_activity(task, patch, assignee_ids, tag_ids, actor_id)
         
         if expected_version is not None:
             # attempt a conditional update
@@ -100,45 +344,143 @@ class TaskService:
             row = result.first()
             if not row:
                 raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Version conflict")
+            await self._apply_links(db, task_id, assignee_ids, tag_ids, assigned_by=actor_id)
+            publish_invalidation(db, "task", task_id)
+            _emit(db, task.project_id, "task.updated", task_id=task_id)
+            await activity_service.record(db, activity)
             await db.commit()
-            updated = row[0]
-            # SQLAlchemy may return a Row object — refresh to get ORM instance
-            await db.refresh(updated)
-            return updated
+            await task_cache.invalidate_after_commit(db, task_id)
+            return await self._reload(db, task_id)
         else:
              # fallback: naive update (no optimistic locking)
             for k, v in patch.items():
                 setattr(task, k, v)
+            # bump the version even without a precondition so ETags change
+            task.version = Task.version + 1
             db.add(task)
+            await self._apply_links(db, task_id, assignee_ids, tag_ids, assigned_by=actor_id)
+            publish_invalidation(db, "task", task_id)
+            _emit(db, task.project_id, "task.updated", task_id=task_id)
+            await activity_service.record(db, activity)
             await db.commit()
-            await db.refresh(task)
-            return task
+            await task_cache.invalidate_after_commit(db, task_id)
+            return await self._reload(db, task_id)
         
     async def assign_users(self, db: AsyncSession, task_id: int, user_ids: List[int], assigned_by: int) -> Task:
         """
-        Replace / add assignment rows for given user_ids. Does validation.
+        Make `user_ids` the task's assignees. Validates the users, then applies
+        only the difference (see TaskRepository.set_assignees).
         """
-        
-        # validate users
-        q = await db.execute(select(User).where(User.id.in_(user_ids)))
-        
-        users = q.scalars().all()
-        found_ids = {u.id for u in users}
-        missing = set(user_ids) - found_ids
-        if missing:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"User(s) not found: {missing}")
+        task = await task_repo.get(db, task_id)
+        if not task:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
-        # remove existing assignments for this task and add new ones (or you can add granular)
-        await db.execute(task_assignments.delete().where(task_assignments.c.task_id == task_id))
-        for uid in user_ids:
-            await db.execute(
-                task_assignments.insert().values(task_id=task_id, user_id=uid, assigned_by=assigned_by)
-            )
-            
-            
+        await self._check_exist(db, user_repo, user_ids, "User(s)")
+        await task_repo.set_assignees(db, [task_id], user_ids, assigned_by=assigned_by)
+        publish_invalidation(db, "task", task_id)
+        _emit(db, task.project_id, "task.assigned", task_id=task_id, user_ids=list(user_ids))
+        await activity_service.record(db, [activity_entry(task_id, task.project_id, assigned_by, "assigned", {"user_ids": list(user_ids)})])
         await db.commit()
-        await db.refresh(task)
-        return task
+        await task_cache.invalidate_after_commit(db, task_id)
+        return await self._reload(db, task_id)
+
+    async def assign_users_bulk(
+        self, db: AsyncSession, task_ids: List[int], user_ids: List[int], assigned_by: int, replace: bool = True,
+    ) -> None:
+        """
+        Give every task in `task_ids` the same assignees (replace=False only adds).
+        One DELETE and one INSERT for all tasks (per DB_BULK_CHUNK_SIZE rows).
+        """
+        projects = await task_repo.project_ids(db, task_ids)
+        missing = set(task_ids) - projects.keys()
+        if missing:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Tasks not found: {sorted(missing)}")
+        await self._check_exist(db, user_repo, user_ids, "User(s)")
+        await task_repo.set_assignees(db, task_ids, user_ids, assigned_by=assigned_by, replace=replace)
+        publish_invalidation(db, "task", *task_ids)
+        for task_id, project_id in projects.items():
+            _emit(db, project_id, "task.assigned", task_id=task_id, user_ids=list(user_ids), replace=replace)
+        changes = {"user_ids": list(user_ids), "replace": replace}
+        await activity_service.record(
+            db, [activity_entry(task_id, project_id, assigned_by, "assigned", changes) for task_id, project_id in projects.items()],
+        )
+        await db.commit()
+        await task_cache.invalidate_after_commit(db, *task_ids)
+
+    async def bulk_update_tasks(self, db: AsyncSession, rows: Sequence[dict], actor_id: Optional[int] = None) -> int:
+        """
+        Set columns on many tasks at once (dicts of "id" plus columns, see
+        BaseRepository.bulk_update). Versions are bumped and caches invalidated
+        like update_task; changes are logged as {field: [null, new]}. Returns rows updated.
+        """
+        task_ids = [row["id"] for row in rows]
+        projects = await task_repo.project_ids(db, task_ids)
+        missing = set(task_ids) - projects.keys()
+        if missing:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Tasks not found: {sorted(missing)}")
+        publish_invalidation(db, "task", *task_ids)
+        activity = []
+        for row in rows:
+            changes = {k: [None, v] for k, v in row.items() if k != "id"}
+            _emit(db, projects[row["id"]], "task.updated", task_id=row["id"])
+            action = "status_changed" if "status" in changes else "updated"
+            activity.append(activity_entry(row["id"], projects[row["id"]], actor_id, action, changes))
+        await activity_service.record(db, activity)
+        updated = await task_repo.bulk_update(db, rows)  # commits
+        await task_cache.invalidate_after_commit(db, *task_ids)
+        return updated
+
+    async def delete_task(self, db: AsyncSession, task_id: int, actor_id: Optional[int] = None,
+                          requester_id: Optional[int] = None) -> None:
+        """
+        Delete a task (hard delete; assignments, tags and comments cascade, its activity log stays).
+        With `requester_id`, only the task's creator or the project's owner may delete it.
+        """
+        task = await task_repo.get(db, task_id, columns=["project_id", "creator_id", "title"])
+        if task is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
+        if requester_id is not None and task.creator_id != requester_id:
+            project = await project_repo.get(db, task.project_id, columns=["owner_id"])
+            if project is None or project.owner_id != requester_id:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to delete task")
+        publish_invalidation(db, "task", task_id)
+        _emit(db, task.project_id, "task.deleted", task_id=task_id)
+        await activity_service.record(db, [activity_entry(task_id, task.project_id, actor_id, "deleted", {"title": task.title})])
+        await task_repo.delete(db, task_id)
+        await task_cache.invalidate_after_commit(db, task_id)
+
+    @staticmethod
+    def _update_activity(task: Task, patch: dict, assignee_ids: Optional[List[int]], tag_ids: Optional[List[int]],
+                         actor_id: Optional[int]) -> List[Dict[str, Any]]:
+        changes: Dict[str, Any] = diff_changes(task, patch)
+        if assignee_ids is not None:
+            changes["assignee_ids"] = [None, list(assignee_ids)]
+        if tag_ids is not None:
+            changes["tag_ids"] = [None, list(tag_ids)]
+        if not changes:
+            return []
+        action = "status_changed" if "status" in changes else "updated"
+        return [activity_entry(task.id, task.project_id, actor_id, action, changes)]
+
+    @staticmethod
+    async def _check_exist(db: AsyncSession, repo, ids: Sequence[int], label: str) -> None:
+        missing = set(ids) - await repo.existing_ids(db, ids)
+        if missing:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{label} not found: {missing}")
+
+    @staticmethod
+    async def _reload(db: AsyncSession, task_id: int) -> Task:
+        """The task as written, with its assignees and tags (relations are noload by default)."""
+        return await task_repo.reload(db, task_id, options=_include_options(WRITE_RESULT_INCLUDES))
+
+    @staticmethod
+    async def _apply_links(db: AsyncSession, task_id: int, assignee_ids: Optional[List[int]], tag_ids: Optional[List[int]],
+                           assigned_by: Optional[int] = None) -> None:
+        if assignee_ids is not None:
+            await task_repo.set_assignees(db, [task_id], assignee_ids, assigned_by=assigned_by)
+        if tag_ids is not None:
+            await task_repo.set_tags(db, [task_id], tag_ids)
     
     
 # singleton
@@ -5,7 +5,17 @@ from fastapi import HTTPException, status
 
 from app.repositories.user_repo import user_repo
 from app.models.user import User
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async, PasswordHashBusyError
+from app.core.cache import principal_cache
+from app.db.invalidation import on_invalidation, publish_invalidation
+
+def _hash_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server busy, try again",
+        headers={"Retry-After": "1"},
+    )
+
 
 class UserService:
     async def create_user(self, db:AsyncSession, email:str, password:str, name:Optional[str] = None)->User:
@@ -14,22 +24,57 @@ class UserService:
         if existing:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
         
-        hashed = get_password_hash(password)
+        try:
+            hashed = await get_password_hash_async(password)
+        except PasswordHashBusyError:
+            raise _hash_busy()
         user_obj = {"email":email, "password_hash":hashed, "name":name}
            # Use repository create which commits and refreshes
         created = await user_repo.create(db, user_obj)
         return created
     
     async def authenticate_user(self, db:AsyncSession, email:str, password:str)->Optional[User]:
-        user = await user.repo.get_by_email(db,email)
+        user = await user_repo.get_by_email(db,email)
         if not user:
             return None
-        if not verify_password(password, user.password_hash or ""):
+        try:
+            ok = await verify_password_async(password, user.password_hash or "")
+        except PasswordHashBusyError:
+            raise _hash_busy()
+        if not ok:
             return None
         return user
     
     async def get_by_id(self, db: AsyncSession, user_id: int) -> Optional[User]:
-        return await user_repo.get(db, user_id)       
+        return await user_repo.get(db, user_id)
+
+    async def update_user(self, db: AsyncSession, user_id: int, patch: dict) -> User:
+        publish_invalidation(db, "user", user_id)  # sent with the repository's commit
+        updated = await user_repo.update_by_id(db, user_id, patch)
+        if updated is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        self.invalidate_principal(user_id)
+        return updated
+
+    async def delete_user(self, db: AsyncSession, user_id: int) -> None:
+        publish_invalidation(db, "user", user_id)
+        await user_repo.delete_by_id(db, user_id)
+        self.invalidate_principal(user_id)
+
+    def invalidate_principal(self, user_id: int) -> None:
+        """Drop the cached principal for this user (tokens carry str(user.id) as sub)."""
+        principal_cache.pop(str(user_id))
     
     # singleton instance (optional)
-user_service = UserService()
\ No newline at end of file
+user_service = UserService()
+
+
+async def _evict_principals(ids) -> None:
+    # principals written by other workers (see app/db/invalidation.py)
+    if ids is None:
+        principal_cache.clear()
+    for user_id in ids or ():
+        principal_cache.pop(str(user_id))
+
+
+on_invalidation("user", _evict_principals)
\ No newline at end of file
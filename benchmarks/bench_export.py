@@ -0,0 +1,95 @@
+# benchmarks/bench_export.py
+"""
+Memory and time-to-first-byte of the streaming project export
+(GET /projects/{id}/tasks/export) as the project grows. Rows come from
+TaskRepository.stream_for_project and go through ndjson_stream / csv_stream,
+exactly as the route wires them; the body is consumed and discarded.
+
+    python -m benchmarks.bench_export [--sizes 10000,50000,200000]
+
+Uses a throwaway SQLite file in a temporary directory. Peak memory (tracemalloc)
+should stay flat across sizes, bounded by DB_STREAM_YIELD_PER rows.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+from sqlalchemy import BigInteger, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.api.export import csv_stream, ndjson_stream
+from app.db.base import Base
+from app.models import Project, Task, User
+from app.repositories.task_repo import task_repo
+from app.schemas.task import TaskRead
+from app.services.task_service import TASK_LIST_COLUMNS
+
+SEED_CHUNK = 5000
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    return "INTEGER"
+
+
+async def grow(sessions: async_sessionmaker, start: int, stop: int) -> None:
+    async with sessions() as db:
+        for first in range(start, stop, SEED_CHUNK):
+            rows = [
+                {"id": i, "project_id": 1, "creator_id": 1, "title": f"Task {i}", "description": "x" * 200,
+                 "status": "todo", "priority": 3, "position": i, "version": 1, "is_deleted": False}
+                for i in range(first + 1, min(first + SEED_CHUNK, stop) + 1)
+            ]
+            await db.execute(insert(Task), rows)
+        await db.commit()
+
+
+async def export(sessions: async_sessionmaker, fmt: str):
+    async with sessions() as db:
+        batches = task_repo.stream_for_project(db, 1, TASK_LIST_COLUMNS)
+        body = ndjson_stream(batches, TaskRead) if fmt == "ndjson" else csv_stream(batches, TASK_LIST_COLUMNS)
+        tracemalloc.start()
+        start = time.perf_counter()
+        first_byte, size = None, 0
+        async for chunk in body:
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            size += len(chunk)
+        total = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return first_byte, total, size, peak
+
+
+async def main(sizes: List[int]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'export.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as db:
+            db.add(User(id=1, email="bench@example.com"))
+            db.add(Project(id=1, name="bench", owner_id=1, visibility="private"))
+            await db.commit()
+
+        print(f"{'tasks':>8} {'format':<7} {'first byte ms':>14} {'total s':>8} {'MiB out':>8} {'peak KiB':>9}")
+        seeded = 0
+        for n in sorted(sizes):
+            await grow(sessions, seeded, n)
+            seeded = n
+            for fmt in ("ndjson", "csv"):
+                first_byte, total, size, peak = await export(sessions, fmt)
+                print(f"{n:>8} {fmt:<7} {first_byte * 1000:>14.1f} {total:>8.2f} {size / 2**20:>8.1f} {peak / 1024:>9.0f}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,50000,200000", help="comma-separated project sizes")
+    args = parser.parse_args()
+    asyncio.run(main([int(s) for s in args.sizes.split(",")]))
@@ -0,0 +1,47 @@
+# benchmarks/bench_jwt.py
+"""
+Per-request bearer token verification cost: python-jose's full decode (what
+decode_access_token did before), the HS256 fast path, and a token_cache hit.
+
+    python -m benchmarks.bench_jwt [--number 20000]
+"""
+import argparse
+import timeit
+
+from jose import jwt
+
+from app.core import security
+from app.core.config import settings
+
+
+def main(number: int) -> None:
+    token = security.create_access_token(42, role="member")
+    key = settings.SECRET_KEY
+    algorithm = security.ALGORITHM
+
+    def jose_decode():
+        return jwt.decode(token, key, algorithms=[algorithm])
+
+    def cold():
+        security.token_cache.clear()
+        return security.decode_access_token(token)
+
+    def cached():
+        return security.decode_access_token(token)
+
+    assert jose_decode() == cold() == cached()
+    cases = [("jose.decode", jose_decode), ("cache miss", cold), ("cache hit", cached)]
+    if security._hs256_mac is not None:
+        cases.insert(1, ("hs256 fast path", lambda: security._decode_hs256(token)))
+
+    print(f"{algorithm}, {number} decodes per case")
+    print(f"{'path':<16} {'us/decode':>10}")
+    for label, fn in cases:
+        best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        print(f"{label:<16} {best * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000)
+    main(parser.parse_args().number)
@@ -0,0 +1,65 @@
+# benchmarks/bench_password_hashing.py
+"""
+Event-loop latency during a burst of logins: bcrypt verification called inline
+(verify_password, as the login route did before) versus through the bounded
+hashing pool (verify_password_async).
+
+    python -m benchmarks.bench_password_hashing [--logins 32]
+
+A probe coroutine sleeps 1 ms in a loop while the logins run; its overshoot
+is the time every other request on the worker would have waited.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+from app.core.config import settings
+from app.core.security import get_password_hash, shutdown_hash_executor, verify_password, verify_password_async
+
+PROBE_INTERVAL = 0.001
+
+
+async def probe(stop: asyncio.Event, lags: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def burst(login: Callable[[], Awaitable[bool]], n: int) -> Tuple[float, List[float]]:
+    stop, lags = asyncio.Event(), []
+    task = asyncio.create_task(probe(stop, lags))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(n)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await task
+    return elapsed, lags
+
+
+async def main(logins: int) -> None:
+    hashed = get_password_hash("correct horse battery")
+
+    async def inline() -> bool:
+        return verify_password("correct horse battery", hashed)
+
+    async def pooled() -> bool:
+        return await verify_password_async("correct horse battery", hashed)
+
+    print(f"{logins} concurrent logins, {settings.PASSWORD_HASH_WORKERS} {settings.PASSWORD_HASH_EXECUTOR} workers")
+    print(f"{'path':<8} {'total ms':>9} {'loop lag p50 ms':>16} {'p99 ms':>8} {'max ms':>8}")
+    for label, login in (("inline", inline), ("pool", pooled)):
+        elapsed, lags = await burst(login, logins)
+        lags = sorted(lags) or [0.0]
+        p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+        print(f"{label:<8} {elapsed * 1000:>9.1f} {statistics.median(lags) * 1000:>16.2f} {p99 * 1000:>8.2f} {lags[-1] * 1000:>8.2f}")
+    shutdown_hash_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=32)
+    asyncio.run(main(parser.parse_args().logins))
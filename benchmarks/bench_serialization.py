@@ -0,0 +1,51 @@
+# benchmarks/bench_serialization.py
+"""
+Serialization benchmark: a page of tasks through FastAPI's response_model path
+(serialize_response + JSONResponse) versus the prebuilt serializers in
+app/api/serialization.py, for ORM rows and for projected TaskRead DTOs.
+
+    python -m benchmarks.bench_serialization [--tasks 500] [--runs 20]
+
+Prints the best and median time per page; no database is needed.
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from app.api.serialization import task_list_json
+from app.schemas.task import TaskRead
+from tests.test_serialization import fastapi_body, make_dto_tasks, make_orm_tasks
+
+
+def timed(fn: Callable[[], bytes], runs: int) -> List[float]:
+    fn()  # warm up (schema build, caches)
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=500, help="tasks per page")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.tasks} tasks per page, {args.runs} runs")
+    print(f"{'input':<6} {'path':<12} {'best ms':>9} {'median ms':>10}")
+    for label, make in (("orm", make_orm_tasks), ("dto", make_dto_tasks)):
+        page = make(args.tasks)
+        assert task_list_json.dump(page) == fastapi_body(List[TaskRead], page)
+        for path, fn in (
+            ("fastapi", lambda: fastapi_body(List[TaskRead], page)),
+            ("serializer", lambda: task_list_json.dump(page)),
+        ):
+            samples = timed(fn, args.runs)
+            print(f"{label:<6} {path:<12} {min(samples) * 1000:>9.2f} {statistics.median(samples) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
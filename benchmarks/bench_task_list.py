@@ -0,0 +1,105 @@
+# benchmarks/bench_task_list.py
+"""
+Cost of one GET /tasks page: full ORM rows (the previous read path) versus the
+column-projected rows TaskService.list_tasks_page builds DTOs from, each
+serialized with task_list_json. Runs against a throwaway in-memory SQLite
+database, so it measures the Python side (hydration, validation, JSON), not
+the database.
+
+    python -m benchmarks.bench_task_list [--tasks 5000] [--page 500] [--runs 20]
+
+Reports latency per page, the memory retained by the page's rows and DTOs
+(allocations and KiB, from tracemalloc) and the peak during the request.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Tuple
+
+from sqlalchemy import BigInteger, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.api.serialization import task_list_json
+from app.db.base import Base
+from app.models import Project, Task, User
+from app.repositories.task_repo import task_repo
+from app.services.task_service import task_service
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    return "INTEGER"
+
+
+async def seed(db: AsyncSession, n: int) -> None:
+    db.add(User(id=1, email="bench@example.com"))
+    db.add(Project(id=1, name="bench", owner_id=1, visibility="private"))
+    await db.flush()
+    rows = [
+        {"id": i, "project_id": 1, "creator_id": 1, "title": f"Task {i}", "description": "x" * 2000,
+         "status": "todo", "priority": 3, "position": i, "version": 1, "is_deleted": False}
+        for i in range(1, n + 1)
+    ]
+    await db.execute(insert(Task), rows)
+    await db.commit()
+
+
+async def orm_page(db: AsyncSession, limit: int):
+    rows, _ = await task_repo.list_keyset(db, limit=limit)
+    return rows, task_list_json.dump(rows)
+
+
+async def projected_page(db: AsyncSession, limit: int):
+    tasks, _ = await task_service.list_tasks_page(db, limit=limit, with_description=False)
+    return tasks, task_list_json.dump(tasks)
+
+
+async def measure(sessions: async_sessionmaker, page: Callable[[AsyncSession, int], Awaitable[Tuple]],
+                  limit: int, runs: int) -> Tuple[float, int, int, int]:
+    times = []
+    for _ in range(runs):
+        async with sessions() as db:
+            start = time.perf_counter()
+            await page(db, limit)
+            times.append(time.perf_counter() - start)
+
+    async with sessions() as db:
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        result = await page(db, limit)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        retained = after.compare_to(before, "filename")
+        blocks = sum(s.count_diff for s in retained)
+        size = sum(s.size_diff for s in retained)
+        del result
+    return statistics.median(times), blocks, size, peak
+
+
+async def main(n: int, limit: int, runs: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        await seed(db, n)
+
+    print(f"{limit}-task page out of {n}, median of {runs} runs")
+    print(f"{'path':<10} {'ms/page':>8} {'retained allocs':>16} {'retained KiB':>13} {'peak KiB':>9}")
+    for label, page in (("orm", orm_page), ("projected", projected_page)):
+        median, blocks, size, peak = await measure(sessions, page, limit, runs)
+        print(f"{label:<10} {median * 1000:>8.1f} {blocks:>16} {size / 1024:>13.0f} {peak / 1024:>9.0f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.page, args.runs))
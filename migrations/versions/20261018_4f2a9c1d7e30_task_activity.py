@@ -0,0 +1,52 @@
+"""task activity log, range-partitioned by month
+
+Revision ID: 4f2a9c1d7e30
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.db.partitions import add_months, create_partition_sql, month_start
+
+# revision identifiers, used by Alembic.
+revision: str = "4f2a9c1d7e30"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Partitioned parent, its indexes (inherited by every partition) and the first partitions."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence("task_activity_id_seq")))
+    op.create_table(
+        "task_activity",
+        sa.Column("id", sa.BigInteger(), nullable=False, server_default=sa.text("nextval('task_activity_id_seq')")),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("task_id", sa.BigInteger(), nullable=False),
+        sa.Column("project_id", sa.BigInteger(), nullable=False),
+        sa.Column("actor_id", sa.BigInteger(), nullable=True),
+        sa.Column("action", sa.Text(), nullable=False),
+        sa.Column("changes", postgresql.JSONB(), nullable=True),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute("ALTER SEQUENCE task_activity_id_seq OWNED BY task_activity.id")
+    op.create_index("ix_task_activity_task_id_created_at_id", "task_activity", ["task_id", "created_at", "id"])
+    op.create_index("ix_task_activity_project_id_created_at_id", "task_activity", ["project_id", "created_at", "id"])
+
+    # this month and the next few; ActivityMaintenance keeps extending the range
+    this_month = month_start(datetime.now(timezone.utc))
+    for n in range(settings.ACTIVITY_PARTITIONS_AHEAD + 1):
+        op.execute(create_partition_sql("task_activity", add_months(this_month, n)))
+
+
+def downgrade() -> None:
+    """Dropping the parent drops every partition and the owned sequence."""
+    op.drop_table("task_activity")
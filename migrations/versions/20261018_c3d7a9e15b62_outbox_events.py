@@ -0,0 +1,42 @@
+"""transactional outbox
+
+Revision ID: c3d7a9e15b62
+Revises: 8b1e5d3a2c47
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d7a9e15b62"
+down_revision: Union[str, Sequence[str], None] = "8b1e5d3a2c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """outbox_events (app/services/outbox.py) and the partial index its claim scan uses."""
+    op.create_table(
+        "outbox_events",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("topic", sa.Text(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("available_at", sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("attempts", sa.SmallInteger(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("dead_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_outbox_events_pending", "outbox_events", ["available_at", "id"],
+        postgresql_where=sa.text("dead_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("outbox_events")
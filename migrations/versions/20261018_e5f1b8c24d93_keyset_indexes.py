@@ -0,0 +1,40 @@
+"""keyset pagination indexes on tasks and projects
+
+Revision ID: e5f1b8c24d93
+Revises: c3d7a9e15b62
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f1b8c24d93"
+down_revision: Union[str, Sequence[str], None] = "c3d7a9e15b62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Built CONCURRENTLY so writes to these tables keep going on a live database;
+    that cannot run inside a transaction block, hence the autocommit block.
+    A failed concurrent build leaves an INVALID index that IF NOT EXISTS would
+    skip: drop it before running the upgrade again.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_created_at_id", "tasks", ["created_at", "id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_projects_owner_id_id", "projects", ["owner_id", "id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_projects_owner_id_id", table_name="projects", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_tasks_created_at_id", table_name="tasks", postgresql_concurrently=True, if_exists=True)
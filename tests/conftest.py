@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+
+# Settings are read at import time; nothing here connects, so any URL will do.
+os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://localhost/taskmgr_test")
+os.environ.setdefault("SECRET_KEY", "test-secret")
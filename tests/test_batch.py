@@ -0,0 +1,93 @@
+# tests/test_batch.py
+"""Each batch operation runs in its own savepoint inside one outer transaction."""
+import asyncio
+import os
+import tempfile
+
+from sqlalchemy import BigInteger, event, func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.core.config import settings
+from app.db import session as db_session
+from app.db.base import Base
+from app.models import Project, Task, User
+from app.schemas.batch import BatchOperation
+from app.schemas.user import Principal
+from app.services.batch_service import batch_service
+from app.services.read_cache import project_cache
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    return "INTEGER"
+
+
+OPERATIONS = [
+    BatchOperation(op="project.create", params={"name": "new"}),
+    # flushes the task row, then fails on the unknown assignee
+    BatchOperation(op="task.create", params={"project_id": 1, "title": "t", "assignee_ids": [99]}),
+    BatchOperation(op="project.update", params={"project_id": 1, "name": "renamed"}),
+]
+
+
+async def run_batch(monkeypatch, mode: str):
+    """Run OPERATIONS against a fresh SQLite database; returns (response, project names, task count, evictions)."""
+    monkeypatch.setattr(settings, "INVALIDATION_BUS", False)  # no pg_notify on SQLite
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'batch.db')}")
+
+        # pysqlite's own transaction handling hides SAVEPOINT; let SQLAlchemy emit BEGIN
+        @event.listens_for(engine.sync_engine, "connect")
+        def _connect(dbapi_conn, record):
+            dbapi_conn.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        monkeypatch.setattr(db_session, "engine", engine)
+        evictions = []
+
+        async def invalidate(*ids):
+            # record what another connection sees when the eviction runs
+            async with engine.connect() as conn:
+                name = await conn.scalar(select(Project.name).where(Project.id == ids[0]))
+            evictions.append((ids, name))
+
+        monkeypatch.setattr(project_cache, "invalidate", invalidate)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.execute(User.__table__.insert(), [{"id": 1, "email": "a@example.com"}])
+                await conn.execute(Project.__table__.insert(), [{"id": 1, "name": "p", "owner_id": 1}])
+            user = Principal(id=1, email="a@example.com", name=None)
+            response = await batch_service.run(user, OPERATIONS, mode=mode)
+            async with engine.connect() as conn:
+                names = (await conn.execute(select(Project.name).order_by(Project.id))).scalars().all()
+                tasks = await conn.scalar(select(func.count()).select_from(Task))
+            return response, names, tasks, evictions
+        finally:
+            await engine.dispose()
+
+
+def test_independent_mode_rolls_back_only_the_failed_operation(monkeypatch):
+    response, names, tasks, evictions = asyncio.run(run_batch(monkeypatch, "independent"))
+    assert response.committed
+    assert [r.status for r in response.results] == [201, 400, 200]
+    assert response.results[1].error == "Assignees not found: {99}"
+    assert names == ["renamed", "new"]
+    assert tasks == 0
+    # held until the outer commit, so the eviction already sees the new name
+    assert evictions == [((1,), "renamed")]
+
+
+def test_atomic_mode_commits_nothing(monkeypatch):
+    response, names, tasks, evictions = asyncio.run(run_batch(monkeypatch, "atomic"))
+    assert not response.committed
+    assert [(r.status, r.error) for r in response.results][1:] == [
+        (400, "Assignees not found: {99}"), (424, "Not run"),
+    ]
+    assert names == ["p"]
+    assert tasks == 0
+    assert evictions == []
@@ -0,0 +1,47 @@
+# tests/test_fields.py
+"""fields= sparse fieldsets: parsing, the SQL projection and the serialized payload."""
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.serialization import project_list_json, task_list_json
+from app.schemas.project import ProjectRead
+from app.schemas.task import TaskRead
+from app.services.project_service import parse_project_fields
+from app.services.task_service import TASK_LIST_COLUMNS, _task_list_columns, parse_task_fields
+
+
+def test_fields_always_include_id_and_keep_order():
+    assert parse_task_fields("title, status,due_at") == ["id", "title", "status", "due_at"]
+    assert parse_task_fields("status,id,status") == ["status", "id"]
+    assert parse_task_fields(None) is None
+    assert parse_task_fields("") is None
+
+
+def test_included_relations_are_part_of_the_fieldset():
+    assert parse_task_fields("title", include=["assignees", "tags"]) == ["id", "title", "assignees", "tags"]
+
+
+@pytest.mark.parametrize("parse, fields", [(parse_task_fields, "title,nope"), (parse_project_fields, "name,owner")])
+def test_unknown_fields_are_rejected(parse, fields):
+    with pytest.raises(HTTPException) as exc:
+        parse(fields)
+    assert exc.value.status_code == 400
+    assert "Unknown fields" in exc.value.detail
+
+
+def test_sql_projection_selects_only_requested_columns():
+    assert _task_list_columns(False, ["id", "title", "assignees"]) == ["id", "title"]
+    assert _task_list_columns(False, ["id", "description"]) == ["id", "description"]
+    assert "description" not in _task_list_columns(False)
+    assert _task_list_columns(True) == list(TASK_LIST_COLUMNS)
+
+
+def test_payload_contains_only_requested_fields():
+    task = TaskRead.model_construct(id=1, title="a", status="todo", due_at=None, description="long")
+    body = json.loads(task_list_json.dump([task], fields=parse_task_fields("title,status,due_at")))
+    assert body == [{"id": 1, "title": "a", "status": "todo", "due_at": None}]
+
+    project = ProjectRead.model_construct(id=3, name="p", owner_id=1, visibility="private", created_at=None, updated_at=None)
+    assert json.loads(project_list_json.dump([project], fields=parse_project_fields("name"))) == [{"id": 3, "name": "p"}]
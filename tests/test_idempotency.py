@@ -0,0 +1,118 @@
+# tests/test_idempotency.py
+"""
+Idempotency-Key across workers: two middleware instances, each with its own
+engine and IdempotencyStore (as two worker processes would have), share one
+idempotency_keys table in a throwaway SQLite file.
+"""
+import asyncio
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.idempotency import IdempotencyMiddleware, IdempotencyStore
+from app.core.security import create_access_token
+from app.models.idempotency import IdempotencyKey
+
+PATH = "/api/v1/tasks/"
+
+
+class CountingApp:
+    """Stand-in route: counts calls, answers with the call number after a short delay."""
+
+    def __init__(self, status: int = 201, delay: float = 0.2):
+        self.calls = 0
+        self.status = status
+        self.delay = delay
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        call = self.calls
+        await receive()
+        await asyncio.sleep(self.delay)
+        body = json.dumps({"call": call}).encode()
+        await send({"type": "http.response.start", "status": self.status,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
+
+
+async def post(app, key: str, body: bytes) -> Tuple[int, Dict[bytes, bytes], bytes]:
+    scope = {
+        "type": "http", "method": "POST", "path": PATH,
+        "headers": [(b"idempotency-key", key.encode()), (b"authorization", f"Bearer {create_access_token(7)}".encode())],
+    }
+    messages: List[Dict[str, Any]] = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start, *chunks = messages
+    return start["status"], dict(start["headers"]), b"".join(m.get("body", b"") for m in chunks)
+
+
+async def two_workers(route: CountingApp, scenario):
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'idem.db')}"
+        engines = [create_async_engine(url, connect_args={"timeout": 30}) for _ in range(2)]
+        async with engines[0].begin() as conn:
+            await conn.run_sync(IdempotencyKey.__table__.create)
+        workers = [
+            IdempotencyMiddleware(
+                route, paths=(PATH,),
+                store=IdempotencyStore(async_sessionmaker(e, expire_on_commit=False), ttl=60, lock=30, poll=0.02, purge_every=60),
+            )
+            for e in engines
+        ]
+        try:
+            return await scenario(*workers)
+        finally:
+            for e in engines:
+                await e.dispose()
+
+
+def test_concurrent_duplicates_on_two_workers_run_once():
+    route = CountingApp()
+
+    async def scenario(a, b):
+        return await asyncio.gather(post(a, "k1", b'{"title": "x"}'), post(b, "k1", b'{"title": "x"}'))
+
+    first, second = asyncio.run(two_workers(route, scenario))
+    assert route.calls == 1
+    assert first[0] == second[0] == 201
+    assert first[2] == second[2] == b'{"call": 1}'
+    assert sum(b"idempotent-replayed" in r[1] for r in (first, second)) == 1
+
+
+def test_replay_on_the_other_worker_and_body_mismatch():
+    route = CountingApp(delay=0)
+
+    async def scenario(a, b):
+        created = await post(a, "k2", b'{"title": "x"}')
+        replayed = await post(b, "k2", b'{"title": "x"}')
+        other_body = await post(b, "k2", b'{"title": "y"}')
+        return created, replayed, other_body
+
+    created, replayed, other_body = asyncio.run(two_workers(route, scenario))
+    assert route.calls == 1
+    assert replayed[0] == 201 and replayed[1][b"idempotent-replayed"] == b"true" and replayed[2] == created[2]
+    assert other_body[0] == 422
+
+
+@pytest.mark.parametrize("status", [500, 503])
+def test_server_errors_free_the_key(status):
+    route = CountingApp(status=status, delay=0)
+
+    async def scenario(a, b):
+        await post(a, "k3", b"{}")
+        return await post(b, "k3", b"{}")
+
+    retried = asyncio.run(two_workers(route, scenario))
+    assert route.calls == 2
+    assert b"idempotent-replayed" not in retried[1]
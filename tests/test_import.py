@@ -0,0 +1,159 @@
+# tests/test_import.py
+"""Streamed CSV parsing and the task import paths (INSERT on SQLite, COPY on asyncpg)."""
+import asyncio
+import os
+import tempfile
+
+from sqlalchemy import BigInteger, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.api.imports import csv_records
+from app.core.config import settings
+from app.db.base import Base
+from app.db.session import PrimarySession
+from app.models import Project, Tag, Task, User
+from app.models.task import task_assignments, task_tags
+from app.repositories.task_repo import task_repo
+from app.services import task_service as task_service_module
+from app.services.task_service import task_service
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    return "INTEGER"
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def parse(*parts: bytes, list_fields=("assignee_ids", "tag_ids")):
+    async def run():
+        return [item async for item in csv_records(_chunks(*parts), list_fields)]
+    return asyncio.run(run())
+
+
+def test_quoted_newline_split_across_chunks():
+    rows = parse(b'title,description\n"a","line one\nli', b'ne two"\nb,plain\n')
+    assert rows == [(1, {"title": "a", "description": "line one\nline two"}), (2, {"title": "b", "description": "plain"})]
+
+
+def test_bom_header_and_crlf():
+    rows = parse("\ufefftitle,priority\r\nx,2\r\n".encode("utf-8"))
+    assert rows == [(1, {"title": "x", "priority": "2"})]
+
+
+def test_trailing_record_without_newline():
+    rows = parse(b"title\nfirst\nsec", b"ond")
+    assert rows == [(1, {"title": "first"}), (2, {"title": "second"})]
+
+
+def test_empty_cells_are_omitted_and_lists_split():
+    rows = parse(b"title,status,assignee_ids,tag_ids\nx,,1;2;,\n\n")
+    assert rows == [(1, {"title": "x", "assignee_ids": ["1", "2"]})]
+
+
+async def run_import(monkeypatch, *parts: bytes, max_errors: int = 1000):
+    """Import CSV `parts` into project 1 of a fresh SQLite database; returns (report, tasks, assignments, tags)."""
+    monkeypatch.setattr(settings, "TASK_IMPORT_MAX_ERRORS", max_errors)
+    monkeypatch.setattr(settings, "TASK_IMPORT_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "INVALIDATION_BUS", False)  # no pg_notify on SQLite
+    activity = []
+
+    async def record(db, entries):
+        # task_activity's composite key has no SQLite autoincrement; the entries are enough here
+        activity.extend(entries)
+
+    monkeypatch.setattr(task_service_module.activity_service, "record", record)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'import.db')}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            sessions = async_sessionmaker(engine, sync_session_class=PrimarySession, expire_on_commit=False)
+            async with sessions() as db:
+                db.add_all([User(id=1, email="a@example.com"), User(id=2, email="b@example.com")])
+                db.add_all([Project(id=1, name="p", owner_id=1), Tag(id=7, name="t")])
+                await db.commit()
+                records = csv_records(_chunks(*parts), ("assignee_ids", "tag_ids"))
+                report = await task_service.import_project_tasks(db, 1, 1, records)
+                tasks = (await db.execute(select(Task.title, Task.status, Task.priority, Task.description)
+                                          .order_by(Task.id))).all()
+                assigned = (await db.execute(select(task_assignments.c.user_id).order_by(task_assignments.c.user_id))).scalars().all()
+                tagged = (await db.execute(select(task_tags.c.tag_id))).scalars().all()
+            assert len(activity) == report.imported
+            return report, tasks, assigned, tagged
+        finally:
+            await engine.dispose()
+
+
+def test_import_applies_defaults_and_links(monkeypatch):
+    report, tasks, assigned, tagged = asyncio.run(run_import(
+        monkeypatch,
+        b"title,status,priority,assignee_ids,tag_ids\n",
+        b"one,,,1;2,7\ntwo,done,1,,\nthree,,,2,\n",
+    ))
+    assert (report.imported, report.failed, report.errors) == (3, 0, [])
+    assert tasks == [("one", "todo", 3, ""), ("two", "done", 1, ""), ("three", "todo", 3, "")]
+    assert assigned == [1, 2, 2]
+    assert tagged == [7]
+
+
+def test_import_error_report_is_capped(monkeypatch):
+    body = b"title,priority,assignee_ids\n" + b"ok,1,\n" + b"bad,x,\n" * 3 + b"ghost,1,99\n"
+    report, tasks, _, _ = asyncio.run(run_import(monkeypatch, body, max_errors=2))
+    assert (report.imported, report.failed) == (1, 4)
+    assert [e.row for e in report.errors] == [2, 3]
+    assert tasks == [("ok", "todo", 1, "")]
+
+
+class _FakeResult:
+    def __init__(self, values):
+        self.values = values
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.values
+
+
+class _FakeAsyncpg:
+    """Just enough of AsyncSession / AsyncConnection / asyncpg.Connection for the COPY path."""
+
+    def __init__(self):
+        self.dialect = type("Dialect", (), {"driver": "asyncpg"})()
+        self.driver_connection = self
+        self.statements = []
+        self.copies = []
+
+    async def connection(self):
+        return self
+
+    async def get_raw_connection(self):
+        return self
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params))
+        return _FakeResult([101, 102, 103][: params["n"]])
+
+    async def copy_records_to_table(self, table, columns, records):
+        self.copies.append((table, columns, records))
+
+
+def test_import_batch_copies_with_reserved_ids():
+    db = _FakeAsyncpg()
+    rows = [{"title": "a", "project_id": 1}, {"title": "b", "project_id": 1}]
+    ids = asyncio.run(task_repo.import_batch(db, rows, [[5], []], [[], [8, 9]], assigned_by=5))
+
+    assert ids == [101, 102]
+    (sql, params), = db.statements
+    assert "nextval(pg_get_serial_sequence('tasks', 'id'))" in sql and "generate_series(1, :n)" in sql
+    assert params == {"n": 2}
+    assert db.copies == [
+        ("tasks", ["id", "title", "project_id"], [(101, "a", 1), (102, "b", 1)]),
+        ("task_assignments", ["task_id", "user_id", "assigned_by"], [(101, 5, 5)]),
+        ("task_tags", ["task_id", "tag_id"], [(102, 8), (102, 9)]),
+    ]
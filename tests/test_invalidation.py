@@ -0,0 +1,28 @@
+# tests/test_invalidation.py
+"""Queued notifications must survive DB_SESSION_MODE=statement's release commits."""
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.invalidation import publish_invalidation
+from app.db.session import PrimarySession, ShortLivedAsyncSession
+from app.services.change_feed import publish_change
+
+
+def test_release_commit_keeps_queued_notifications():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        try:
+            async with ShortLivedAsyncSession(bind=engine, sync_session_class=PrimarySession) as db:
+                publish_invalidation(db, "user", 7)
+                publish_change(db, 1, "project.updated")
+                await db.execute(select(1))  # read-only: the connection is released with a commit
+                return dict(db.info), db.in_transaction()
+        finally:
+            await engine.dispose()
+
+    info, in_transaction = asyncio.run(scenario())
+    assert not in_transaction
+    assert info["stale"] == {"user": {7}}
+    assert info["feed"]
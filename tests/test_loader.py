@@ -0,0 +1,81 @@
+# tests/test_loader.py
+"""RepositoryLoader: batching, memo clearing on write, cancelled callers."""
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy import BigInteger, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.models import User
+from app.repositories.loader import RepositoryLoader, loader_for
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    return "INTEGER"
+
+
+class FakeRepo:
+    """get_many() that records each batch and yields to the loop like a real query."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def get_many(self, db, ids):
+        self.batches.append(sorted(ids))
+        await asyncio.sleep(0)
+        return [SimpleNamespace(id=i) for i in ids if i != 404]
+
+
+def test_loads_in_the_same_tick_share_one_query():
+    async def scenario():
+        repo = FakeRepo()
+        loader = RepositoryLoader(repo, AsyncSession())
+        rows = await asyncio.gather(loader.load(1), loader.load(2), loader.load_many([2, 3, 404]))
+        again = await loader.load(3)  # memoized
+        return repo.batches, rows, again
+
+    batches, (one, two, many), again = asyncio.run(scenario())
+    assert batches == [[1, 2, 3, 404]]
+    assert (one.id, two.id, [r and r.id for r in many], again.id) == (1, 2, [2, 3, None], 3)
+
+
+def test_writes_clear_the_memo():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(User.__table__.create)
+        repo = FakeRepo()
+        try:
+            async with AsyncSession(engine) as db:
+                loader = loader_for(db, repo)
+                await loader.load(1)
+                await loader.load(1)
+                await db.execute(update(User).where(User.id == 1).values(name="x"))
+                await loader.load(1)
+                db.add(User(id=2, email="u2@example.com"))
+                await db.flush()
+                await loader.load(1)
+        finally:
+            await engine.dispose()
+        return repo.batches
+
+    assert asyncio.run(scenario()) == [[1], [1], [1]]
+
+
+def test_cancelled_caller_does_not_strand_other_waiters():
+    async def scenario():
+        repo = FakeRepo()
+        loader = RepositoryLoader(repo, AsyncSession())
+        first = asyncio.create_task(loader.load(1))
+        await asyncio.sleep(0)  # `first` queued id 1 and is waiting for the tick to end
+        first.cancel()
+        second = await asyncio.wait_for(loader.load(1), timeout=1)  # joined the abandoned batch
+        third = await asyncio.wait_for(loader.load(2), timeout=1)
+        return first, second, third, repo.batches
+
+    first, second, third, batches = asyncio.run(scenario())
+    assert first.cancelled()
+    assert second.id == 1 and third.id == 2
+    assert batches == [[1], [2]]
@@ -0,0 +1,65 @@
+# tests/test_outbox.py
+"""Writes must not depend on the outbox table unless the outbox is enabled."""
+import asyncio
+import os
+import tempfile
+
+from sqlalchemy import BigInteger, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.session import PrimarySession
+from app.models import OutboxEvent, Project, User
+from app.services import outbox
+from app.services.project_service import project_service
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    return "INTEGER"
+
+
+async def create_project(with_outbox_table: bool):
+    """Create a project in a fresh SQLite database; returns (project, outbox rows or None)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'outbox.db')}")
+        tables = [t for t in Base.metadata.sorted_tables if with_outbox_table or t.name != OutboxEvent.__tablename__]
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all, tables=tables)
+            sessions = async_sessionmaker(engine, sync_session_class=PrimarySession, expire_on_commit=False)
+            async with sessions() as db:
+                db.add(User(id=1, email="owner@example.com"))
+                await db.commit()
+                project = await project_service.create_project(db, owner_id=1, name="p")
+                rows = await db.scalar(select(func.count()).select_from(OutboxEvent)) if with_outbox_table else None
+            return project, rows
+        finally:
+            await engine.dispose()
+
+
+async def _handler(message):
+    pass
+
+
+def test_writes_skip_the_outbox_when_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_ENABLED", False)
+    monkeypatch.setattr(outbox, "_handlers", [("*", _handler)])
+    project, _ = asyncio.run(create_project(with_outbox_table=False))
+    assert isinstance(project, Project) and project.id is not None
+
+
+def test_no_rows_without_a_matching_handler(monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_ENABLED", True)
+    monkeypatch.setattr(outbox, "_handlers", [("task.*", _handler)])
+    _, rows = asyncio.run(create_project(with_outbox_table=True))
+    assert rows == 0
+
+
+def test_enabled_outbox_writes_with_the_change(monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_ENABLED", True)
+    monkeypatch.setattr(outbox, "_handlers", [("project.*", _handler)])
+    _, rows = asyncio.run(create_project(with_outbox_table=True))
+    assert rows == 1
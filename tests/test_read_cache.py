@@ -0,0 +1,69 @@
+# tests/test_read_cache.py
+"""EntityCache must not put back a row that predates the latest write."""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MemoryBackend
+from app.db.session import PrimarySession
+from app.schemas.task import TaskRead
+from app.services.read_cache import EntityCache, defer_invalidations, run_deferred_invalidations
+
+
+def task(version: int) -> TaskRead:
+    return TaskRead.model_construct(id=1, title="t", status="todo", priority=3, version=version)
+
+
+@pytest.fixture
+def cache():
+    cache = EntityCache("task", TaskRead, "version")
+    cache.backend = MemoryBackend(maxsize=10, ttl=60)
+    return cache
+
+
+primary = AsyncSession(sync_session_class=PrimarySession)
+replica = AsyncSession()
+
+
+def test_fill_after_invalidation_is_held_back(cache):
+    async def scenario():
+        await cache.set(task(1), primary)
+        await cache.invalidate(1)  # a write committed while a read of version 1 was in flight
+        returned = await cache.set(task(1), primary)
+        return returned, await cache.get(1)
+
+    returned, cached = asyncio.run(scenario())
+    assert returned.version == 1
+    assert cached is None
+
+
+def test_older_version_does_not_replace_newer(cache):
+    async def scenario():
+        await cache.set(task(3), primary)
+        await cache.set(task(2), primary)
+        return await cache.get(1)
+
+    assert asyncio.run(scenario()).version == 3
+
+
+def test_replica_reads_are_not_stored(cache):
+    async def scenario():
+        await cache.set(task(1), replica)
+        return await cache.get(1)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_batch_invalidations_wait_for_the_outer_commit(cache):
+    async def scenario():
+        db = AsyncSession(sync_session_class=PrimarySession)
+        await cache.set(task(1), db)
+        defer_invalidations(db)
+        await cache.invalidate_after_commit(db, 1)
+        before = await cache.get(1)
+        await run_deferred_invalidations(db)
+        return before, await cache.get(1)
+
+    before, after = asyncio.run(scenario())
+    assert before is not None and after is None
@@ -0,0 +1,54 @@
+# tests/test_security.py
+"""The HS256 fast path must accept exactly the tokens jose accepts."""
+import time
+
+import pytest
+from jose import JWTError, jwt
+
+from app.core import security
+from app.core.config import settings
+
+
+def claim_cases(now: int):
+    return [
+        {"sub": "1", "exp": now + 60},
+        {"sub": "1", "exp": now},  # jose only rejects exp < now
+        {"sub": "1", "exp": now - 1},
+        {"sub": "1", "exp": "soon"},
+        {"sub": "1", "exp": None},
+        {"sub": "1", "nbf": now},
+        {"sub": "1", "nbf": now + 1},
+        {"sub": "1", "iat": now},
+        {"sub": "1", "iat": "recently"},
+        {"sub": "1", "iat": [now]},
+        {"sub": 1},
+        {"sub": None},
+        {"jti": 7},
+        {"jti": "7"},
+        {"aud": "taskmgr"},
+        {"iss": "anyone"},
+        {"at_hash": "x"},
+        {},
+    ]
+
+
+def accepts(decode, token: str) -> bool:
+    try:
+        decode(token)
+        return True
+    except (JWTError, TypeError):  # jose lets int(None) / int([..]) raise TypeError
+        return False
+
+
+@pytest.mark.skipif(security._hs256_mac is None, reason="fast path is HS256 only")
+@pytest.mark.parametrize("index", range(len(claim_cases(0))))
+def test_fast_path_matches_jose(index):
+    for _ in range(3):  # retry if the clock ticks over a second mid-comparison
+        now = int(time.time())
+        claims = claim_cases(now)[index]
+        token = jwt.encode(claims, settings.SECRET_KEY, algorithm="HS256")
+        fast = accepts(security._decode_hs256, token)
+        reference = accepts(lambda t: jwt.decode(t, settings.SECRET_KEY, algorithms=["HS256"]), token)
+        if int(time.time()) == now:
+            break
+    assert fast == reference, claims
@@ -0,0 +1,87 @@
+# tests/test_serialization.py
+"""
+The prebuilt serializers in app/api/serialization.py must write exactly the
+bytes the routes produced before: pydantic's model_dump_json() and FastAPI's
+response_model path (serialize_response + JSONResponse).
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, List
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.serialization import project_json, task_json, task_list_json, user_json
+from app.models import Comment, Project, Tag, Task, User
+from app.schemas.project import ProjectRead
+from app.schemas.task import TaskRead
+from app.schemas.user import UserRead
+
+T0 = datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=timezone.utc)
+CET = timezone(timedelta(hours=2))
+
+
+def make_orm_tasks(n: int) -> List[Task]:
+    """Transient ORM tasks with nested assignees, tags and comments (no session needed)."""
+    users = [User(id=i, email=f"user{i}@example.com", name=None if i % 2 else f"Zoë {i}", timezone="Europe/Berlin",
+                  created_at=T0, updated_at=T0) for i in range(1, 4)]
+    tag = Tag(id=1, name="urgent ✓", created_at=T0)
+    tasks = []
+    for i in range(1, n + 1):
+        task = Task(
+            id=i, project_id=1, creator_id=1, title=f"Task {i} — “quoted” \\ ünïcode", description="line\nbreak\t" * (i % 3),
+            status="todo" if i % 2 else "done", priority=i % 5, due_at=T0 + timedelta(days=i) if i % 3 else None,
+            start_at=T0.astimezone(CET), estimated_minutes=None if i % 4 else 90, parent_task_id=None, position=i,
+            version=1, is_deleted=False, created_at=T0, updated_at=T0,
+        )
+        task.assignees = users[: i % 4]
+        task.tags = [tag] if i % 2 else []
+        task.comments = [Comment(id=i, task_id=i, user_id=1, body="<b>hi</b> \U0001F600", created_at=T0, edited_at=None)]
+        tasks.append(task)
+    return tasks
+
+
+def make_dto_tasks(n: int) -> List[TaskRead]:
+    """The same tasks as read DTOs, as the projected list path builds them."""
+    return [TaskRead.model_validate(t, from_attributes=True) for t in make_orm_tasks(n)]
+
+
+def fastapi_body(tp: Any, content: Any) -> bytes:
+    """What a route with response_model=tp returned before the serializers existed."""
+    field = create_model_field(name="Response", type_=tp, mode="serialization")
+    value = asyncio.run(serialize_response(field=field, response_content=content))
+    return JSONResponse(value).body
+
+
+@pytest.mark.parametrize("make", [make_orm_tasks, make_dto_tasks], ids=["orm", "dto"])
+def test_task_list_matches_previous_output(make):
+    tasks = make(12)
+    body = task_list_json.dump(tasks)
+    assert body == fastapi_body(List[TaskRead], make(12))
+    dtos = [TaskRead.model_validate(t, from_attributes=True) for t in make(12)]
+    assert body == b"[" + b",".join(t.model_dump_json().encode() for t in dtos) + b"]"
+
+
+@pytest.mark.parametrize("make", [make_orm_tasks, make_dto_tasks], ids=["orm", "dto"])
+def test_single_task_matches_previous_output(make):
+    task = make(3)[2]
+    assert task_json.dump(task) == TaskRead.model_validate(task, from_attributes=True).model_dump_json().encode()
+    assert task_json.dump(task) == fastapi_body(TaskRead, task)
+
+
+def test_sparse_fieldset_matches_model_dump_json():
+    fields = ["id", "title", "due_at", "assignees"]
+    tasks = make_dto_tasks(5)
+    expected = b"[" + b",".join(t.model_dump_json(include=set(fields)).encode() for t in tasks) + b"]"
+    assert task_list_json.dump(tasks, fields=fields) == expected
+    assert task_json.dump(tasks[0], fields=fields) == tasks[0].model_dump_json(include=set(fields)).encode()
+
+
+def test_project_and_user_match_previous_output():
+    project = Project(id=7, name="Ünïcode “project”", owner_id=1, visibility="private", created_at=T0, updated_at=None)
+    user = User(id=1, email="a@example.com", name="Zoë", timezone="UTC", created_at=T0, updated_at=T0.astimezone(CET))
+    assert project_json.dump(project) == fastapi_body(ProjectRead, project)
+    assert project_json.dump(project) == ProjectRead.model_validate(project, from_attributes=True).model_dump_json().encode()
+    assert user_json.dump(user) == fastapi_body(UserRead, user)